@@ -0,0 +1,80 @@
+"""Measure the effect of the boolean options on generating bins and baseplates.
+
+Bins and baseplates are generated at grid sizes from 1x1 up to 20x20 with every fuzzy value of the
+matrix. The generation time is reported relative to the first fuzzy value, exact boolean operations
+by default, together with the face count and validity of the shape, so a fuzzy value that changes
+the result shows up. The parallel mode and the glue option can't be set from Python, see the
+`booleans` module, so the matrix only covers the fuzzy value.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_booleans.py [--sizes 1 2 5 10 20] [--fuzzy-values 0 1e-5 1e-3]
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import time
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import features, preferences
+
+OBJECTS = {
+    "PartsBin": features.PartsBin,
+    "EcoBin": features.EcoBin,
+    "Baseplate": features.Baseplate,
+    "MagnetBaseplate": features.MagnetBaseplate,
+}
+
+
+def _measure(feature: type, size: int) -> tuple[float, int, bool]:
+    doc = fc.newDocument("GridfinityBenchmark")
+    obj = doc.addObject("Part::FeaturePython", "Object")
+    feature(obj)
+    obj.xGridUnits = size
+    obj.yGridUnits = size
+
+    start = time.perf_counter()
+    doc.recompute()
+    seconds = time.perf_counter() - start
+
+    faces = len(obj.Shape.Faces)
+    valid = obj.Shape.isValid()
+    fc.closeDocument(doc.Name)
+    return seconds, faces, valid
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 2, 5, 10, 20])
+    parser.add_argument("--fuzzy-values", type=float, nargs="+", default=[0, 1e-5, 1e-3])
+    args = parser.parse_args()
+
+    params = preferences.parameters()
+    guard = params.GetString("ComplexityGuard", preferences.DEFAULT_COMPLEXITY_GUARD)
+    fuzzy_value = params.GetFloat("BooleanFuzzyValue", 0.0)
+    params.SetString("ComplexityGuard", "Off")
+    try:
+        for name, feature in OBJECTS.items():
+            print(f"{name}:")
+            for size in args.sizes:
+                exact = None
+                for value in args.fuzzy_values:
+                    params.SetFloat("BooleanFuzzyValue", value)
+                    seconds, faces, valid = _measure(feature, size)
+                    exact = exact or seconds
+                    print(
+                        f"    {size:2}x{size:<2} fuzzy {value:7.0e} mm: {seconds:7.2f} s "
+                        f"({seconds / exact:4.2f}x), {faces:6} faces, "
+                        f"{'valid' if valid else 'INVALID'}",
+                    )
+    finally:
+        params.SetString("ComplexityGuard", guard)
+        params.SetFloat("BooleanFuzzyValue", fuzzy_value)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Compare the compartment fillets built from 2D profiles with fillets built by OCCT.
+
+Storage bins and eco bins are generated with 1, 3x3 and 8x8 compartments, once with the current
+compartment construction and once with the previous one:
+
+- the bottom edges of a bin without dividers filleted with `makeFillet`,
+- the corner fillets of the compartments extruded one by one, fused and copied per compartment.
+
+The generation time of both is reported together with the difference in volume, which should be
+zero up to the precision of the boolean operations.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_compartments.py [--size 4] [--repeat 3]
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import contextlib
+import math
+import time
+from collections.abc import Iterator
+from unittest import mock
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from freecad.gridfinity_workbench import (
+    booleans,
+    edge_index,
+    feature_construction,
+    features,
+    preferences,
+    utils,
+)
+
+OBJECTS = {
+    "StorageBin": features.StorageBin,
+    "EcoBin": features.EcoBin,
+}
+COMPARTMENTS = (1, 3, 8)
+
+
+def _fillet_bottom_edges(obj: fc.DocumentObject, func_fuse: Part.Shape) -> Part.Shape:
+    b_edges = edge_index.of(func_fuse).below(0)
+    return func_fuse.makeFillet(obj.InsideFilletRadius, b_edges)
+
+
+def _fuse_corner_fillets(
+    obj: fc.DocumentObject,
+    xcomp_width: float,
+    ycomp_width: float,
+) -> Part.Shape:
+    def make_fillet(rotation: float, translation: fc.Vector) -> Part.Shape:
+        radius = obj.InsideFilletRadius
+        arc = radius - radius * math.sin(math.pi / 4)
+        v1 = fc.Vector(0, 0)
+        v2 = fc.Vector(0, radius)
+        v_arc = fc.Vector(arc, arc)
+        v3 = fc.Vector(radius, 0)
+        face = utils.curve_to_face(
+            [Part.LineSegment(v1, v2), Part.Arc(v2, v_arc, v3), Part.LineSegment(v3, v1)],
+        )
+        face.rotate(fc.Vector(0, 0, 0), fc.Vector(0, 0, 1), rotation)
+        face.translate(translation)
+        return face.extrude(fc.Vector(0, 0, -obj.TotalHeight))
+
+    x = obj.Clearance + obj.WallThickness
+    y = obj.Clearance + obj.WallThickness
+    z = -obj.LabelShelfStackingOffset if obj.StackingLip else 0
+    fillets = [
+        make_fillet(90, fc.Vector(x + xcomp_width, y, z)),
+        make_fillet(180, fc.Vector(x + xcomp_width, y + ycomp_width, z)),
+        make_fillet(270, fc.Vector(x, y + ycomp_width, z)),
+        make_fillet(0, fc.Vector(x, y, z)),
+    ]
+    vec_list = [
+        fc.Vector(
+            i * (xcomp_width + obj.DividerThickness),
+            j * (ycomp_width + obj.DividerThickness),
+        )
+        for i in range(obj.xDividers + 1)
+        for j in range(obj.yDividers + 1)
+    ]
+    return utils.copy_and_translate(booleans.multi_fuse(fillets[0], fillets[1:]), vec_list)
+
+
+@contextlib.contextmanager
+def _previous_construction() -> Iterator[None]:
+    with (
+        mock.patch.object(
+            feature_construction,
+            "_make_compartments_no_deviders",
+            _fillet_bottom_edges,
+        ),
+        mock.patch.object(feature_construction, "_corner_fillets", _fuse_corner_fillets),
+    ):
+        yield
+
+
+def _measure(feature: type, size: int, compartments: int, repeat: int) -> tuple[float, float]:
+    doc = fc.newDocument("GridfinityBenchmark")
+    obj = doc.addObject("Part::FeaturePython", "Object")
+    feature(obj)
+    obj.xGridUnits = size
+    obj.yGridUnits = size
+    obj.xDividers = compartments - 1
+    obj.yDividers = compartments - 1
+
+    best = math.inf
+    for _ in range(repeat):
+        obj.touch()
+        start = time.perf_counter()
+        doc.recompute()
+        best = min(best, time.perf_counter() - start)
+
+    volume = obj.Shape.Volume
+    fc.closeDocument(doc.Name)
+    return best, volume
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=4, help="grid units in x and y")
+    parser.add_argument("--repeat", type=int, default=3, help="recomputes, the fastest counts")
+    args = parser.parse_args()
+
+    params = preferences.parameters()
+    guard = params.GetString("ComplexityGuard", preferences.DEFAULT_COMPLEXITY_GUARD)
+    params.SetString("ComplexityGuard", "Off")
+    try:
+        for name, feature in OBJECTS.items():
+            print(f"{name} {args.size}x{args.size}:")
+            for compartments in COMPARTMENTS:
+                with _previous_construction():
+                    before, before_volume = _measure(feature, args.size, compartments, args.repeat)
+                after, volume = _measure(feature, args.size, compartments, args.repeat)
+                print(
+                    f"    {compartments}x{compartments} compartments: "
+                    f"{before:6.2f} s -> {after:6.2f} s ({before / after:4.2f}x), "
+                    f"volume difference {volume - before_volume:+.2e} mm^3",
+                )
+    finally:
+        params.SetString("ComplexityGuard", guard)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Fit the cost models of the complexity estimator to measured generation times.
+
+Objects of every type in `complexity.COST_MODELS` are generated at increasing grid sizes. For each
+type the runtime model of `complexity.CostModel` is fitted to the measurements and printed as a
+table entry, next to the current estimate, so `complexity.COST_MODELS` can be updated. With
+`--output` the measurements are written to a JSON file as well, to be committed together with the
+fitted coefficients.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_complexity.py [--max-size 8] [--output measurements.json]
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import json
+import math
+import platform
+import time
+from pathlib import Path
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import complexity, features, preferences
+
+OBJECT_TYPES = {
+    "FullBin": features.BinBlank,
+    "StorageBin": features.PartsBin,
+    "EcoBin": features.EcoBin,
+    "Baseplate": features.Baseplate,
+    "MagnetBaseplate": features.MagnetBaseplate,
+    "ScrewTogetherBaseplate": features.ScrewTogetherBaseplate,
+}
+
+
+def _measure(feature: type, size: int) -> tuple[complexity.Estimate, float, int, int]:
+    doc = fc.newDocument("GridfinityBenchmark")
+    obj = doc.addObject("Part::FeaturePython", "Object")
+    feature(obj)
+    obj.xGridUnits = size
+    obj.yGridUnits = size
+    estimate = complexity.estimate(obj)
+
+    start = time.perf_counter()
+    doc.recompute()
+    seconds = time.perf_counter() - start
+
+    faces = len(obj.Shape.Faces)
+    brep_bytes = len(obj.Shape.exportBrepToString())
+    fc.closeDocument(doc.Name)
+    return estimate, seconds, faces, brep_bytes
+
+
+def _fit(points: list[tuple[int, float]]) -> tuple[float, float, float]:
+    """Fit `t = base + k * n ** e` by linear regression in log space over a range of bases."""
+    best = (math.inf, 0.0, 0.0, 0.0)
+    min_time = min(t for _, t in points)
+    for step in range(20):
+        base = min_time * step / 20
+        xs = [math.log(n) for n, _ in points]
+        ys = [math.log(t - base) for _, t in points]
+        x_mean = sum(xs) / len(xs)
+        y_mean = sum(ys) / len(ys)
+        sxx = sum((x - x_mean) ** 2 for x in xs)
+        exponent = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / sxx
+        log_k = y_mean - exponent * x_mean
+        error = sum((y - log_k - exponent * x) ** 2 for x, y in zip(xs, ys))
+        if error < best[0]:
+            best = (error, base, math.exp(log_k), exponent)
+    return best[1:]
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-size", type=int, default=8, help="largest grid size, in units")
+    parser.add_argument("--output", type=Path, help="write the measurements to this JSON file")
+    args = parser.parse_args()
+
+    measurements: dict[str, list[dict[str, float]]] = {}
+
+    params = preferences.parameters()
+    guard = params.GetString("ComplexityGuard", preferences.DEFAULT_COMPLEXITY_GUARD)
+    params.SetString("ComplexityGuard", "Off")
+    try:
+        for name, feature in OBJECT_TYPES.items():
+            points = []
+            faces_per_cell = []
+            bytes_per_face = []
+            print(f"{name}:")
+            rows = measurements[name] = []
+            for size in range(1, args.max_size + 1):
+                estimate, seconds, faces, brep_bytes = _measure(feature, size)
+                rows.append(
+                    {
+                        "size": size,
+                        "boolean_inputs": estimate.boolean_inputs,
+                        "cells": estimate.cells,
+                        "seconds": seconds,
+                        "faces": faces,
+                        "brep_bytes": brep_bytes,
+                    },
+                )
+                points.append((estimate.boolean_inputs, seconds))
+                faces_per_cell.append(faces / estimate.cells)
+                bytes_per_face.append(brep_bytes / faces)
+                print(
+                    f"    {size}x{size}: {seconds:7.2f} s (estimated {estimate.seconds:7.2f} s), "
+                    f"{faces:6} faces (estimated {estimate.faces:6})",
+                )
+
+            base, k, exponent = _fit(points)
+            print(
+                f'    "{name}": CostModel({base:.2g}, {k:.2g}, {exponent:.3g}, '
+                f"{faces_per_cell[-1]:.0f}, {sum(bytes_per_face) / len(bytes_per_face):.2g}),",
+            )
+    finally:
+        params.SetString("ComplexityGuard", guard)
+
+    if args.output is not None:
+        data = {
+            "machine": platform.platform(),
+            "processor": platform.processor(),
+            "freecad": ".".join(fc.Version()[:3]),
+            "measurements": measurements,
+        }
+        args.output.write_text(json.dumps(data, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Compare generating a bin at many heights one by one and as a height family.
+
+Every bin type supported by `height_family` is generated at each height, once by recomputing an
+object per height and once with `height_family.generate`. Both times are reported together with
+the largest volume difference between the two shapes of a height.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_height_family.py [--size 2] [--heights 2 3 4 5 6 7 8 9 10 11 12]
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import time
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import features, height_family, preferences
+
+OBJECTS = {
+    "BinBlank": features.BinBlank,
+    "PartsBin": features.PartsBin,
+    "EcoBin": features.EcoBin,
+}
+
+
+def _create(doc: fc.Document, feature: type, size: int) -> fc.DocumentObject:
+    obj = doc.addObject("Part::FeaturePython", "Object")
+    feature(obj)
+    obj.xGridUnits = size
+    obj.yGridUnits = size
+    return obj
+
+
+def _one_by_one(feature: type, size: int, heights: list[int]) -> tuple[float, dict[int, float]]:
+    doc = fc.newDocument("GridfinityBenchmark")
+    objects = {}
+    for height in heights:
+        objects[height] = _create(doc, feature, size)
+        objects[height].HeightUnits = height
+
+    start = time.perf_counter()
+    doc.recompute()
+    seconds = time.perf_counter() - start
+
+    volumes = {height: obj.Shape.Volume for height, obj in objects.items()}
+    fc.closeDocument(doc.Name)
+    return seconds, volumes
+
+
+def _family(feature: type, size: int, heights: list[int]) -> tuple[float, dict[int, float]]:
+    doc = fc.newDocument("GridfinityBenchmark")
+    obj = _create(doc, feature, size)
+    doc.recompute()
+
+    start = time.perf_counter()
+    shapes = height_family.generate(obj, heights)
+    seconds = time.perf_counter() - start
+
+    volumes = {height: shape.Volume for height, shape in shapes.items()}
+    fc.closeDocument(doc.Name)
+    return seconds, volumes
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2)
+    parser.add_argument("--heights", type=int, nargs="+", default=list(range(2, 13)))
+    args = parser.parse_args()
+
+    params = preferences.parameters()
+    guard = params.GetString("ComplexityGuard", preferences.DEFAULT_COMPLEXITY_GUARD)
+    params.SetString("ComplexityGuard", "Off")
+    try:
+        for name, feature in OBJECTS.items():
+            single, expected = _one_by_one(feature, args.size, args.heights)
+            family, volumes = _family(feature, args.size, args.heights)
+            difference = max(abs(volumes[height] - expected[height]) for height in expected)
+            print(
+                f"{name} {args.size}x{args.size}, {len(args.heights)} heights: "
+                f"{single:6.2f} s one by one, {family:6.2f} s as a family "
+                f"({single / family:4.1f}x), volume difference {difference:.2e} mm^3",
+            )
+    finally:
+        params.SetString("ComplexityGuard", guard)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Measure bulk creation of Gridfinity objects from the property schema tables.
+
+A batch of PartsBin objects is created without recomputing them, so only the property setup is
+timed. For comparison the same properties are added one by one, the way the feature construction
+functions did before the schema tables, calling `addProperty`, assigning the value and setting the
+expression separately for every property.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_object_creation.py [--objects 500]
+
+To compare with an older release, run the same command in a checkout of that release, where only
+the first line of the report is available.
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import time
+from collections.abc import Iterable
+from unittest import mock
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import features, property_schema
+from freecad.gridfinity_workbench.property_schema import PropertySpec
+
+
+def _add_properties_one_by_one(
+    obj: fc.DocumentObject,
+    specs: Iterable[PropertySpec],
+    **overrides: object,
+) -> None:
+    added = [spec for spec in specs if not hasattr(obj, spec.name)]
+    for spec in added:
+        obj.addProperty(
+            spec.type,
+            spec.name,
+            spec.group,
+            spec.doc,
+            read_only=spec.read_only,
+            hidden=spec.hidden,
+        )
+        if spec.default is not None:
+            setattr(obj, spec.name, spec.default)
+        if spec.name in overrides:
+            setattr(obj, spec.name, overrides[spec.name])
+    for spec in added:
+        if spec.expression is not None:
+            obj.setExpression(spec.name, spec.expression)
+
+
+def _create(n_objects: int) -> float:
+    doc = fc.newDocument("GridfinityBenchmark")
+    start = time.perf_counter()
+    for i in range(n_objects):
+        obj = doc.addObject("Part::FeaturePython", f"Bin{i}")
+        features.PartsBin(obj)
+    elapsed = time.perf_counter() - start
+    fc.closeDocument(doc.Name)
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=500, help="objects to create")
+    args = parser.parse_args()
+
+    doc = fc.newDocument("GridfinityBenchmark")
+    obj = doc.addObject("Part::FeaturePython", "Bin")
+    features.PartsBin(obj)
+    print(f"{len(obj.PropertiesList)} properties per PartsBin")
+    fc.closeDocument(doc.Name)
+
+    schema = _create(args.objects)
+    print(f"schema tables: {schema:6.2f} s, {args.objects / schema:8.1f} objects/s")
+
+    with mock.patch.object(property_schema, "add_properties", _add_properties_one_by_one):
+        one_by_one = _create(args.objects)
+    print(f"one by one:    {one_by_one:6.2f} s, {args.objects / one_by_one:8.1f} objects/s")
+
+
+if __name__ == "__main__":
+    main()
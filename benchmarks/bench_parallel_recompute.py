@@ -0,0 +1,69 @@
+"""Compare the serial and the parallel recompute of a drawer document with many bins.
+
+A document with storage bins of different sizes is recomputed once as usual and once with
+`recompute.parallel_recompute`, for every number of worker processes. The wall clock time of each
+recompute is reported, the parallel time includes starting the worker processes.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_parallel_recompute.py [--bins 80] [--workers 2 4 8]
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import functools
+import time
+from collections.abc import Callable
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import features, preferences, recompute
+
+
+def _document(bins: int) -> fc.Document:
+    # new objects are left touched, they are generated by the measured recompute
+    doc = fc.newDocument("GridfinityBenchmark")
+    for i in range(bins):
+        obj = doc.addObject("Part::FeaturePython", f"Bin{i}")
+        features.PartsBin(obj)
+        obj.xGridUnits = 1 + i % 3
+        obj.yGridUnits = 1 + i // 3 % 3
+        obj.xDividers = i % 2
+    return doc
+
+
+def _measure(bins: int, recompute_document: Callable[[fc.Document], object]) -> float:
+    doc = _document(bins)
+    try:
+        start = time.perf_counter()
+        recompute_document(doc)
+        return time.perf_counter() - start
+    finally:
+        fc.closeDocument(doc.Name)
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bins", type=int, default=80)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8])
+    args = parser.parse_args()
+
+    params = preferences.parameters()
+    guard = params.GetString("ComplexityGuard", preferences.DEFAULT_COMPLEXITY_GUARD)
+    params.SetString("ComplexityGuard", "Off")
+    try:
+        serial = _measure(args.bins, lambda doc: doc.recompute())
+        print(f"{args.bins} bins, serial recompute: {serial:7.2f} s")
+        for workers in args.workers:
+            parallel = functools.partial(recompute.parallel_recompute, workers=workers)
+            seconds = _measure(args.bins, parallel)
+            print(f"    {workers:3} workers: {seconds:7.2f} s ({serial / seconds:4.2f}x)")
+    finally:
+        params.SetString("ComplexityGuard", guard)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare the shape cache file formats.
+
+Shapes of a few Gridfinity objects are written and read back as text BREP, the format of older
+versions of the shape cache, and as binary BREP, the current format. File size and read and write
+throughput are reported, together with the time to read only the metadata of a cached shape.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_shape_cache_format.py [--repeat 5]
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from unittest import mock
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from freecad.gridfinity_workbench import features, shape_cache
+
+OBJECTS = [
+    ("3x3 parts bin", features.PartsBin, 3, 3),
+    ("6x6 magnet baseplate", features.MagnetBaseplate, 6, 6),
+]
+
+
+def _shape(feature: type, x_units: int, y_units: int) -> Part.Shape:
+    doc = fc.newDocument("GridfinityBenchmark")
+    obj = doc.addObject("Part::FeaturePython", "Object")
+    feature(obj)
+    obj.xGridUnits = x_units
+    obj.yGridUnits = y_units
+    doc.recompute()
+    shape = obj.Shape.copy()
+    fc.closeDocument(doc.Name)
+    return shape
+
+
+def _timed(func: Callable[[], object], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def _read(path: Path, *, binary: bool) -> Part.Shape:
+    shape = Part.Shape()
+    if binary:
+        shape.importBinary(str(path))
+    else:
+        shape.importBrep(str(path))
+    return shape
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions of each measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        text = directory / "shape.brep"
+        binary = directory / "shape.bbrep"
+        for description, feature, x_units, y_units in OBJECTS:
+            shape = _shape(feature, x_units, y_units)
+
+            write_text = _timed(partial(shape.exportBrep, str(text)), args.repeat)
+            write_binary = _timed(partial(shape.exportBinary, str(binary)), args.repeat)
+            read_text = _timed(partial(_read, text, binary=False), args.repeat)
+            read_binary = _timed(partial(_read, binary, binary=True), args.repeat)
+
+            with mock.patch.object(shape_cache, "cache_dir", return_value=directory):
+                shape_cache.store("shape", shape)
+                read_metadata = _timed(partial(shape_cache.load_metadata, "shape"), args.repeat)
+
+            print(f"{description} ({len(shape.Faces)} faces):")
+            for name, path, write, read in (
+                ("text", text, write_text, read_text),
+                ("binary", binary, write_binary, read_binary),
+            ):
+                size = path.stat().st_size / 1e6
+                print(
+                    f"    {name:8} {size:7.2f} MB, write {size / write:7.1f} MB/s, "
+                    f"read {size / read:7.1f} MB/s ({read * 1e3:.1f} ms)",
+                )
+            print(f"    metadata read {read_metadata * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
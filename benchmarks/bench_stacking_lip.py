@@ -0,0 +1,103 @@
+"""Compare the stacking lip generators on rectangular bins and custom shapes.
+
+Every object is generated once per stacking lip method of `preferences.STACKING_LIP_METHODS`, with
+the stacking lip cache cleared, and the time spent generating the stacking lip is reported with
+its face count, volume and validity. The custom shapes range from an L to a comb with many
+concave corners, where sweeping the profile is slowest.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_stacking_lip.py [--sizes 1 3 6]
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import time
+from collections.abc import Callable
+from unittest import mock
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from freecad.gridfinity_workbench import features, preferences, shape_cache, stacking_lip
+
+LAYOUTS = {
+    "L": [[True, True, True], [True, False, False], [True, False, False]],
+    "U": [[True, True, True], [True, False, False], [True, True, True]],
+    "comb": [[True, True, True, True, True], [True, False, True, False, True]] * 3,
+}
+
+
+def _create_rectangular(size: int) -> Callable[[fc.DocumentObject], None]:
+    def create(obj: fc.DocumentObject) -> None:
+        features.PartsBin(obj)
+        obj.xGridUnits = size
+        obj.yGridUnits = size
+
+    return create
+
+
+def _create_custom(layout: list[list[bool]]) -> Callable[[fc.DocumentObject], None]:
+    def create(obj: fc.DocumentObject) -> None:
+        features.CustomStorageBin(obj, layout)
+
+    return create
+
+
+def _measure(create: Callable[[fc.DocumentObject], None]) -> tuple[float, Part.Shape]:
+    shapes = []
+    seconds = 0.0
+    make = stacking_lip.make
+
+    def timed_make(outline: Part.Wire, profile: Part.Wire) -> Part.Shape:
+        nonlocal seconds
+        start = time.perf_counter()
+        shapes.append(make(outline, profile))
+        seconds += time.perf_counter() - start
+        return shapes[-1]
+
+    shape_cache.clear_memory("stacking_lip")
+    doc = fc.newDocument("GridfinityBenchmark")
+    try:
+        obj = doc.addObject("Part::FeaturePython", "Object")
+        create(obj)
+        with mock.patch.object(stacking_lip, "make", timed_make):
+            doc.recompute()
+    finally:
+        fc.closeDocument(doc.Name)
+    return seconds, shapes[-1]
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 3, 6])
+    args = parser.parse_args()
+
+    objects = {f"PartsBin {size}x{size}": _create_rectangular(size) for size in args.sizes}
+    for name, layout in LAYOUTS.items():
+        objects[f"CustomStorageBin {name}"] = _create_custom(layout)
+
+    params = preferences.parameters()
+    guard = params.GetString("ComplexityGuard", preferences.DEFAULT_COMPLEXITY_GUARD)
+    method = params.GetString("StackingLipMethod", preferences.DEFAULT_STACKING_LIP_METHOD)
+    params.SetString("ComplexityGuard", "Off")
+    try:
+        for name, create in objects.items():
+            print(f"{name}:")
+            for value in preferences.STACKING_LIP_METHODS:
+                params.SetString("StackingLipMethod", value)
+                seconds, shape = _measure(create)
+                print(
+                    f"    {value:16} {seconds:7.3f} s, {len(shape.Faces):5} faces, "
+                    f"{shape.Volume:10.2f} mm^3, {'valid' if shape.isValid() else 'INVALID'}",
+                )
+    finally:
+        params.SetString("ComplexityGuard", guard)
+        params.SetString("StackingLipMethod", method)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Measure the import cost the workbench adds to FreeCAD startup.
+
+FreeCAD imports `init_gui` for every installed workbench when it launches, so everything that
+module imports at top level is paid by every user, even when the Gridfinity workbench is never
+opened. This benchmark imports the startup entry points in fresh interpreters and reports the
+median import time together with the workbench modules that got loaded as a side effect.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_startup_imports.py [--runs 10]
+
+Compare against the numbers of an older revision by running the same script on a checkout of that
+revision.
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    "freecad.gridfinity_workbench.commands",
+    "freecad.gridfinity_workbench.features",
+]
+
+PROBE = """
+import freecad, json, sys, time
+import FreeCAD, FreeCADGui
+before = set(sys.modules)
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted(m for m in set(sys.modules) - before if m.startswith("freecad.gridfinity"))
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def _probe(module: str) -> dict:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", PROBE.format(module=module)],
+        capture_output=True,
+        check=True,
+        cwd=REPO_ROOT,
+        text=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="fresh interpreters per module")
+    args = parser.parse_args()
+
+    for module in MODULES:
+        samples = [_probe(module) for _ in range(args.runs)]
+        median_ms = statistics.median(s["seconds"] for s in samples) * 1000
+        print(f"{module}: {median_ms:.1f} ms (median of {args.runs})")
+        print(f"    loads: {', '.join(samples[0]['loaded'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compare tessellation of Gridfinity objects with FreeCAD defaults and size adaptive tolerances.
+
+For a small bin and a large baseplate the triangle count of the 3D view tessellation is reported
+with the FreeCAD default settings (0.5 % deviation, 28.5 degrees angular deflection) and with the
+tolerances chosen by the workbench. When the GUI is running, the render rate of the view is
+measured as well, by redrawing the rotating view.
+
+Run it inside FreeCAD, for example with `freecad benchmarks/bench_tessellation.py`, or headless
+with a python interpreter that can import `freecad` to get the triangle counts only.
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import math
+import time
+
+import FreeCAD as fc  # noqa: N813
+import MeshPart
+
+from freecad.gridfinity_workbench import features, preferences
+
+DEFAULT_DEVIATION_PERCENT = 0.5
+DEFAULT_ANGULAR_DEFLECTION = 28.5
+
+OBJECTS = [
+    ("1x1 bin", features.PartsBin, 1, 1),
+    ("30x30 baseplate", features.MagnetBaseplate, 30, 30),
+]
+
+
+def _triangles(obj: fc.DocumentObject, deviation: float, angular_deflection: float) -> int:
+    mesh = MeshPart.meshFromShape(
+        Shape=obj.Shape,
+        LinearDeflection=deviation,
+        AngularDeflection=math.radians(angular_deflection),
+        Relative=False,
+    )
+    return mesh.CountFacets
+
+
+def _fps(doc: fc.Document, frames: int = 60) -> float:
+    import FreeCADGui as fcg  # noqa: N813
+
+    view = fcg.getDocument(doc.Name).ActiveView
+    view.viewIsometric()
+    view.fitAll()
+    start = time.perf_counter()
+    for _ in range(frames):
+        view.viewRotateLeft()
+        view.redraw()
+        fcg.updateGui()
+    return frames / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    for description, feature, x_units, y_units in OBJECTS:
+        doc = fc.newDocument("GridfinityBenchmark")
+        obj = doc.addObject("Part::FeaturePython", "Object")
+        feature(obj)
+        obj.xGridUnits = x_units
+        obj.yGridUnits = y_units
+        doc.recompute()
+
+        bbox = obj.Shape.BoundBox
+        mean_length = (bbox.XLength + bbox.YLength + bbox.ZLength) / 3
+        default = (mean_length * DEFAULT_DEVIATION_PERCENT / 100, DEFAULT_ANGULAR_DEFLECTION)
+        adaptive = preferences.object_tessellation_tolerances(obj)
+
+        print(f"{description}:")
+        for name, (deviation, angular) in (("default", default), ("adaptive", adaptive)):
+            triangles = _triangles(obj, deviation, angular)
+            line = f"    {name:8} {deviation:.3f} mm, {angular:4.1f} deg: {triangles:9} triangles"
+            if fc.GuiUp:
+                vobj = obj.ViewObject
+                vobj.Deviation = deviation / mean_length * 100
+                vobj.AngularDeflection = angular
+                line += f", {_fps(doc):.1f} fps"
+            print(line)
+
+        fc.closeDocument(doc.Name)
+
+
+if __name__ == "__main__":
+    main()
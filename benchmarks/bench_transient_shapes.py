@@ -0,0 +1,83 @@
+"""Compare document size and open time with and without transient Gridfinity shapes.
+
+A project with 100 Gridfinity objects is generated, saved once with the shapes stored in the file
+and once with `TransientShape` enabled. The transient variant is opened with a warm local shape
+cache and with an empty one, in which case the shapes are regenerated by a recompute.
+
+Run it from the repository root with a python interpreter that can import `freecad`:
+
+    python benchmarks/bench_transient_shapes.py [--objects 100]
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import features, shape_cache
+
+OBJECT_TYPES: list[Callable[[fc.DocumentObject], object]] = [
+    features.PartsBin,
+    features.SimpleStorageBin,
+    features.BinBlank,
+    features.EcoBin,
+    features.MagnetBaseplate,
+]
+
+
+def _make_project(path: Path, n_objects: int, *, transient: bool) -> None:
+    doc = fc.newDocument("GridfinityBenchmark")
+    for i in range(n_objects):
+        obj = doc.addObject("Part::FeaturePython", f"Object{i}")
+        OBJECT_TYPES[i % len(OBJECT_TYPES)](obj)
+        obj.xGridUnits = 1 + i % 4
+        obj.yGridUnits = 1 + (i // 4) % 4
+        obj.TransientShape = transient
+    doc.recompute()
+    doc.saveAs(str(path))
+    fc.closeDocument(doc.Name)
+
+
+def _open(path: Path) -> float:
+    start = time.perf_counter()
+    doc = fc.openDocument(str(path))
+    # Shapes missing from the cache are touched on restore, build them like the GUI would.
+    doc.recompute()
+    elapsed = time.perf_counter() - start
+    fc.closeDocument(doc.Name)
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=100, help="objects in the project")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stored = Path(tmp) / "stored.FCStd"
+        transient = Path(tmp) / "transient.FCStd"
+
+        shape_cache.clear()
+        _make_project(stored, args.objects, transient=False)
+        _make_project(transient, args.objects, transient=True)
+
+        size = stored.stat().st_size / 1e6
+        print(f"stored shapes:    {size:8.2f} MB, open {_open(stored):.2f} s")
+        warm = _open(transient)
+        shape_cache.clear()
+        cold = _open(transient)
+        print(
+            f"transient shapes: {transient.stat().st_size / 1e6:8.2f} MB, "
+            f"open {warm:.2f} s (warm cache), {cold:.2f} s (cold cache)",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,3 +2,7 @@
 
 This file is needed by FreeCAD to initialize the workbench module.
 """
+
+from .recompute import batch, parallel_recompute
+
+__all__ = ["batch", "parallel_recompute"]
@@ -8,52 +8,59 @@ import math
 import FreeCAD as fc  # noqa: N813
 import Part
 
-from . import const, utils
+from . import booleans, const, property_schema, utils
 from . import magnet_hole as magnet_hole_module
+from .property_schema import PropertySpec
 from .utils import GridfinityLayout
 
-
-def magnet_holes_properties(obj: fc.DocumentObject) -> None:
-    """Make baseplate magnet holes."""
-    magnet_hole_module.add_properties(
-        obj,
-        remove_channel=False,
-        chamfer=True,
-        magnet_holes_default=True,
-    )
-    obj.setEditorMode("MagnetHoles", ("ReadOnly", "Hidden"))
-
-    obj.addProperty(
+MAGNET_HOLES_PROPERTIES = (
+    PropertySpec(
         "App::PropertyLength",
         "MagnetEdgeThickness",
         "NonStandard",
         "Thickness of edge around magnets <br> <br> default = 1.2 mm",
-    ).MagnetEdgeThickness = const.MAGNET_EDGE_THICKNESS
-
-    obj.addProperty(
+        default=const.MAGNET_EDGE_THICKNESS,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "MagnetBase",
         "NonStandard",
         "Thickness of base under the magnets <br> <br> default = 0.4 mm",
-    ).MagnetBase = const.MAGNET_BASE
-
-    obj.addProperty(
+        default=const.MAGNET_BASE,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "MagnetBaseHole",
         "NonStandard",
-        "Diameter of the hole at the bottom of the magnet cutout"
-        "<br> Set to zero to make disapear"
-        "<br> <br> default = 3 mm",
-    ).MagnetBaseHole = const.MAGNET_BASE_HOLE
-
+        (
+            "Diameter of the hole at the bottom of the magnet cutout"
+            "<br> Set to zero to make disapear"
+            "<br> <br> default = 3 mm"
+        ),
+        default=const.MAGNET_BASE_HOLE,
+    ),
     ## Gridfinity Hidden Properties
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "BaseThickness",
         "Hidden",
         "Thickness of base under the normal baseplate  profile <br> <br> default = 6.4 mm",
+        default=const.BASE_THICKNESS,
         hidden=True,
-    ).BaseThickness = const.BASE_THICKNESS
+    ),
+)
+
+
+def magnet_holes_properties(obj: fc.DocumentObject) -> None:
+    """Make baseplate magnet holes."""
+    magnet_hole_module.add_properties(
+        obj,
+        remove_channel=False,
+        chamfer=True,
+        magnet_holes_default=True,
+    )
+    obj.setEditorMode("MagnetHoles", ("ReadOnly", "Hidden"))
+    property_schema.add_properties(obj, MAGNET_HOLES_PROPERTIES)
 
 
 def make_magnet_holes(obj: fc.DocumentObject, layout: GridfinityLayout) -> Part.Shape:
@@ -70,7 +77,7 @@ def make_magnet_holes(obj: fc.DocumentObject, layout: GridfinityLayout) -> Part.
         fc.Vector(0, 0, 0),
         fc.Vector(0, 0, -1),
     )
-    shape = shape.fuse(screw_hole)
+    shape = booleans.fuse(shape, screw_hole)
     shape = utils.copy_and_translate(shape, utils.corners(x_hole_pos, y_hole_pos))
 
     shape.translate(fc.Vector(obj.xGridSize / 2, obj.yGridSize / 2))
@@ -79,24 +86,32 @@ def make_magnet_holes(obj: fc.DocumentObject, layout: GridfinityLayout) -> Part.
     return shape.translate(fc.Vector(-obj.xLocationOffset, -obj.yLocationOffset))
 
 
-def screw_bottom_chamfer_properties(obj: fc.DocumentObject) -> None:
-    """Create Baseplate Connection Holes."""
+SCREW_BOTTOM_CHAMFER_PROPERTIES = (
     ## Gridfinity Non Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "ScrewHoleDiameter",
         "NonStandard",
         "Diameter of screw holes inside magnet holes <br> <br> default = 3 mm",
-    ).ScrewHoleDiameter = const.SCREW_HOLE_DIAMETER
-
+        default=const.SCREW_HOLE_DIAMETER,
+    ),
     ## Gridfinity Expert Only Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "MagnetBottomChamfer",
         "zzExpertOnly",
-        "Chamfer of screwholes on the bottom of the baseplate, allows the use of countersuck"
-        "m3 screws in the bottom up to a bin <br> <br> default = 3 mm",
-    ).MagnetBottomChamfer = const.MAGNET_BOTTOM_CHAMFER
+        (
+            "Chamfer of screwholes on the bottom of the baseplate, allows the use of countersuck"
+            "m3 screws in the bottom up to a bin <br> <br> default = 3 mm"
+        ),
+        default=const.MAGNET_BOTTOM_CHAMFER,
+    ),
+)
+
+
+def screw_bottom_chamfer_properties(obj: fc.DocumentObject) -> None:
+    """Create Baseplate Connection Holes."""
+    property_schema.add_properties(obj, SCREW_BOTTOM_CHAMFER_PROPERTIES)
 
 
 def make_screw_bottom_chamfer(obj: fc.DocumentObject, layout: GridfinityLayout) -> Part.Shape:
@@ -118,15 +133,21 @@ def make_screw_bottom_chamfer(obj: fc.DocumentObject, layout: GridfinityLayout)
     )
 
 
-def connection_holes_properties(obj: fc.DocumentObject) -> None:
-    """Create Baseplate Connection Holes."""
+CONNECTION_HOLES_PROPERTIES = (
     ## Gridfinity Non Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "ConnectionHoleDiameter",
         "NonStandard",
         "Holes on the sides to connect multiple baseplates together <br> <br> default = 3.2 mm",
-    ).ConnectionHoleDiameter = const.CONNECTION_HOLE_DIAMETER
+        default=const.CONNECTION_HOLE_DIAMETER,
+    ),
+)
+
+
+def connection_holes_properties(obj: fc.DocumentObject) -> None:
+    """Create Baseplate Connection Holes."""
+    property_schema.add_properties(obj, CONNECTION_HOLES_PROPERTIES)
 
 
 def make_connection_holes(obj: fc.DocumentObject, layout: GridfinityLayout) -> Part.Shape:
@@ -166,12 +187,12 @@ def make_connection_holes(obj: fc.DocumentObject, layout: GridfinityLayout) -> P
     )
 
     vec_list = [fc.Vector(x * obj.xGridSize, 0) for x in range(len(layout))]
-    hx = utils.copy_and_translate(c1.fuse(c2), vec_list)
+    hx = utils.copy_and_translate(booleans.fuse(c1, c2), vec_list)
 
     vec_list = [fc.Vector(0, y * obj.yGridSize) for y in range(len(layout[-1]))]
-    hy = utils.copy_and_translate(c3.fuse(c4), vec_list)
+    hy = utils.copy_and_translate(booleans.fuse(c3, c4), vec_list)
 
-    fuse_total = hx.fuse(hy)
+    fuse_total = booleans.fuse(hx, hy)
     fuse_total = fuse_total.translate(
         fc.Vector(obj.xGridSize / 2 - obj.xLocationOffset, obj.yGridSize / 2 - obj.yLocationOffset),
     )
@@ -277,14 +298,20 @@ def _center_cut_face(obj: fc.DocumentObject) -> Part.Face:
     return utils.curve_to_face([l1, ar1, l2, ar2, l3, ar3, l4, l5, l6])
 
 
-def center_cut_properties(obj: fc.DocumentObject) -> None:
-    """Cut out the  center section of each baseplate grid."""
-    obj.addProperty(
+CENTER_CUT_PROPERTIES = (
+    PropertySpec(
         "App::PropertyLength",
         "SmallFillet",
         "NonStandard",
         "Fillets of the main cutout in each grid of the baseplate <br> <br> default = 1 mm",
-    ).SmallFillet = const.BASEPLATE_SMALL_FILLET
+        default=const.BASEPLATE_SMALL_FILLET,
+    ),
+)
+
+
+def center_cut_properties(obj: fc.DocumentObject) -> None:
+    """Cut out the  center section of each baseplate grid."""
+    property_schema.add_properties(obj, CENTER_CUT_PROPERTIES)
 
 
 def make_center_cut(obj: fc.DocumentObject, layout: GridfinityLayout) -> Part.Shape:
@@ -296,7 +323,7 @@ def make_center_cut(obj: fc.DocumentObject, layout: GridfinityLayout) -> Part.Sh
     partial_shape3 = partial_shape1.mirror(fc.Vector(0, 0, 0), fc.Vector(1, 0, 0))
     partial_shape4 = partial_shape2.mirror(fc.Vector(0, 0, 0), fc.Vector(1, 0, 0))
 
-    shape = partial_shape1.multiFuse([partial_shape2, partial_shape3, partial_shape4])
+    shape = booleans.multi_fuse(partial_shape1, [partial_shape2, partial_shape3, partial_shape4])
 
     fuse_total = utils.copy_in_layout(shape, layout, obj.xGridSize, obj.yGridSize)
 
@@ -305,102 +332,107 @@ def make_center_cut(obj: fc.DocumentObject, layout: GridfinityLayout) -> Part.Sh
     )
 
 
-def base_values_properties(obj: fc.DocumentObject) -> None:
-    """Create BinBaseValues.
-
-    Args:
-        obj (FreeCAD.DocumentObject): Document object
-
-    """
+BASE_VALUES_PROPERTIES = (
     ## Reference Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "BaseProfileHeight",
         "ReferenceParameters",
         "Height of the Gridfinity Base Profile",
         read_only=True,
-    )
-
+        expression="BaseProfileBottomChamfer + BaseProfileVerticalSection + BaseProfileTopChamfer",
+    ),
     ## Expert Only Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "BaseProfileBottomChamfer",
         "zzExpertOnly",
         "height of chamfer in bottom of bin base profile <br> <br> default = 0.8 mm",
+        default=const.BASEPLATE_BOTTOM_CHAMFER,
         read_only=True,
-    ).BaseProfileBottomChamfer = const.BASEPLATE_BOTTOM_CHAMFER
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BaseProfileVerticalSection",
         "zzExpertOnly",
         "Height of the vertical section in bin base profile",
+        default=const.BASEPLATE_VERTICAL_SECTION,
         read_only=True,
-    ).BaseProfileVerticalSection = const.BASEPLATE_VERTICAL_SECTION
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BaseProfileTopChamfer",
         "zzExpertOnly",
         "Height of the top chamfer in the bin base profile",
+        default=const.BASEPLATE_TOP_CHAMFER,
         read_only=True,
-    ).BaseProfileTopChamfer = const.BASEPLATE_TOP_CHAMFER
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BinOuterRadius",
         "zzExpertOnly",
         "Outer radius of the bin",
+        default=const.BASEPLATE_OUTER_RADIUS,
         read_only=True,
-    ).BinOuterRadius = const.BASEPLATE_OUTER_RADIUS
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BinVerticalRadius",
         "zzExpertOnly",
         "Radius of the base profile Vertical section",
+        default=const.BASEPLATE_VERTICAL_RADIUS,
         read_only=True,
-    ).BinVerticalRadius = const.BASEPLATE_VERTICAL_RADIUS
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BinBottomRadius",
         "zzExpertOnly",
         "bottom of bin corner radius",
+        default=const.BASEPLATE_BOTTOM_RADIUS,
         read_only=True,
-    ).BinBottomRadius = const.BASEPLATE_BOTTOM_RADIUS
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "Clearance",
         "zzExpertOnly",
         "The Clearance between bin and baseplate <br> <br>default = 0.25 mm",
-    ).Clearance = const.CLEARANCE
-
-    obj.addProperty(
+        default=const.CLEARANCE,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BaseplateTopLedgeWidth",
         "zzExpertOnly",
         "Top ledge of baseplate, doubled between grids <br> <br> default = 0.4 mm",
+        default=const.BASEPLATE_TOP_LEDGE_WIDTH,
         read_only=True,
-    ).BaseplateTopLedgeWidth = const.BASEPLATE_TOP_LEDGE_WIDTH
+    ),
+)
 
-    ## Expressions
-    obj.setExpression(
-        "BaseProfileHeight",
-        "BaseProfileBottomChamfer + BaseProfileVerticalSection + BaseProfileTopChamfer",
-    )
 
+def base_values_properties(obj: fc.DocumentObject) -> None:
+    """Create BinBaseValues.
 
-def solid_shape_properties(obj: fc.DocumentObject) -> None:
-    """Make solid which the baseplate is cut from."""
-    obj.addProperty(
+    Args:
+        obj (FreeCAD.DocumentObject): Document object
+
+    """
+    property_schema.add_properties(obj, BASE_VALUES_PROPERTIES)
+
+
+SOLID_SHAPE_PROPERTIES = (
+    PropertySpec(
         "App::PropertyLength",
         "TotalHeight",
         "ReferenceDimensions",
         "total height of the bin",
         read_only=True,
-    )
+    ),
+)
+
+
+def solid_shape_properties(obj: fc.DocumentObject) -> None:
+    """Make solid which the baseplate is cut from."""
+    property_schema.add_properties(obj, SOLID_SHAPE_PROPERTIES)
 
 
 def make_solid_shape(
@@ -0,0 +1,79 @@
+"""Boolean operations of the Gridfinity workbench.
+
+Shapes are combined with the functions of this module instead of the methods of `Part.Shape`, so
+the options of the boolean operations apply to every shape the workbench generates.
+
+The fuzzy value makes a boolean operation treat sub-shapes closer than the value as coincident.
+That helps with shapes that share faces, like the tiled cells of a grid, which exact boolean
+operations can split into slivers. The value in mm is set with the `BooleanFuzzyValue` preference
+and can be overridden per object with its `BooleanFuzzyValue` property, 0 runs exact boolean
+operations.
+
+The fuzzy value is the only boolean option of OCCT that the Python API of FreeCAD accepts per
+operation. The parallel mode and the glue option for shapes touching on coplanar faces have no
+switch in `Part.Shape` or in the FreeCAD preferences, so boolean operations keep the FreeCAD
+defaults for them and the module doesn't offer them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from typing import TYPE_CHECKING
+
+from . import preferences
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import FreeCAD as fc  # noqa: N813
+    import Part
+
+# Fuzzy values of the objects being generated, the last one applies.
+_fuzzy_values: list[float] = []
+
+
+def fuzzy_value() -> float:
+    """Get the fuzzy value in mm of boolean operations, 0 for exact boolean operations."""
+    if _fuzzy_values:
+        return _fuzzy_values[-1]
+    return preferences.boolean_fuzzy_value()
+
+
+def object_fuzzy_value(obj: fc.DocumentObject) -> float:
+    """Get the fuzzy value in mm of the boolean operations generating an object."""
+    value = getattr(obj, "BooleanFuzzyValue", -1)
+    return value if value >= 0 else preferences.boolean_fuzzy_value()
+
+
+@contextlib.contextmanager
+def object_options(obj: fc.DocumentObject) -> Iterator[None]:
+    """Apply the boolean options of an object until the context exits."""
+    _fuzzy_values.append(object_fuzzy_value(obj))
+    try:
+        yield
+    finally:
+        _fuzzy_values.pop()
+
+
+def fuse(shape: Part.Shape, tool: Part.Shape) -> Part.Shape:
+    """Return the union of a shape and a tool."""
+    value = fuzzy_value()
+    return shape.fuse(tool, value) if value > 0 else shape.fuse(tool)
+
+
+def multi_fuse(shape: Part.Shape, tools: list[Part.Shape]) -> Part.Shape:
+    """Return the union of a shape and all tools, in a single boolean operation."""
+    value = fuzzy_value()
+    return shape.multiFuse(tools, value) if value > 0 else shape.multiFuse(tools)
+
+
+def cut(shape: Part.Shape, tool: Part.Shape) -> Part.Shape:
+    """Return a shape with a tool removed from it."""
+    value = fuzzy_value()
+    return shape.cut(tool, value) if value > 0 else shape.cut(tool)
+
+
+def common(shape: Part.Shape, tool: Part.Shape) -> Part.Shape:
+    """Return the intersection of a shape and a tool."""
+    value = fuzzy_value()
+    return shape.common(tool, value) if value > 0 else shape.common(tool)
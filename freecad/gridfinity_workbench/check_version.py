@@ -1,10 +1,15 @@
 """Module supporting version checks and migrations for Gridfinity Workbench objects."""
 
+import math
+
 import FreeCAD as fc  # noqa: N813
 
-from . import const
+from . import grid_initial_layout, magnet_hole, property_schema
 from .version import __version__
 
+# Names of objects per document name, waiting for the deferred recompute after restoring.
+_pending_recompute: dict[str, set[str]] = {}
+
 
 def check_object_version(obj: fc.DocumentObject) -> bool:
     """Check if the object's version matches the current version of the Gridfinity Workbench.
@@ -15,82 +20,105 @@ def check_object_version(obj: fc.DocumentObject) -> bool:
     return str(getattr(obj, "version", "")) == __version__
 
 
-def migrate_object_version(obj: fc.DocumentObject) -> None:  # noqa: C901
+def migrate_object_version(obj: fc.DocumentObject) -> bool:
     """Update an object from an older version to the current version.
 
     This function will check the version of the object against the current
     Gridfinity Workbench version. If they are different, it will update the
-    object to the current version.
+    object properties to the current version. The object is not recomputed here.
+
+    Returns True if one of the applied migrations changes the geometry of the object, so the shape
+    stored in the document is outdated and the object has to be recomputed.
     """
     if check_object_version(obj):
-        return
+        return False
 
     def versiontuple(v: str) -> tuple[int, ...]:
         return tuple(map(int, (v.split("."))))
 
+    old_version = obj.version
     migrated = False
+    # Set by migrations which change the generated shape, not just the object properties.
+    geometry_changed = False
     if versiontuple(obj.version) < versiontuple("0.11.9"):
         migrated = True
         # v0.11.9: Changes to the magnet properties.
-        if not hasattr(obj, "CrushRibsCount"):
-            obj.addProperty(
-                "App::PropertyInteger",
-                "CrushRibsCount",
-                "GridfinityNonStandard",
-                "Number of crush ribs <br><br> default = 12",
-            ).CrushRibsCount = const.CRUSH_RIB_N
-        if not hasattr(obj, "CrushRibsWaviness"):
-            obj.addProperty(
-                "App::PropertyFloatConstraint",
-                "CrushRibsWaviness",
-                "GridfinityNonStandard",
-                "Waviness of crush ribs, from range [0, 1]",
-            ).CrushRibsWaviness = (const.CRUSH_RIB_WAVINESS, 0, 1, 0.05)
+        property_schema.add_properties(obj, magnet_hole.CRUSH_RIBS_PROPERTIES)
 
         # v0.11.9: MagnetRelief property was renamed to MagnetRemoveChannel
-        if not hasattr(obj, "MagnetRemoveChannel"):
-            obj.addProperty(
-                "App::PropertyBool",
-                "MagnetRemoveChannel",
-                "GridfinityNonStandard",
-                "Toggle the magnet hole remove channel on or off, only used if magnet holes are on",
-            ).MagnetRemoveChannel = getattr(obj, "MagnetRelief", False)
+        property_schema.add_properties(
+            obj,
+            [magnet_hole.MAGNET_REMOVE_CHANNEL_PROPERTY],
+            MagnetRemoveChannel=getattr(obj, "MagnetRelief", False),
+        )
         if hasattr(obj, "MagnetRelief"):
             obj.removeProperty("MagnetRelief")
 
     if versiontuple(obj.version) < versiontuple("0.12.0"):
         migrated = True
         # v0.12.0: calculation of UsableHeight was changed to use object Expressions.
+        # Evaluate it right away, the stored shape is only outdated if the value changed.
         obj.setExpression("UsableHeight", "TotalHeight - HeightUnitValue")
+        usable_height = float(obj.evalExpression("TotalHeight - HeightUnitValue"))
+        if not math.isclose(usable_height, float(obj.UsableHeight), abs_tol=1e-6):
+            geometry_changed = True
+        obj.UsableHeight = usable_height
 
         # v0.12.0: xGridUnits and yGridUnits were changed from int to float properties.
-        xgridunits = getattr(obj, "xGridUnits", None)
-        if xgridunits is None or isinstance(xgridunits, int):
-            obj.removeProperty("xGridUnits")
-            obj.addProperty(
-                "App::PropertyFloat",
-                "xGridUnits",
-                "Gridfinity",
-                "Number of grid units in the x direction <br> <br> default = 2",
-            ).xGridUnits = float(xgridunits or const.X_GRID_UNITS)
-
-        ygridunits = getattr(obj, "yGridUnits", None)
-        if ygridunits is None or isinstance(ygridunits, int):
-            obj.removeProperty("yGridUnits")
-            obj.addProperty(
-                "App::PropertyFloat",
-                "yGridUnits",
-                "Gridfinity",
-                "Number of grid units in the y direction <br> <br> default = 2",
-            ).yGridUnits = float(ygridunits or const.Y_GRID_UNITS)
+        for spec in grid_initial_layout.RECTANGLE_LAYOUT_PROPERTIES:
+            grid_units = getattr(obj, spec.name, None)
+            if grid_units is None or isinstance(grid_units, int):
+                obj.removeProperty(spec.name)
+                property_schema.add_properties(
+                    obj,
+                    [spec],
+                    **{spec.name: float(grid_units or spec.default)},
+                )
 
     # Update the version property to the current version after updating the object.
     obj.version = __version__
 
     if migrated:
-        obj.recompute()  # Force re-evaluation of expressions after updating properties.
         fc.Console.PrintLog(
             f"Gridfinity Workbench v{__version__}: "
-            f"updating '{obj.Name}' object properties from version v{obj.version}.\n"
+            f"updating '{obj.Name}' object properties from version v{old_version}.\n"
             f"'{obj.Name}' will be saved with v{__version__} properties.\n",
         )
+
+    return geometry_changed
+
+
+def schedule_recompute(obj: fc.DocumentObject) -> None:
+    """Queue an object for a single deferred recompute of its document.
+
+    Used while a document is being restored: instead of recomputing every object on its own, all
+    queued objects are touched and their document is recomputed once after loading has finished.
+    Without a GUI there is no event loop to defer to, the object is only touched and recomputed by
+    the next document recompute of the calling script.
+    """
+    obj.touch()
+    if not fc.GuiUp:
+        return
+
+    doc_name = obj.Document.Name
+    pending = _pending_recompute.setdefault(doc_name, set())
+    first = not pending
+    pending.add(obj.Name)
+
+    if first:
+        from PySide import QtCore  # type: ignore[import-not-found]
+
+        QtCore.QTimer.singleShot(0, lambda: _recompute_pending(doc_name))
+
+
+def _recompute_pending(doc_name: str) -> None:
+    names = _pending_recompute.pop(doc_name, set())
+    doc = fc.listDocuments().get(doc_name)
+    if doc is None or not names:
+        return
+
+    fc.Console.PrintLog(
+        f"Gridfinity Workbench v{__version__}: recomputing {len(names)} restored objects "
+        f"in '{doc.Label}'.\n",
+    )
+    doc.recompute()
@@ -5,19 +5,25 @@ Contains command objects representing what should happen on a button press.
 
 # ruff: noqa: D101, D102, D107, N802
 
+import math
 import re
+import time
 from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 import FreeCAD as fc  # noqa: N813
 import FreeCADGui as fcg  # noqa: N813
 
-from . import custom_shape, features, utils
+from . import preferences
 
 if TYPE_CHECKING:
     import Part
 
+# Geometry (`features`, `utils`) and dialog (`custom_shape`) modules are imported inside the
+# command callbacks. This keeps them out of FreeCAD startup, they are only loaded when a command is
+# activated or a document containing Gridfinity objects is restored.
+
 ICONDIR = Path(__file__).parent / "icons"
 
 PASCAL_CASE_REGEX = re.compile(r"(?<!^)(?=[A-Z])")
@@ -44,6 +50,26 @@ class ViewProviderGridfinity:
         """Attach viewproviderdocument object to self."""
         self.vobj = vobj
 
+    def updateData(self, obj: fc.DocumentObject, prop: str) -> None:
+        """Adapt the tessellation of the 3D view to the size of the object."""
+        if prop != "Shape" or obj.Shape.isNull() or not preferences.adaptive_tessellation():
+            return
+        vobj = obj.ViewObject
+        if vobj is None or not hasattr(vobj, "Deviation"):
+            return
+
+        deviation, angular_deflection = preferences.object_tessellation_tolerances(obj)
+        # The view deviation is a percentage of the mean bounding box edge length
+        bbox = obj.Shape.BoundBox
+        mean_length = (bbox.XLength + bbox.YLength + bbox.ZLength) / 3
+        deviation_percent = min(max(deviation / mean_length * 100, 0.01), 100)
+
+        # only touch the properties on real changes, every assignment triggers a new tessellation
+        if not math.isclose(vobj.Deviation, deviation_percent, rel_tol=0.05):
+            vobj.Deviation = deviation_percent
+        if not math.isclose(vobj.AngularDeflection.Value, angular_deflection, rel_tol=0.05):
+            vobj.AngularDeflection = angular_deflection
+
     def getIcon(self) -> str:
         """Get icons path."""
         self._check_attr()
@@ -108,7 +134,7 @@ class CreateCommand(BaseCommand):
         self,
         *,
         name: str,
-        gridfinity_function: type[features.FoundationGridfinity],
+        feature_name: str,
         pixmap: Path,
     ) -> None:
         super().__init__(
@@ -117,16 +143,18 @@ class CreateCommand(BaseCommand):
             menu_text=f"Gridfinity {PASCAL_CASE_REGEX.sub(' ', name)}",
             tooltip=f"Create a Gridfinty {PASCAL_CASE_REGEX.sub(' ', name)}.",
         )
-        self.gridfinity_function = gridfinity_function
+        self.feature_name = feature_name
 
     def Activated(self) -> None:
         """Execute when command is activated."""
+        from . import features, utils
+
         obj = utils.new_object(self.name)
         if fc.GuiUp:
             view_object: fcg.ViewProviderDocumentObject = obj.ViewObject
             ViewProviderGridfinity(view_object, str(self.pixmap))
 
-        self.gridfinity_function(obj)
+        getattr(features, self.feature_name)(obj)
 
         fc.ActiveDocument.recompute()
         fcg.SendMsgToActiveView("ViewFit")
@@ -136,7 +164,7 @@ class CreateBinBlank(CreateCommand):
     def __init__(self) -> None:
         super().__init__(
             name="BinBlank",
-            gridfinity_function=features.BinBlank,
+            feature_name="BinBlank",
             pixmap=ICONDIR / "BinBlank.svg",
         )
 
@@ -145,7 +173,7 @@ class CreateBinBase(CreateCommand):
     def __init__(self) -> None:
         super().__init__(
             name="BinBase",
-            gridfinity_function=features.BinBase,
+            feature_name="BinBase",
             pixmap=ICONDIR / "BinBase.svg",
         )
 
@@ -154,7 +182,7 @@ class CreateSimpleStorageBin(CreateCommand):
     def __init__(self) -> None:
         super().__init__(
             name="SimpleStorageBin",
-            gridfinity_function=features.SimpleStorageBin,
+            feature_name="SimpleStorageBin",
             pixmap=ICONDIR / "SimpleStorageBin.svg",
         )
 
@@ -163,7 +191,7 @@ class CreateEcoBin(CreateCommand):
     def __init__(self) -> None:
         super().__init__(
             name="EcoBin",
-            gridfinity_function=features.EcoBin,
+            feature_name="EcoBin",
             pixmap=ICONDIR / "eco_bin.svg",
         )
 
@@ -172,16 +200,25 @@ class CreatePartsBin(CreateCommand):
     def __init__(self) -> None:
         super().__init__(
             name="PartsBin",
-            gridfinity_function=features.PartsBin,
+            feature_name="PartsBin",
             pixmap=ICONDIR / "parts_bin.svg",
         )
 
 
+class CreateBinFamily(CreateCommand):
+    def __init__(self) -> None:
+        super().__init__(
+            name="BinFamily",
+            feature_name="BinFamily",
+            pixmap=ICONDIR / "bin_icon.svg",
+        )
+
+
 class CreateBaseplate(CreateCommand):
     def __init__(self) -> None:
         super().__init__(
             name="Baseplate",
-            gridfinity_function=features.Baseplate,
+            feature_name="Baseplate",
             pixmap=ICONDIR / "Baseplate.svg",
         )
 
@@ -190,7 +227,7 @@ class CreateMagnetBaseplate(CreateCommand):
     def __init__(self) -> None:
         super().__init__(
             name="MagnetBaseplate",
-            gridfinity_function=features.MagnetBaseplate,
+            feature_name="MagnetBaseplate",
             pixmap=ICONDIR / "magnet_baseplate.svg",
         )
 
@@ -199,7 +236,7 @@ class CreateScrewTogetherBaseplate(CreateCommand):
     def __init__(self) -> None:
         super().__init__(
             name="ScrewTogetherBaseplate",
-            gridfinity_function=features.ScrewTogetherBaseplate,
+            feature_name="ScrewTogetherBaseplate",
             pixmap=ICONDIR / "screw_together_baseplate.svg",
         )
 
@@ -218,7 +255,7 @@ class DrawCommand(BaseCommand):
         pixmap: Path,
         menu_text: str,
         tooltip: str,
-        gridfinity_functions: OrderedDict[str, Any],
+        feature_names: OrderedDict[str, str],
     ) -> None:
         super().__init__(
             name=name,
@@ -226,21 +263,23 @@ class DrawCommand(BaseCommand):
             menu_text=menu_text,
             tooltip=tooltip,
         )
-        self.gridfinity_functions = gridfinity_functions
+        self.feature_names = feature_names
 
     def Activated(self) -> None:
-        dialog_data = custom_shape.custom_bin_dialog(list(self.gridfinity_functions.keys()), None)
+        from . import custom_shape, features, utils
+
+        dialog_data = custom_shape.custom_bin_dialog(list(self.feature_names.keys()), None)
         if dialog_data is None:
             return
         assert dialog_data.bin_type is not None
-        assert dialog_data.bin_type in self.gridfinity_functions
+        assert dialog_data.bin_type in self.feature_names
 
         obj = utils.new_object(self.name)
         if fc.GuiUp:
             view_object: fcg.ViewProviderDocumentObject = obj.ViewObject
             ViewProviderGridfinity(view_object, str(self.pixmap))
 
-        self.gridfinity_functions[dialog_data.bin_type](obj, dialog_data.layout)
+        getattr(features, self.feature_names[dialog_data.bin_type])(obj, dialog_data.layout)
 
         fc.ActiveDocument.recompute()
         fcg.SendMsgToActiveView("ViewFit")
@@ -253,12 +292,12 @@ class DrawBin(DrawCommand):
             pixmap=ICONDIR / "CustomBin.svg",
             menu_text="Gridfinity Custom Bin",
             tooltip="Draw a custom gridfinity bin of any type.",
-            gridfinity_functions=OrderedDict(
+            feature_names=OrderedDict(
                 [
-                    ("Blank Bin", features.CustomBlankBin),
-                    ("Bin Base", features.CustomBinBase),
-                    ("Storage Bin", features.CustomStorageBin),
-                    ("Eco Bin", features.CustomEcoBin),
+                    ("Blank Bin", "CustomBlankBin"),
+                    ("Bin Base", "CustomBinBase"),
+                    ("Storage Bin", "CustomStorageBin"),
+                    ("Eco Bin", "CustomEcoBin"),
                 ],
             ),
         )
@@ -271,16 +310,137 @@ class DrawBaseplate(DrawCommand):
             pixmap=ICONDIR / "CustomBaseplate.svg",
             menu_text="Gridfinity Custom Baseplate",
             tooltip="Draw a custom gridfinity baseplate of any type.",
-            gridfinity_functions=OrderedDict(
+            feature_names=OrderedDict(
                 [
-                    ("Simple Baseplate", features.CustomBaseplate),
-                    ("Magnet Baseplate", features.CustomMagnetBaseplate),
-                    ("Screw Together Baseplate", features.CustomScrewTogetherBaseplate),
+                    ("Simple Baseplate", "CustomBaseplate"),
+                    ("Magnet Baseplate", "CustomMagnetBaseplate"),
+                    ("Screw Together Baseplate", "CustomScrewTogetherBaseplate"),
                 ],
             ),
         )
 
 
+class PlanDrawer(BaseCommand):
+    def __init__(self) -> None:
+        super().__init__(
+            name="PlanDrawer",
+            pixmap=ICONDIR / "CustomBaseplate.svg",
+            menu_text="Gridfinity Drawer",
+            tooltip=(
+                "Fill a drawer with a baseplate and bins.<br><br>"
+                "The requested bins are packed on the grid of the drawer and all objects are "
+                "created at once."
+            ),
+        )
+        self.bin_types = OrderedDict(
+            [
+                ("Simple Storage Bin", "SimpleStorageBin"),
+                ("Parts Bin", "PartsBin"),
+                ("Eco Bin", "EcoBin"),
+                ("Blank Bin", "BinBlank"),
+            ],
+        )
+
+    def Activated(self) -> None:
+        from . import custom_shape, drawer_planner
+
+        dialog_data = custom_shape.drawer_dialog(list(self.bin_types.keys()))
+        if dialog_data is None:
+            return
+
+        try:
+            plan = drawer_planner.plan_drawer(
+                dialog_data.width,
+                dialog_data.depth,
+                drawer_planner.parse_bin_sizes(dialog_data.bin_sizes),
+                fill=dialog_data.fill,
+            )
+        except ValueError as e:
+            fc.Console.PrintError(f"Gridfinity Drawer: {e}\n")
+            return
+        for x_units, y_units in plan.unplaced:
+            fc.Console.PrintWarning(
+                f"Gridfinity Drawer: no space left for a {x_units}x{y_units} bin\n",
+            )
+
+        def setup_view(obj: fc.DocumentObject) -> None:
+            if fc.GuiUp:
+                icon = "Baseplate.svg" if obj.Name.startswith("Baseplate") else "bin_icon.svg"
+                view_object: fcg.ViewProviderDocumentObject = obj.ViewObject
+                ViewProviderGridfinity(view_object, str(ICONDIR / icon))
+
+        drawer_planner.create_drawer(
+            plan,
+            bin_feature=self.bin_types[dialog_data.bin_type],
+            setup_view=setup_view,
+        )
+        fcg.SendMsgToActiveView("ViewFit")
+
+
+class ExportObjects(BaseCommand):
+    def __init__(self) -> None:
+        super().__init__(
+            name="ExportObjects",
+            pixmap=ICONDIR / "bin_icon.svg",
+            menu_text="Export Gridfinity objects",
+            tooltip=(
+                "Export every selected Gridfinity object, or all of them if nothing is selected, "
+                "to its own STL, STEP or 3MF file."
+            ),
+        )
+
+    @staticmethod
+    def _objects() -> list[fc.DocumentObject]:
+        objects = fcg.Selection.getSelection() or fc.ActiveDocument.Objects
+        return [
+            obj
+            for obj in objects
+            if hasattr(getattr(obj, "Proxy", None), "generate_gridfinity_shape")
+        ]
+
+    def IsActive(self) -> bool:
+        return fc.ActiveDocument is not None and bool(self._objects())
+
+    def Activated(self) -> None:
+        from . import custom_shape, export
+
+        dialog_data = custom_shape.export_dialog(export.FORMATS)
+        if dialog_data is None:
+            return
+
+        stats = export.export_objects(self._objects(), Path(dialog_data.directory), dialog_data.fmt)
+        peak = "unknown" if stats.peak_memory is None else f"{stats.peak_memory / 2**20:.0f} MiB"
+        fc.Console.PrintMessage(
+            f"Exported {len(stats.files)} objects in {stats.seconds:.1f} s "
+            f"({stats.parts_per_minute:.1f} parts/minute, peak memory {peak})\n",
+        )
+
+
+class RecomputeParallel(BaseCommand):
+    def __init__(self) -> None:
+        super().__init__(
+            name="RecomputeParallel",
+            pixmap=ICONDIR / "gridfinity_workbench_icon.svg",
+            menu_text="Recompute Gridfinity objects in parallel",
+            tooltip=(
+                "Recompute the document, generating the changed Gridfinity objects in parallel "
+                "in separate processes, one per CPU."
+            ),
+        )
+
+    def Activated(self) -> None:
+        from . import recompute
+
+        doc = fc.ActiveDocument
+        assert doc is not None
+        start = time.perf_counter()
+        count = recompute.parallel_recompute(doc)
+        fc.Console.PrintMessage(
+            f"Recomputed {count} Gridfinity objects in parallel in "
+            f"{time.perf_counter() - start:.1f} s\n",
+        )
+
+
 class ChangeLayout(BaseCommand):
     def __init__(self) -> None:
         super().__init__(
@@ -295,6 +455,8 @@ class ChangeLayout(BaseCommand):
         return len(selection) == 1 and hasattr(selection[0].Proxy, "layout")
 
     def Activated(self) -> None:
+        from . import custom_shape
+
         obj = fcg.Selection.getSelection()[0]
 
         dialog_data = custom_shape.custom_bin_dialog([], obj.Proxy.layout)
@@ -337,6 +499,8 @@ class StandaloneLabelShelf(BaseCommand):
         return len(max_points) == 2  # noqa: PLR2004
 
     def Activated(self) -> None:
+        from . import features, utils
+
         obj = utils.new_object("LabelShelf")
         if fc.GuiUp:
             view_object: fcg.ViewProviderDocumentObject = obj.ViewObject
@@ -0,0 +1,267 @@
+"""Estimate the cost of generating a Gridfinity object and guard against very large objects.
+
+The cost of a Gridfinity object grows with the number of grid cells and the features repeated in
+every cell, each of them an input of a boolean operation, and with the number of variants of a bin
+family. The estimate only uses the properties of the object, so it is available before any
+geometry is built. The coefficients per object type are hand-picked estimates, they are not fitted
+to measurements. `benchmarks/bench_complexity.py` measures generation times and fits the
+coefficients to them.
+
+Objects estimated to take longer than the `ComplexityThreshold` preference, in seconds, are handled
+according to the `ComplexityGuard` preference:
+
+- Off: generate the object without checking.
+- Warn: print a warning and generate the object.
+- Ask: ask for confirmation in the GUI, show a preview if declined.
+- Preview: show a simplified preview shape instead of the full object.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+import FreeCAD as fc  # noqa: N813
+
+from . import booleans, grid_initial_layout, memo, preferences, shape_cache, utils
+
+if TYPE_CHECKING:
+    import Part
+
+
+@dataclasses.dataclass(frozen=True)
+class CostModel:
+    """Coefficients of the runtime and memory model of an object type.
+
+    The runtime in seconds is `base_seconds + seconds_per_input * boolean_inputs ** exponent`.
+    """
+
+    base_seconds: float
+    seconds_per_input: float
+    exponent: float
+    faces_per_cell: float
+    bytes_per_face: float
+
+
+# Faces added by a single hole or compartment, independent of the object type.
+FACES_PER_HOLE = 6
+FACES_PER_COMPARTMENT = 12
+
+COST_MODELS = {
+    "FullBin": CostModel(0.15, 2.0e-3, 1.25, 40, 18e3),
+    "StorageBin": CostModel(0.25, 2.5e-3, 1.25, 46, 18e3),
+    "EcoBin": CostModel(0.3, 3.0e-3, 1.25, 70, 18e3),
+    "Baseplate": CostModel(0.05, 1.5e-3, 1.2, 30, 16e3),
+    "MagnetBaseplate": CostModel(0.1, 2.0e-3, 1.25, 36, 16e3),
+    "ScrewTogetherBaseplate": CostModel(0.1, 2.5e-3, 1.25, 44, 16e3),
+}
+DEFAULT_COST_MODEL = COST_MODELS["StorageBin"]
+
+# Object types sharing the cost model of another type.
+COST_MODEL_ALIASES = {
+    "BinBlank": "FullBin",
+    "BinBase": "FullBin",
+    "CustomBlankBin": "FullBin",
+    "CustomBinBase": "FullBin",
+    "SimpleStorageBin": "StorageBin",
+    "PartsBin": "StorageBin",
+    "CustomStorageBin": "StorageBin",
+    "CustomEcoBin": "EcoBin",
+    "CustomBaseplate": "Baseplate",
+    "CustomMagnetBaseplate": "MagnetBaseplate",
+    "CustomScrewTogetherBaseplate": "ScrewTogetherBaseplate",
+}
+
+# List properties of a bin family, every combination of their values is one variant.
+VARIANT_LISTS = (
+    "xGridUnitsList",
+    "yGridUnitsList",
+    "HeightUnitsList",
+    "xDividersList",
+    "yDividersList",
+)
+
+# Number of confirmations remembered, the oldest are forgotten first and asked for again.
+MAX_CONFIRMED = 256
+
+# Preview shapes assigned to objects, by document and object name.
+_previews: dict[tuple[str, str], Part.Shape] = {}
+# Fingerprints of objects the user confirmed to generate despite the estimate, oldest first.
+_confirmed: dict[str, None] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class Estimate:
+    """Predicted cost of generating a Gridfinity object."""
+
+    cells: int
+    boolean_inputs: int
+    faces: int
+    seconds: float
+    memory: float
+    variants: int = 1
+
+    def __str__(self) -> str:
+        """Summarize the estimate for messages."""
+        variants = f"{self.variants} variants, " if self.variants > 1 else ""
+        return (
+            f"about {self.seconds:.0f} s and {self.memory / 1e6:.0f} MB "
+            f"({variants}{self.cells} grid cells, {self.boolean_inputs} boolean inputs, "
+            f"{self.faces} faces)"
+        )
+
+
+def cost_model(obj: fc.DocumentObject) -> CostModel:
+    """Get the cost model matching the type of a Gridfinity object, or its bin type."""
+    name = getattr(obj.Proxy, "bin_type", None) or type(obj.Proxy).__name__
+    return COST_MODELS.get(COST_MODEL_ALIASES.get(name, name), DEFAULT_COST_MODEL)
+
+
+def grid_cells(obj: fc.DocumentObject) -> int:
+    """Count the grid cells of a rectangular or custom shape Gridfinity object."""
+    if hasattr(obj, "xGridUnits"):
+        return int(obj.xGridUnits + 1e-6) * int(obj.yGridUnits + 1e-6)
+    layout = getattr(obj.Proxy, "layout", [])
+    return sum(sum(1 for cell in row if cell) for row in layout)
+
+
+def variants(obj: fc.DocumentObject) -> int:
+    """Count the variants generated for an object, 1 unless it is a bin family."""
+    count = 1
+    for name in VARIANT_LISTS:
+        count *= max(len(getattr(obj, name, [])), 1)
+    return count
+
+
+def estimate(obj: fc.DocumentObject) -> Estimate:
+    """Estimate runtime and memory of generating a Gridfinity object from its parameters.
+
+    The variants of a bin family are estimated like the variant of its current sizes.
+    """
+    model = cost_model(obj)
+    cells = grid_cells(obj)
+    hole_types = sum(bool(getattr(obj, name, False)) for name in ("MagnetHoles", "ScrewHoles"))
+    holes = 4 * cells * hole_types
+    compartments = (getattr(obj, "xDividers", 0) + 1) * (getattr(obj, "yDividers", 0) + 1)
+
+    boolean_inputs = cells + holes + compartments
+    faces = round(
+        cells * model.faces_per_cell
+        + holes * FACES_PER_HOLE
+        + compartments * FACES_PER_COMPARTMENT,
+    )
+    seconds = model.base_seconds + model.seconds_per_input * boolean_inputs**model.exponent
+    count = variants(obj)
+    return Estimate(
+        cells=cells * count,
+        boolean_inputs=boolean_inputs * count,
+        faces=faces * count,
+        seconds=seconds * count,
+        memory=faces * count * model.bytes_per_face,
+        variants=count,
+    )
+
+
+def has_preview(obj: fc.DocumentObject) -> bool:
+    """Check if a preview shape can be made for an object."""
+    return hasattr(obj, "xGridUnits") and getattr(obj, "BaseFeature", None) is None
+
+
+def preview_shape(obj: fc.DocumentObject) -> Part.Shape:
+    """Make the outer envelope of a rectangular Gridfinity object, as a fast preview.
+
+    The object is remembered to show a preview as long as it keeps this shape.
+    """
+    grid_initial_layout.make_rectangle_layout(obj)
+    if obj.Baseplate:
+        zmin = 0
+        offset = fc.Vector(obj.xTotalWidth / 2, obj.yTotalWidth / 2)
+    else:
+        zmin = -obj.TotalHeight
+        offset = fc.Vector(
+            obj.xTotalWidth / 2 + obj.Clearance,
+            obj.yTotalWidth / 2 + obj.Clearance,
+        )
+    shape = utils.rounded_rectangle_extrude(
+        obj.xTotalWidth,
+        obj.yTotalWidth,
+        zmin,
+        obj.TotalHeight,
+        obj.BinOuterRadius,
+    )
+    shape = shape.translate(offset - fc.Vector(obj.xLocationOffset, obj.yLocationOffset))
+    _forget_previews()
+    _previews[obj.Document.Name, obj.Name] = shape
+    return shape
+
+
+def _forget_previews() -> None:
+    """Forget the previews of deleted objects, closed documents and objects with a new shape."""
+    documents = fc.listDocuments()
+    for doc_name, name in list(_previews):
+        doc = documents.get(doc_name)
+        obj = None if doc is None else doc.getObject(name)
+        if obj is None or not obj.Shape.isPartner(_previews[doc_name, name]):
+            del _previews[doc_name, name]
+
+
+def is_preview(obj: fc.DocumentObject) -> bool:
+    """Check if an object currently shows a preview instead of its full shape."""
+    preview = _previews.get((obj.Document.Name, obj.Name))
+    return preview is not None and obj.Shape.isPartner(preview)
+
+
+def full_shape(obj: fc.DocumentObject) -> Part.Shape:
+    """Get the full shape of an object, generating it if the object has no shape or a preview.
+
+    The shape is generated like in the execute of the object, with its boolean options, and placed
+    at the object placement.
+    """
+    if not obj.Shape.isNull() and not is_preview(obj):
+        return obj.Shape
+    with memo.scope(), booleans.object_options(obj):
+        shape = obj.Proxy.generate_gridfinity_shape(obj)
+    shape.Placement = obj.Placement
+    return shape
+
+
+def use_preview(obj: fc.DocumentObject) -> bool:
+    """Apply the complexity guard to an object about to be generated.
+
+    Returns:
+        bool: True if a preview should be shown instead of the full shape.
+
+    """
+    mode = preferences.complexity_guard()
+    if mode == "Off":
+        return False
+
+    cost = estimate(obj)
+    if cost.seconds <= preferences.complexity_threshold():
+        return False
+
+    if mode == "Ask" and fc.GuiUp and has_preview(obj):
+        from . import custom_shape
+
+        key = shape_cache.fingerprint(obj)
+        if key in _confirmed or custom_shape.confirm_dialog(
+            "Large Gridfinity object",
+            f"Generating '{obj.Label}' will take {cost}.\n\n"
+            "Generate it anyway? Otherwise a preview is shown.",
+        ):
+            _confirmed[key] = None
+            while len(_confirmed) > MAX_CONFIRMED:
+                del _confirmed[next(iter(_confirmed))]
+            return False
+        preview = True
+    else:
+        preview = mode == "Preview" and has_preview(obj)
+
+    if preview:
+        fc.Console.PrintWarning(
+            f"{obj.Label}: generating would take {cost}, showing a preview. Set the "
+            "ComplexityGuard preference to Warn to generate the full object.\n",
+        )
+    else:
+        fc.Console.PrintWarning(f"{obj.Label}: generating will take {cost}.\n")
+    return preview
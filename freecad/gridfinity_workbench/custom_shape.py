@@ -23,10 +23,17 @@ from PySide.QtGui import (
     QShowEvent,
 )
 from PySide.QtWidgets import (
+    QCheckBox,
     QComboBox,
     QDialog,
     QDialogButtonBox,
+    QDoubleSpinBox,
+    QFileDialog,
+    QFormLayout,
+    QInputDialog,
     QLabel,
+    QLineEdit,
+    QMessageBox,
     QVBoxLayout,
 )
 
@@ -201,3 +208,89 @@ def custom_bin_dialog(
         layout=dialog.grid_layout,
         bin_type=dialog.comboBox.currentText() if types else None,
     )
+
+
+@dataclass
+class DrawerDialogData:
+    """A result of a successful drawer dialog."""
+
+    width: float
+    depth: float
+    bin_sizes: str
+    bin_type: str
+    fill: bool
+
+
+def drawer_dialog(types: list[str]) -> DrawerDialogData | None:
+    """Get the drawer dimensions and requested bins from the user.
+
+    Returns None if the user aborted the operation.
+
+    """
+    dialog = QDialog()
+    dialog.setWindowTitle("Gridfinity Drawer")
+
+    width = QDoubleSpinBox(suffix=" mm", minimum=1, maximum=10000, value=420)
+    depth = QDoubleSpinBox(suffix=" mm", minimum=1, maximum=10000, value=420)
+    bin_sizes = QLineEdit("2x2, 2x1*2, 1x1*4")
+    bin_sizes.setToolTip("Comma separated bin sizes in grid units, '2x1*3' are three 2x1 bins")
+    combo_box = QComboBox()
+    combo_box.addItems(types)
+    fill = QCheckBox("Fill remaining space with 1x1 bins", checked=True)
+
+    button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+    button_box.accepted.connect(dialog.accept)
+    button_box.rejected.connect(dialog.reject)
+
+    layout = QFormLayout(dialog)
+    layout.addRow("Inner drawer width", width)
+    layout.addRow("Inner drawer depth", depth)
+    layout.addRow("Bins", bin_sizes)
+    layout.addRow("Bin type", combo_box)
+    layout.addRow(fill)
+    layout.addRow(button_box)
+
+    if not dialog.exec():
+        return None
+    return DrawerDialogData(
+        width=width.value(),
+        depth=depth.value(),
+        bin_sizes=bin_sizes.text(),
+        bin_type=combo_box.currentText(),
+        fill=fill.isChecked(),
+    )
+
+
+@dataclass
+class ExportDialogData:
+    """A result of a successful export dialog."""
+
+    directory: str
+    fmt: str
+
+
+def export_dialog(formats: list[str]) -> ExportDialogData | None:
+    """Get the export directory and file format from the user.
+
+    Returns None if the user aborted the operation.
+
+    """
+    fmt, ok = QInputDialog.getItem(None, "Gridfinity Export", "File format", formats, 0, False)  # noqa: FBT003
+    if not ok:
+        return None
+    directory = QFileDialog.getExistingDirectory(None, "Gridfinity Export")
+    if not directory:
+        return None
+    return ExportDialogData(directory=directory, fmt=fmt)
+
+
+def confirm_dialog(title: str, text: str) -> bool:
+    """Ask the user a yes or no question, defaulting to no."""
+    answer = QMessageBox.question(
+        None,
+        title,
+        text,
+        QMessageBox.Yes | QMessageBox.No,
+        QMessageBox.No,
+    )
+    return answer == QMessageBox.Yes
@@ -3,11 +3,12 @@
 import FreeCAD as fc  # noqa: N813
 import Part
 
-from . import utils
+from . import booleans, edge_index, memo, stacking_lip, utils
 from .feature_construction import _stacking_lip_profile
 from .utils import GridfinityLayout
 
 
+@memo.memoized
 def custom_shape_solid(
     obj: fc.DocumentObject,
     layout: GridfinityLayout,
@@ -18,6 +19,7 @@ def custom_shape_solid(
     return utils.copy_in_layout(grid_box, layout, obj.xGridSize, obj.yGridSize)
 
 
+@memo.memoized
 def custom_shape_trim(
     obj: fc.DocumentObject,
     layout: GridfinityLayout,
@@ -62,17 +64,32 @@ def custom_shape_trim(
 
     fuse_total = utils.copy_and_translate(x_trim_box, x_vec_list)
 
-    fuse_total = fuse_total.fuse(utils.copy_and_translate(y_trim_box, y_vec_list))
+    fuse_total = booleans.fuse(fuse_total, utils.copy_and_translate(y_trim_box, y_vec_list))
 
     return fuse_total
 
 
+@memo.memoized
+def trimmed_rounded_solid(  # noqa: PLR0913
+    obj: fc.DocumentObject,
+    solid_shape: Part.Shape,
+    layout: GridfinityLayout,
+    xtrim: fc.Units.Quantity,
+    ytrim: fc.Units.Quantity,
+    radius: float,
+) -> Part.Shape:
+    """Trim the edges from a custom shape solid and fillet its vertical edges."""
+    solid_cut = booleans.cut(solid_shape, custom_shape_trim(obj, layout, xtrim, ytrim))
+    solid_cut = solid_cut.removeSplitter()
+    return vertical_edge_fillet(solid_cut, radius)
+
+
 def vertical_edge_fillet(
     solid_shape: Part.Shape,
     radius: float,
 ) -> Part.Shape:
     """Fillet vertical Edges of input shape."""
-    edges = [edge for edge in solid_shape.Edges if edge.Vertexes[0].Z != edge.Vertexes[1].Z]
+    edges = edge_index.of(solid_shape).vertical()
     return solid_shape.makeFillet(radius, edges)
 
 
@@ -98,9 +115,8 @@ def vertical_edge_fillet_with_concave_edges(
     concave_radius: float,
 ) -> Part.Shape:
     """Fillet vertical Edges of input shape."""
-    edges = [edge for edge in solid_shape.Edges if edge.Vertexes[0].Z != edge.Vertexes[1].Z]
     concave_edges, convex_edges = [], []
-    for edge in edges:
+    for edge in edge_index.of(solid_shape).vertical():
         if _is_concave_edge(edge, solid_shape):
             concave_edges.append(edge)
         else:
@@ -112,7 +128,7 @@ def vertical_edge_fillet_with_concave_edges(
 
 def get_largest_top_wire(solid_shape: Part.Shape, zheight: float) -> Part.Wire:
     """Return the largest wire of the top face of a solid shape."""
-    solid_shape = solid_shape.translate(fc.Vector(0, 0, zheight))
+    solid_shape = solid_shape.translated(fc.Vector(0, 0, zheight))
     wires = [
         wire
         for wire in solid_shape.Wires
@@ -145,16 +161,13 @@ def custom_shape_stacking_lip(
             continue
         break
 
-    wire = _stacking_lip_profile(obj).translate(
+    wire = _stacking_lip_profile(obj).translated(
         fc.Vector(
             x * obj.xGridSize.Value,
             y * obj.yGridSize.Value,
         ),
     )
-    stacking_lip = Part.Wire(bin_outside_shape).makePipe(wire)
-    stacking_lip = Part.makeSolid(stacking_lip)
-
-    return stacking_lip
+    return stacking_lip.make(bin_outside_shape, wire)
 
 
 def get_object_shape(
@@ -165,10 +178,14 @@ def get_object_shape(
     yoffset: fc.Units.Quantity,
 ) -> Part.Wire:
     """Return wire of object shape."""
-    trim = custom_shape_trim(obj, layout, xoffset, yoffset)
-    solid_cut = solid_shape.cut(trim)
-    solid_cut = solid_cut.removeSplitter()
-    solid_rounded = vertical_edge_fillet(solid_cut, obj.BinOuterRadius.Value)
+    solid_rounded = trimmed_rounded_solid(
+        obj,
+        solid_shape,
+        layout,
+        xoffset,
+        yoffset,
+        obj.BinOuterRadius,
+    )
     object_shape_wire = get_largest_top_wire(solid_rounded, 0)
 
     return object_shape_wire
@@ -197,6 +214,6 @@ def cut_outside_shape(
     ).translate(
         fc.Vector(obj.xTotalWidth / 2 + obj.Clearance, obj.yTotalWidth / 2 + obj.Clearance),
     )
-    perimeter_negative = overall_rectangle.cut(bin_outside_solid)
+    perimeter_negative = booleans.cut(overall_rectangle, bin_outside_solid)
 
     return perimeter_negative
@@ -0,0 +1,188 @@
+"""Plan and create a baseplate with bins filling a drawer.
+
+The drawer is divided in grid cells of `xGridSize` by `yGridSize`. The requested bin sizes are
+packed on this grid, largest first, at the first free position in row major order.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import FreeCAD as fc  # noqa: N813
+
+from . import const, features, utils
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+BinSize = tuple[int, int]
+
+BIN_SIZE_REGEX = re.compile(r"^\s*(\d+)\s*x\s*(\d+)\s*(?:\*\s*(\d+))?\s*$")
+
+
+@dataclass
+class BinPlacement:
+    """A bin placed on the drawer grid, position and size in grid units."""
+
+    x: int
+    y: int
+    x_units: int
+    y_units: int
+
+
+@dataclass
+class DrawerPlan:
+    """Result of planning a drawer."""
+
+    x_units: int
+    y_units: int
+    x_grid_size: float
+    y_grid_size: float
+    bins: list[BinPlacement] = field(default_factory=list)
+    unplaced: list[BinSize] = field(default_factory=list)
+
+
+def parse_bin_sizes(text: str) -> list[BinSize]:
+    """Parse a comma separated list of bin sizes.
+
+    A bin size is written as `<x>x<y>`, optionally followed by `*<count>`. For example
+    `2x1*3, 1x1` requests three 2 by 1 bins and one 1 by 1 bin.
+
+    """
+    sizes: list[BinSize] = []
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        match = BIN_SIZE_REGEX.match(item)
+        if match is None:
+            raise ValueError(f"Invalid bin size '{item.strip()}', expected for example '2x1*3'")
+        x_units, y_units, count = int(match[1]), int(match[2]), int(match[3] or 1)
+        if x_units < 1 or y_units < 1:
+            raise ValueError(f"Invalid bin size '{item.strip()}', bins are at least 1x1")
+        sizes += [(x_units, y_units)] * count
+    return sizes
+
+
+def _place(occupied: list[list[bool]], x_units: int, y_units: int) -> BinPlacement | None:
+    """Occupy the first free position in row major order that fits a bin."""
+    for y in range(len(occupied[0]) - y_units + 1):
+        for x in range(len(occupied) - x_units + 1):
+            cells = [(i, j) for i in range(x, x + x_units) for j in range(y, y + y_units)]
+            if not any(occupied[i][j] for i, j in cells):
+                for i, j in cells:
+                    occupied[i][j] = True
+                return BinPlacement(x, y, x_units, y_units)
+    return None
+
+
+def plan_drawer(  # noqa: PLR0913
+    drawer_width: float,
+    drawer_depth: float,
+    bin_sizes: Sequence[BinSize],
+    *,
+    x_grid_size: float = const.X_GRID_SIZE,
+    y_grid_size: float = const.Y_GRID_SIZE,
+    fill: bool = True,
+) -> DrawerPlan:
+    """Pack bins on the grid of a drawer.
+
+    Bins are placed largest first, each at the first free grid position in row major order. A bin
+    that does not fit is tried rotated by 90 degrees before it is reported as unplaced.
+
+    Args:
+        drawer_width (float): Inner width of the drawer (x direction) in mm.
+        drawer_depth (float): Inner depth of the drawer (y direction) in mm.
+        bin_sizes (Sequence[BinSize]): Size of every requested bin in grid units.
+        x_grid_size (float): Size of a grid cell in x direction in mm.
+        y_grid_size (float): Size of a grid cell in y direction in mm.
+        fill (bool): Fill the grid cells left over with 1x1 bins.
+
+    """
+    x_units = int(drawer_width // x_grid_size)
+    y_units = int(drawer_depth // y_grid_size)
+    if x_units < 1 or y_units < 1:
+        raise ValueError("Drawer is smaller than a single grid cell")
+
+    plan = DrawerPlan(x_units, y_units, x_grid_size, y_grid_size)
+    occupied = [[False] * y_units for _ in range(x_units)]
+
+    for x_size, y_size in sorted(bin_sizes, key=lambda s: (s[0] * s[1], max(s)), reverse=True):
+        placement = _place(occupied, x_size, y_size) or _place(occupied, y_size, x_size)
+        if placement is None:
+            plan.unplaced.append((x_size, y_size))
+        else:
+            plan.bins.append(placement)
+
+    while fill and (placement := _place(occupied, 1, 1)) is not None:
+        plan.bins.append(placement)
+
+    return plan
+
+
+def create_drawer(
+    plan: DrawerPlan,
+    *,
+    bin_feature: str = "SimpleStorageBin",
+    baseplate_feature: str | None = "Baseplate",
+    setup_view: Callable[[fc.DocumentObject], None] | None = None,
+) -> list[fc.DocumentObject]:
+    """Create the objects of a drawer plan in the active document.
+
+    All objects are created before the document is recomputed once. Bins of the same size have
+    identical parameters, so their shape is generated only once and shared.
+
+    Args:
+        plan (DrawerPlan): Plan to create.
+        bin_feature (str): Name of the feature class used for the bins.
+        baseplate_feature (str | None): Name of the feature class used for the baseplate, None to
+            create the bins only.
+        setup_view (Callable | None): Called for every created object before recompute, used to
+            attach a view provider.
+
+    Returns:
+        list[fc.DocumentObject]: The created objects, the baseplate first.
+
+    """
+    doc = fc.ActiveDocument
+    created: list[fc.DocumentObject] = []
+
+    def new(name: str, feature: str) -> fc.DocumentObject:
+        obj = utils.new_object(name)
+        if setup_view is not None:
+            setup_view(obj)
+        getattr(features, feature)(obj)
+        obj.xGridSize = plan.x_grid_size
+        obj.yGridSize = plan.y_grid_size
+        created.append(obj)
+        return obj
+
+    # Bins are generated from -TotalHeight up to 0, lift them to stand on z = 0 or on the floor of
+    # the baseplate pockets, which are BaseProfileHeight deep.
+    height = "TotalHeight"
+
+    doc.openTransaction("Create drawer")
+    try:
+        if baseplate_feature is not None:
+            baseplate = new("Baseplate", baseplate_feature)
+            baseplate.xGridUnits = plan.x_units
+            baseplate.yGridUnits = plan.y_units
+            height += f" + {baseplate.Name}.TotalHeight - {baseplate.Name}.BaseProfileHeight"
+
+        for placement in plan.bins:
+            obj = new("Bin", bin_feature)
+            obj.xGridUnits = placement.x_units
+            obj.yGridUnits = placement.y_units
+            obj.Placement = fc.Placement(
+                fc.Vector(placement.x * plan.x_grid_size, placement.y * plan.y_grid_size),
+                fc.Rotation(),
+            )
+            obj.setExpression(".Placement.Base.z", height)
+    except Exception:
+        doc.abortTransaction()
+        raise
+    doc.commitTransaction()
+
+    doc.recompute()
+    return created
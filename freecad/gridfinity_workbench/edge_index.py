@@ -0,0 +1,133 @@
+"""Find the edges of a shape by orientation and position.
+
+Fillets are applied to edges selected by their geometry, for example all vertical edges of a bin
+or the horizontal edge at the front of a label shelf. An `EdgeIndex` reads the bounding box of
+every edge of a shape once and buckets the edges:
+
+- horizontal edges by height,
+- vertical straight edges by XY position,
+- all edges by the height of their top.
+
+Selecting edges is then a lookup, and coordinates are compared with a tolerance instead of exact
+float equality.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from . import memo
+
+if TYPE_CHECKING:
+    import FreeCAD as fc  # noqa: N813
+    import Part
+
+# Distance in mm below which coordinates are considered equal.
+TOLERANCE = 1e-6
+
+
+class EdgeIndex:
+    """Edges of a shape bucketed by orientation, height and XY position."""
+
+    def __init__(self, shape: Part.Shape, tolerance: float = TOLERANCE) -> None:
+        """Index the edges of a shape, coordinates closer than the tolerance in mm are equal."""
+        self.tolerance = tolerance
+        self.edges: list[Part.Edge] = shape.Edges
+        self._boxes: list[fc.BoundBox] = [edge.BoundBox for edge in self.edges]
+        self._horizontal: dict[int, list[int]] = defaultdict(list)
+        self._vertical: dict[tuple[int, int], list[int]] = defaultdict(list)
+
+        for i, box in enumerate(self._boxes):
+            if box.ZLength <= tolerance:
+                self._horizontal[self._cell(box.ZMin)].append(i)
+            elif box.XLength <= tolerance and box.YLength <= tolerance:
+                self._vertical[self._cell(box.XMin), self._cell(box.YMin)].append(i)
+
+        order = sorted(range(len(self._boxes)), key=lambda i: self._boxes[i].ZMax)
+        self._tops = [self._boxes[i].ZMax for i in order]
+        self._by_top = order
+
+    def _cell(self, value: float) -> int:
+        return math.floor(value / self.tolerance)
+
+    def _cells(self, value: float) -> range:
+        """Return the cells of all values within the tolerance of a value."""
+        return range(self._cell(value - self.tolerance), self._cell(value + self.tolerance) + 1)
+
+    def _close(self, a: float, b: float) -> bool:
+        return abs(a - b) <= self.tolerance
+
+    def horizontal(
+        self,
+        *,
+        z: float | None = None,
+        x: float | None = None,
+        y: float | None = None,
+    ) -> list[Part.Edge]:
+        """Return the horizontal edges, optionally at a height and on a line along an axis.
+
+        Args:
+            z (float | None): Height of the edges.
+            x (float | None): X coordinate of edges parallel to the Y axis.
+            y (float | None): Y coordinate of edges parallel to the X axis.
+
+        """
+        if z is None:
+            candidates = [i for bucket in self._horizontal.values() for i in bucket]
+        else:
+            candidates = [i for cell in self._cells(z) for i in self._horizontal.get(cell, [])]
+        return [
+            self.edges[i]
+            for i in sorted(candidates)
+            if (z is None or self._close(self._boxes[i].ZMin, z))
+            and (x is None or self._on_line(self._boxes[i].XMin, self._boxes[i].XMax, x))
+            and (y is None or self._on_line(self._boxes[i].YMin, self._boxes[i].YMax, y))
+        ]
+
+    def _on_line(self, low: float, high: float, value: float) -> bool:
+        return self._close(low, value) and self._close(high, value)
+
+    def vertical(
+        self,
+        *,
+        length: float | None = None,
+        x: float | None = None,
+        y: float | None = None,
+    ) -> list[Part.Edge]:
+        """Return the vertical straight edges, optionally of a length and at an XY position.
+
+        Args:
+            length (float | None): Height difference between the ends of the edges.
+            x (float | None): X coordinate of the edges.
+            y (float | None): Y coordinate of the edges.
+
+        """
+        xcells = None if x is None else self._cells(x)
+        ycells = None if y is None else self._cells(y)
+        candidates = [
+            i
+            for (xcell, ycell), bucket in self._vertical.items()
+            if (xcells is None or xcell in xcells) and (ycells is None or ycell in ycells)
+            for i in bucket
+        ]
+        return [
+            self.edges[i]
+            for i in sorted(candidates)
+            if (length is None or self._close(self._boxes[i].ZLength, length))
+            and (x is None or self._close(self._boxes[i].XMin, x))
+            and (y is None or self._close(self._boxes[i].YMin, y))
+        ]
+
+    def below(self, z: float) -> list[Part.Edge]:
+        """Return the edges that are entirely below a height."""
+        end = bisect.bisect_left(self._tops, z - self.tolerance)
+        return [self.edges[i] for i in sorted(self._by_top[:end])]
+
+
+@memo.memoized
+def of(shape: Part.Shape) -> EdgeIndex:
+    """Return the edge index of a shape, shared by all queries on the shape during a recompute."""
+    return EdgeIndex(shape)
@@ -0,0 +1,137 @@
+"""Export Gridfinity objects to separate files, one object at a time.
+
+Only a single shape (and its mesh) is alive at any moment: objects without a shape, for example
+objects with `TransientShape` in a freshly opened document, are generated for the export and their
+shape is dropped again as soon as the file is written.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import FreeCAD as fc  # noqa: N813
+
+from . import complexity, preferences, stl
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    import Part
+
+FORMATS = ["STL", "STEP", "3MF"]
+
+UNSAFE_FILENAME_REGEX = re.compile(r"[^\w\-. ]")
+
+
+@dataclass
+class ExportStats:
+    """Statistics of an export run."""
+
+    files: list[Path]
+    seconds: float
+    peak_memory: int | None
+    """Peak resident memory of the process in bytes, None if unavailable on this platform."""
+
+    @property
+    def parts_per_minute(self) -> float:
+        """Throughput of the export."""
+        return len(self.files) / self.seconds * 60 if self.seconds > 0 else 0
+
+
+def peak_memory() -> int | None:
+    """Get the peak resident memory of the process in bytes."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _export_shape(shape: Part.Shape, path: Path, fmt: str, tolerances: tuple[float, float]) -> None:
+    if fmt == "STEP":
+        shape.exportStep(str(path))
+    elif fmt == "3MF":
+        stl.mesh_from_shape(shape, *tolerances).write(str(path))
+    else:
+        raise ValueError(f"Unknown export format '{fmt}', expected one of {', '.join(FORMATS)}")
+
+
+def _export_variants(
+    obj: fc.DocumentObject,
+    directory: Path,
+    fmt: str,
+    tolerances: tuple[float, float] | None,
+) -> list[Path]:
+    """Export every variant of a bin family to its own file."""
+    files = []
+    label = UNSAFE_FILENAME_REGEX.sub("_", obj.Label)
+    variants = complexity.full_shape(obj).childShapes()
+    for name, shape in zip(obj.VariantNames, variants):
+        path = directory / f"{label}_{UNSAFE_FILENAME_REGEX.sub('_', name)}.{fmt.lower()}"
+        variant_tolerances = tolerances or preferences.tessellation_tolerances(
+            shape.BoundBox.DiagonalLength,
+            preferences.smallest_feature_radius(obj),
+        )
+        if fmt == "STL":
+            stl.write_binary_stl(path, stl.facets_from_shape(shape, *variant_tolerances), name)
+        else:
+            _export_shape(shape, path, fmt, variant_tolerances)
+        files.append(path)
+    return files
+
+
+def export_objects(
+    objects: Iterable[fc.DocumentObject],
+    directory: Path,
+    fmt: str,
+    *,
+    tolerances: tuple[float, float] | None = None,
+) -> ExportStats:
+    """Export every object to its own file in a directory.
+
+    Bin families are exported to one file per variant, named after the object and the variant.
+
+    Args:
+        objects (Iterable[fc.DocumentObject]): Gridfinity objects to export.
+        directory (Path): Directory to write the files to, created if it does not exist.
+        fmt (str): One of `FORMATS`.
+        tolerances (tuple[float, float] | None): Linear deviation in mm and angular deflection in
+            degrees used for the mesh formats. Chosen from the size of every object if None.
+
+    Returns:
+        ExportStats: Written files, duration and peak memory.
+
+    """
+    fmt = fmt.upper()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}', expected one of {', '.join(FORMATS)}")
+    directory.mkdir(parents=True, exist_ok=True)
+
+    files = []
+    start = time.perf_counter()
+    for obj in objects:
+        if "VariantNames" in obj.PropertiesList:
+            files += _export_variants(obj, directory, fmt, tolerances)
+            fc.Console.PrintLog(f"Exported the variants of {obj.Label} to {directory}\n")
+            continue
+        path = directory / f"{UNSAFE_FILENAME_REGEX.sub('_', obj.Label)}.{fmt.lower()}"
+        obj_tolerances = tolerances or preferences.object_tessellation_tolerances(obj)
+        if fmt == "STL":
+            # cached triangulations are written directly, without generating the shape
+            stl.write_binary_stl(path, stl.object_facets(obj, *obj_tolerances), obj.Label)
+        else:
+            shape = complexity.full_shape(obj)
+            _export_shape(shape, path, fmt, obj_tolerances)
+            # drop the reference before the next object, so a generated shape can be freed
+            del shape
+        files.append(path)
+        fc.Console.PrintLog(f"Exported {obj.Label} to {path}\n")
+
+    return ExportStats(files, time.perf_counter() - start, peak_memory())
@@ -8,9 +8,11 @@ from typing import Literal
 import FreeCAD as fc  # noqa: N813
 import Part
 
-from . import const, utils
+from . import booleans, const, edge_index, memo, property_schema, shape_cache, utils
 from . import label_shelf as label_shelf_module
 from . import magnet_hole as magnet_hole_module
+from . import stacking_lip as stacking_lip_module
+from .property_schema import PropertySpec
 
 unitmm = fc.Units.Quantity("1 mm")
 zeromm = fc.Units.Quantity("0 mm")
@@ -21,67 +23,74 @@ SMALL_NUMBER = 0.01
 GridfinityLayout = list[list[bool]]
 
 
-def label_shelf_properties(obj: fc.DocumentObject, *, label_style_default: str) -> None:
-    """Add label shelf properties to an object.
-
-    Args:
-        obj (FreeCAD.DocumentObject): Document object.
-        label_style_default (str): Default label shelf style.
-
-    """
+LABEL_SHELF_PROPERTIES = (
     ## Gridfinity Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyEnumeration",
         "LabelShelfStyle",
         "Gridfinity",
         "Choose to have the label shelf Off or a Standard or Overhang style",
-    ).LabelShelfStyle = ["Off", "Standard", "Overhang"]
-    obj.LabelShelfStyle = label_style_default
-
-    obj.addProperty(
+        default=["Off", "Standard", "Overhang"],
+    ),
+    PropertySpec(
         "App::PropertyEnumeration",
         "LabelShelfPlacement",
         "Gridfinity",
         "Choose the Placement of the label shelf for each compartement",
-    ).LabelShelfPlacement = ["Center", "Full Width", "Left", "Right"]
-
+        default=["Center", "Full Width", "Left", "Right"],
+    ),
     ## Gridfinity Non Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "LabelShelfWidth",
         "GridfinityNonStandard",
         "Width of the Label Shelf, how far it sticks out from the wall <br> <br> default = 12 mm",
-    ).LabelShelfWidth = const.LABEL_SHELF_WIDTH
-
-    obj.addProperty(
+        default=const.LABEL_SHELF_WIDTH,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "LabelShelfLength",
         "GridfinityNonStandard",
         "Length of the Label Shelf, how long it is <br> <br> default = 42 mm",
-    ).LabelShelfLength = const.LABEL_SHELF_LENGTH
-
-    obj.addProperty(
+        default=const.LABEL_SHELF_LENGTH,
+    ),
+    PropertySpec(
         "App::PropertyAngle",
         "LabelShelfAngle",
         "GridfinityNonStandard",
         "Angle of the bottom part of the Label Shelf <br> <br> default = 45",
-    ).LabelShelfAngle = const.LABEL_SHELF_ANGLE
-
+        default=const.LABEL_SHELF_ANGLE,
+    ),
     ## Expert Only Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "LabelShelfStackingOffset",
         "zzExpertOnly",
-        "label shelf height decreased when stacking lip is enabled so bin above does not sit"
-        "uneven with one end on the label shelf <br> <br> default = 0.4 mm",
-    ).LabelShelfStackingOffset = const.LABEL_SHELF_STACKING_OFFSET
-
-    obj.addProperty(
+        (
+            "label shelf height decreased when stacking lip is enabled so bin above does not sit"
+            "uneven with one end on the label shelf <br> <br> default = 0.4 mm"
+        ),
+        default=const.LABEL_SHELF_STACKING_OFFSET,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "LabelShelfVerticalThickness",
         "zzExpertOnly",
         "Vertical Thickness of the Label Shelf <br> <br> default = 2 mm",
-    ).LabelShelfVerticalThickness = const.LABEL_SHELF_VERTICAL_THICKNESS
+        default=const.LABEL_SHELF_VERTICAL_THICKNESS,
+    ),
+)
+
+
+def label_shelf_properties(obj: fc.DocumentObject, *, label_style_default: str) -> None:
+    """Add label shelf properties to an object.
+
+    Args:
+        obj (FreeCAD.DocumentObject): Document object.
+        label_style_default (str): Default label shelf style.
+
+    """
+    property_schema.add_properties(obj, LABEL_SHELF_PROPERTIES, LabelShelfStyle=label_style_default)
 
 
 def make_label_shelf(obj: fc.DocumentObject, bintype: Literal["eco", "standard"]) -> Part.Shape:
@@ -132,7 +141,7 @@ def make_label_shelf(obj: fc.DocumentObject, bintype: Literal["eco", "standard"]
 
     if height > obj.UsableHeight:
         boundingbox = Part.makeBox(width, length, height, fc.Vector(0, 0, -obj.UsableHeight))
-        funcfuse = funcfuse.common(boundingbox)
+        funcfuse = booleans.common(funcfuse, boundingbox)
 
     funcfuse = utils.copy_in_grid(
         funcfuse,
@@ -166,47 +175,57 @@ def make_label_shelf(obj: fc.DocumentObject, bintype: Literal["eco", "standard"]
     return funcfuse
 
 
-def scoop_properties(obj: fc.DocumentObject, *, scoop_default: bool) -> None:
-    """Create bin compartments with the option for dividers.
-
-    Args:
-        obj (FreeCAD.DocumentObject): Document object.
-        scoop_default (bool): Default state of the scoop feature.
-
-    """
-    obj.addProperty(
+SCOOP_PROPERTIES = (
+    PropertySpec(
         "App::PropertyLength",
         "ScoopRadius",
         "GridfinityNonStandard",
         "Radius of the Scoop <br> <br> default = 21 mm",
-    ).ScoopRadius = const.SCOOP_RADIUS
-
-    obj.addProperty(
+        default=const.SCOOP_RADIUS,
+    ),
+    PropertySpec(
         "App::PropertyBool",
         "Scoop",
         "Gridfinity",
         "Toggle the Scoop fillet on or off",
-    ).Scoop = scoop_default
+    ),
+)
 
 
-def make_scoop(
-    obj: fc.DocumentObject,
-    *,
-    usable_height: None | fc.Units.Quantity = None,
-) -> Part.Shape:
-    """Create scoop.
+def scoop_properties(obj: fc.DocumentObject, *, scoop_default: bool) -> None:
+    """Create bin compartments with the option for dividers.
 
     Args:
-        obj: The object onto which to add the scoop.
-        usable_height: Override the obj's UsableHeight value (for EcoBins).
+        obj (FreeCAD.DocumentObject): Document object.
+        scoop_default (bool): Default state of the scoop feature.
 
-    EcoBins are constructed in such a way that when the scoop is added, the
-    proper usable height (for correct geometry) has to be provided separately.
+    """
+    property_schema.add_properties(obj, SCOOP_PROPERTIES, Scoop=scoop_default)
+
+
+def min_divider_height(obj: fc.DocumentObject, *, eco: bool = False) -> fc.Units.Quantity:
+    """Get the smallest height of dividers lower than the bin, lower dividers are raised to it.
 
+    The minimum of eco bins leaves out the stacking offset of the label shelf.
     """
-    if usable_height is None:
-        usable_height = obj.UsableHeight
+    divmin = obj.HeightUnitValue + obj.InsideFilletRadius + 0.05 * unitmm
+    if not eco:
+        divmin += obj.LabelShelfStackingOffset
+    return divmin
+
 
+def scoop_radius(
+    obj: fc.DocumentObject,
+    usable_height: fc.Units.Quantity,
+    x_divider_height: fc.Units.Quantity | None = None,
+) -> fc.Units.Quantity:
+    """Calculate the scoop radius that fits the dividers and the usable height.
+
+    The result is zero or negative if no scoop fits with the current parameters. The x divider
+    height is the one of the object if None.
+    """
+    if x_divider_height is None:
+        x_divider_height = obj.xDividerHeight
     scooprad1 = obj.ScoopRadius + unitmm
     scooprad2 = obj.ScoopRadius + unitmm
     scooprad3 = obj.ScoopRadius + unitmm
@@ -215,16 +234,37 @@ def make_scoop(
         obj.xDividers + 1
     )
 
-    xdivscoop = obj.xDividerHeight - obj.HeightUnitValue - obj.LabelShelfStackingOffset
+    xdivscoop = x_divider_height - obj.HeightUnitValue - obj.LabelShelfStackingOffset
 
-    if obj.ScoopRadius > xdivscoop and obj.xDividerHeight != 0:
+    if obj.ScoopRadius > xdivscoop and x_divider_height != 0:
         scooprad1 = xdivscoop - unitmm
     if obj.ScoopRadius > xcomp_w and obj.xDividers > 0:
         scooprad2 = xcomp_w - 2 * unitmm
     if obj.ScoopRadius > usable_height > 0:
         scooprad3 = usable_height - obj.LabelShelfStackingOffset
 
-    scooprad = min(obj.ScoopRadius, scooprad1, scooprad2, scooprad3)
+    return min(obj.ScoopRadius, scooprad1, scooprad2, scooprad3)
+
+
+def make_scoop(
+    obj: fc.DocumentObject,
+    *,
+    usable_height: None | fc.Units.Quantity = None,
+) -> Part.Shape:
+    """Create scoop.
+
+    Args:
+        obj: The object onto which to add the scoop.
+        usable_height: Override the obj's UsableHeight value (for EcoBins).
+
+    EcoBins are constructed in such a way that when the scoop is added, the
+    proper usable height (for correct geometry) has to be provided separately.
+
+    """
+    if usable_height is None:
+        usable_height = obj.UsableHeight
+
+    scooprad = scoop_radius(obj, usable_height)
 
     if scooprad <= 0:
         raise RuntimeError("Scoop could not be made due to bin selected parameters")
@@ -232,7 +272,7 @@ def make_scoop(
     v1 = fc.Vector(
         obj.xTotalWidth + obj.Clearance - obj.WallThickness,
         0,
-        -usable_height + scooprad,
+        -usable_height + scooprad,  # type: ignore[arg-type]
     )
     v2 = fc.Vector(
         obj.xTotalWidth + obj.Clearance - obj.WallThickness,
@@ -293,121 +333,133 @@ def make_scoop(
             ),
             fc.Vector(0, 0, -1),
         )
-        funcfuse = funcfuse.fuse(scoopbox)
+        funcfuse = booleans.fuse(funcfuse, scoopbox)
 
-        edges = [
-            edge
-            for edge in funcfuse.Edges
-            if abs(edge.Vertexes[0].Z - edge.Vertexes[1].Z) == usable_height
-            and edge.Vertexes[0].X == edge.Vertexes[1].X
-        ]
+        edges = edge_index.of(funcfuse).vertical(length=float(usable_height))
 
         funcfuse = funcfuse.makeFillet(stacking_lip_offset - 0.01 * unitmm, edges)
     else:  # No stacking lip: Trim scoop to stop it extending outside the rounded bin corners
-        bin_outside_shape = utils.create_rounded_rectangle(
-            obj.xTotalWidth,
-            obj.yTotalWidth,
-            0,
-            obj.BinOuterRadius,
-        ).translate(
-            fc.Vector(obj.xTotalWidth / 2 + obj.Clearance, obj.yTotalWidth / 2 + obj.Clearance),
-        )
-        bin_outside_solid = Part.Face(bin_outside_shape).extrude(
-            fc.Vector(0, 0, -obj.TotalHeight + obj.BaseProfileHeight),
-        )
-        funcfuse = funcfuse.common(bin_outside_solid)
+        funcfuse = booleans.common(funcfuse, bin_outside_solid(obj, bin_outside_wire(obj)))
 
     return funcfuse.translate(fc.Vector(-obj.xLocationOffset, -obj.yLocationOffset))
 
 
+def _fillet_profile(corner: fc.Vector, u: fc.Vector, v: fc.Vector, radius: float) -> Part.Face:
+    """Make the face a fillet removes from a right-angled corner.
+
+    Args:
+        corner (FreeCAD.Vector): Corner point.
+        u (FreeCAD.Vector): Unit vector along the first side of the corner.
+        v (FreeCAD.Vector): Unit vector along the second side of the corner.
+        radius (float): Fillet radius.
+
+    Returns:
+        Part.Face: Face between the corner and the fillet arc.
+
+    """
+    arc = radius - radius * math.sin(math.pi / 4)
+
+    v1 = corner
+    v2 = corner + v * radius
+    v_arc = corner + (u + v) * arc
+    v3 = corner + u * radius
+
+    lines = [
+        Part.LineSegment(v1, v2),
+        Part.Arc(v2, v_arc, v3),
+        Part.LineSegment(v3, v1),
+    ]
+
+    return utils.curve_to_face(lines)
+
+
 def _corner_fillets(
     obj: fc.DocumentObject,
     xcomp_width: float,
     ycomp_width: float,
 ) -> Part.Shape:
-    def make_fillet(rotation: float, translation: fc.Vector) -> Part.Shape:
-        radius = obj.InsideFilletRadius
-        arc = radius - radius * math.sin(math.pi / 4)
-
-        v1 = fc.Vector(0, 0)
-        v2 = fc.Vector(0, radius)
-        v_arc = fc.Vector(arc, arc)
-        v3 = fc.Vector(radius, 0)
-
-        lines = [
-            Part.LineSegment(v1, v2),
-            Part.Arc(v2, v_arc, v3),
-            Part.LineSegment(v3, v1),
-        ]
-
-        face = utils.curve_to_face(lines)
-        face.rotate(fc.Vector(0, 0, 0), fc.Vector(0, 0, 1), rotation)
-        face.translate(translation)
-        return face.extrude(fc.Vector(0, 0, -obj.TotalHeight))
-
-    bottom_right_fillet = make_fillet(
-        rotation=90,
-        translation=fc.Vector(
-            obj.Clearance + obj.WallThickness + xcomp_width,
-            obj.Clearance + obj.WallThickness,
-            -obj.LabelShelfStackingOffset if obj.StackingLip else 0,
-        ),
-    )
-    top_right_fillet = make_fillet(
-        rotation=180,
-        translation=fc.Vector(
-            obj.Clearance + obj.WallThickness + xcomp_width,
-            obj.Clearance + obj.WallThickness + ycomp_width,
-            -obj.LabelShelfStackingOffset if obj.StackingLip else 0,
-        ),
-    )
-    top_left_fillet = make_fillet(
-        rotation=270,
-        translation=fc.Vector(
-            obj.Clearance + obj.WallThickness,
-            obj.Clearance + obj.WallThickness + ycomp_width,
-            -obj.LabelShelfStackingOffset if obj.StackingLip else 0,
-        ),
-    )
-    bottom_left_fillet = make_fillet(
-        rotation=0,
-        translation=fc.Vector(
-            obj.Clearance + obj.WallThickness,
-            obj.Clearance + obj.WallThickness,
-            -obj.LabelShelfStackingOffset if obj.StackingLip else 0,
-        ),
+    radius = float(obj.InsideFilletRadius)
+    x, y = fc.Vector(1, 0), fc.Vector(0, 1)
+    corners = [
+        (fc.Vector(), x, y),
+        (fc.Vector(xcomp_width, 0), y, -x),
+        (fc.Vector(xcomp_width, ycomp_width), -x, -y),
+        (fc.Vector(0, ycomp_width), -y, x),
+    ]
+    start = fc.Vector(
+        obj.Clearance + obj.WallThickness,
+        obj.Clearance + obj.WallThickness,
+        -obj.LabelShelfStackingOffset if obj.StackingLip else 0,
     )
 
-    fillets_solid = utils.multi_fuse(
-        [bottom_right_fillet, top_right_fillet, top_left_fillet, bottom_left_fillet],
-    )
-    vec_list = [
-        fc.Vector(
-            x * (xcomp_width + obj.DividerThickness),
-            y * (ycomp_width + obj.DividerThickness),
+    # All fillet profiles are placed in 2D and extruded at once. The fillets of different
+    # compartments don't touch, so the compound can be cut without fusing them first.
+    faces = [
+        _fillet_profile(
+            start
+            + corner
+            + fc.Vector(
+                i * (xcomp_width + obj.DividerThickness),
+                j * (ycomp_width + obj.DividerThickness),
+            ),
+            u,
+            v,
+            radius,
         )
-        for x in range(obj.xDividers + 1)
-        for y in range(obj.yDividers + 1)
+        for i in range(obj.xDividers + 1)
+        for j in range(obj.yDividers + 1)
+        for corner, u, v in corners
     ]
-    fillets_solid = utils.copy_and_translate(fillets_solid, vec_list)
 
-    return fillets_solid
+    return Part.makeCompound(faces).extrude(fc.Vector(0, 0, -obj.TotalHeight))
+
+
+def _bottom_fillet(bottom: Part.Face, radius: float) -> Part.Shape | None:
+    """Make the material a fillet removes from the bottom edges of a solid.
+
+    The fillet profile is swept along the outline of the flat bottom face of the solid, starting at
+    the start of the outline.
+
+    Returns:
+        Part.Shape | None: The swept material, None if the sweep intersects itself because a
+            corner of the outline is tighter than the fillet.
+
+    """
+    outline = bottom.OuterWire
+    corner_radii = [
+        edge.Curve.Radius for edge in outline.Edges if isinstance(edge.Curve, Part.Circle)
+    ]
+    if corner_radii and radius >= min(corner_radii) - edge_index.TOLERANCE:
+        return None
+
+    edge = outline.OrderedEdges[0]
+    reversed_edge = edge.Orientation == "Reversed"
+    parameter = edge.LastParameter if reversed_edge else edge.FirstParameter
+    point = outline.OrderedVertexes[0].Point
+
+    inwards = edge.tangentAt(parameter).cross(fc.Vector(0, 0, 1)).normalize()
+    inside = point + inwards * (radius / 2)
+    if not bottom.isInside(inside, edge_index.TOLERANCE, True):  # noqa: FBT003
+        inwards = -inwards
+
+    profile = _fillet_profile(point, inwards, fc.Vector(0, 0, 1), radius)
+    sweep = outline.makePipe(profile)
+    return sweep if sweep.isValid() else None
 
 
 def _make_compartments_no_deviders(
     obj: fc.DocumentObject,
     func_fuse: Part.Shape,
 ) -> Part.Shape:
-    # Fillet Bottom edges
-    b_edges = []
-    for edge in func_fuse.Edges:
-        z0 = edge.Vertexes[0].Point.z
-        z1 = edge.Vertexes[1].Point.z
+    bottom = min(func_fuse.Faces, key=lambda face: face.BoundBox.ZMax)
+    fillet = None
+    if bottom.BoundBox.ZLength <= edge_index.TOLERANCE:
+        fillet = _bottom_fillet(bottom, float(obj.InsideFilletRadius))
+    if fillet is None:
+        # No flat bottom or no clean sweep along it, fillet the bottom edges instead.
+        return func_fuse.makeFillet(obj.InsideFilletRadius, edge_index.of(func_fuse).below(0))
 
-        if z0 < 0 and z1 < 0:
-            b_edges.append(edge)
-
-    return func_fuse.makeFillet(obj.InsideFilletRadius, b_edges)
+    return booleans.cut(func_fuse, fillet)
 
 
 def _make_compartments_with_deviders(
@@ -444,7 +496,7 @@ def _make_compartments_with_deviders(
             fc.Vector(0, 0, 1),
         )
         comp.translate(fc.Vector(xtranslate, 0))
-        xdiv = comp if xdiv is None else xdiv.fuse(comp)
+        xdiv = comp if xdiv is None else booleans.fuse(xdiv, comp)
         xtranslate += xcomp_w + obj.DividerThickness
 
     # dividers in y direction
@@ -459,53 +511,42 @@ def _make_compartments_with_deviders(
         )
 
         comp.translate(fc.Vector(0, ytranslate))
-        ydiv = comp if ydiv is None else ydiv.fuse(comp)
+        ydiv = comp if ydiv is None else booleans.fuse(ydiv, comp)
         ytranslate += ycomp_w + obj.DividerThickness
 
     if xdiv:
-        func_fuse = func_fuse.cut(xdiv)
+        func_fuse = booleans.cut(func_fuse, xdiv)
     if ydiv:
-        func_fuse = func_fuse.cut(ydiv)
+        func_fuse = booleans.cut(func_fuse, ydiv)
 
-    func_fuse = func_fuse.cut(_corner_fillets(obj, xcomp_w, ycomp_w))
+    func_fuse = booleans.cut(func_fuse, _corner_fillets(obj, xcomp_w, ycomp_w))
 
     return func_fuse
 
 
-def compartments_properties(obj: fc.DocumentObject, x_div_default: int, y_div_default: int) -> None:
-    """Create bin compartments with the option for dividers.
-
-    Args:
-        obj (FreeCAD.DocumentObject): Document object.
-        x_div_default (int): Default number of dividers.
-        y_div_default (int): Default number of dividers.
-
-    """
+COMPARTMENTS_PROPERTIES = (
     ## Gridfinity Parameters
-
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyInteger",
         "xDividers",
         "Gridfinity",
         "Number of Dividers in the x direction",
-    ).xDividers = x_div_default
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyInteger",
         "yDividers",
         "Gridfinity",
         "Number of Dividers in the y direction",
-    ).yDividers = y_div_default
-
+    ),
     ## Gridfinity Non Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "InsideFilletRadius",
         "GridfinityNonStandard",
         "inside fillet at the bottom of the bin <br> <br> default = 1.85 mm",
-    ).InsideFilletRadius = const.INSIDE_FILLET_RADIUS
-
-    obj.addProperty(
+        default=const.INSIDE_FILLET_RADIUS,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "DividerThickness",
         "GridfinityNonStandard",
@@ -513,24 +554,24 @@ def compartments_properties(obj: fc.DocumentObject, x_div_default: int, y_div_de
             "Thickness of the dividers, ideally an even multiple of printer layer width"
             "<br> <br> default = 1.2 mm"
         ),
-    ).DividerThickness = const.DIVIDER_THICKNESS
-
-    obj.addProperty(
+        default=const.DIVIDER_THICKNESS,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "xDividerHeight",
         "GridfinityNonStandard",
         "Custom Height of x dividers <br> <br> default = 0 mm = full height",
-    ).xDividerHeight = const.CUSTOM_X_DIVIDER_HEIGHT
-
-    obj.addProperty(
+        default=const.CUSTOM_X_DIVIDER_HEIGHT,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "yDividerHeight",
         "GridfinityNonStandard",
         "Custom Height of y dividers <br> <br> default = 0 mm = full height",
-    ).yDividerHeight = const.CUSTOM_Y_DIVIDER_HEIGHT
-
+        default=const.CUSTOM_Y_DIVIDER_HEIGHT,
+    ),
     ## Referance Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "UsableHeight",
         "ReferenceParameters",
@@ -539,6 +580,24 @@ def compartments_properties(obj: fc.DocumentObject, x_div_default: int, y_div_de
             "the amount of the bin that can be effectively used"
         ),
         read_only=True,
+    ),
+)
+
+
+def compartments_properties(obj: fc.DocumentObject, x_div_default: int, y_div_default: int) -> None:
+    """Create bin compartments with the option for dividers.
+
+    Args:
+        obj (FreeCAD.DocumentObject): Document object.
+        x_div_default (int): Default number of dividers.
+        y_div_default (int): Default number of dividers.
+
+    """
+    property_schema.add_properties(
+        obj,
+        COMPARTMENTS_PROPERTIES,
+        xDividers=x_div_default,
+        yDividers=y_div_default,
     )
 
 
@@ -554,9 +613,7 @@ def make_compartments(obj: fc.DocumentObject, bin_inside_solid: Part.Shape) -> P
 
     """
     ## Error Checks
-    divmin = (
-        obj.HeightUnitValue + obj.InsideFilletRadius + 0.05 * unitmm + obj.LabelShelfStackingOffset
-    )
+    divmin = min_divider_height(obj)
 
     if obj.xDividerHeight < divmin and obj.xDividerHeight != 0:
         obj.xDividerHeight = divmin
@@ -610,7 +667,7 @@ def _eco_bin_deviders(obj: fc.DocumentObject, xcomp_w: float, ycomp_w: float) ->
         )
         comp.translate(fc.Vector(xtranslate, 0))
 
-        assembly = comp if assembly is None else assembly.fuse(comp)
+        assembly = comp if assembly is None else booleans.fuse(assembly, comp)
         xtranslate += xcomp_w + obj.DividerThickness
 
     # dividers in y direction
@@ -627,7 +684,7 @@ def _eco_bin_deviders(obj: fc.DocumentObject, xcomp_w: float, ycomp_w: float) ->
             fc.Vector(0, 0, 1),
         )
         comp.translate(fc.Vector(0, ytranslate))
-        assembly = comp if assembly is None else assembly.fuse(comp)
+        assembly = comp if assembly is None else booleans.fuse(assembly, comp)
         ytranslate += ycomp_w + obj.DividerThickness
 
     return assembly.translate(fc.Vector(obj.xGridSize / 2, obj.yGridSize / 2))
@@ -637,7 +694,7 @@ def eco_error_check(obj: fc.DocumentObject) -> None:
     """Check if eco dividers are possible with current parameters."""
     # Divider Minimum Height
 
-    divmin = obj.HeightUnitValue + obj.InsideFilletRadius + 0.05 * unitmm
+    divmin = min_divider_height(obj, eco=True)
 
     if obj.xDividerHeight < divmin and obj.xDividerHeight != 0:
         obj.xDividerHeight = divmin
@@ -658,39 +715,38 @@ def eco_error_check(obj: fc.DocumentObject) -> None:
         )
 
 
-def eco_compartments_properties(obj: fc.DocumentObject) -> None:
-    """Create Eco bin dividers."""
+ECO_COMPARTMENTS_PROPERTIES = (
     ## Gridfinity Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "BaseWallThickness",
         "Gridfinity",
         "Wall thickness of the bin base",
-    ).BaseWallThickness = const.BASE_WALL_THICKNESS
-
-    obj.addProperty(
+        default=const.BASE_WALL_THICKNESS,
+    ),
+    PropertySpec(
         "App::PropertyInteger",
         "xDividers",
         "Gridfinity",
         "Number of Dividers in the x direction",
-    ).xDividers = const.ECO_X_DIVIDERS
-
-    obj.addProperty(
+        default=const.ECO_X_DIVIDERS,
+    ),
+    PropertySpec(
         "App::PropertyInteger",
         "yDividers",
         "Gridfinity",
         "Number of Dividers in the y direction",
-    ).yDividers = const.ECO_Y_DIVIDERS
-
+        default=const.ECO_Y_DIVIDERS,
+    ),
     ## Gridfinity Non Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "InsideFilletRadius",
         "GridfinityNonStandard",
         "inside fillet at the bottom of the bin <br> <br> default = 1.5 mm",
-    ).InsideFilletRadius = const.ECO_INSIDE_FILLET_RADIUS
-
-    obj.addProperty(
+        default=const.ECO_INSIDE_FILLET_RADIUS,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "DividerThickness",
         "GridfinityNonStandard",
@@ -698,24 +754,24 @@ def eco_compartments_properties(obj: fc.DocumentObject) -> None:
             "Thickness of the dividers, ideally an even multiple of layer width <br> <br> "
             "default = 0.8 mm"
         ),
-    ).DividerThickness = const.ECO_DIVIDER_THICKNESS
-
-    obj.addProperty(
+        default=const.ECO_DIVIDER_THICKNESS,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "xDividerHeight",
         "GridfinityNonStandard",
         "Custom Height of x dividers <br> <br> default = 0 mm = full height",
-    ).xDividerHeight = const.CUSTOM_X_DIVIDER_HEIGHT
-
-    obj.addProperty(
+        default=const.CUSTOM_X_DIVIDER_HEIGHT,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "yDividerHeight",
         "GridfinityNonStandard",
         "Custom Height of y dividers <br> <br> default = 0 mm = full height",
-    ).yDividerHeight = const.CUSTOM_Y_DIVIDER_HEIGHT
-
+        default=const.CUSTOM_Y_DIVIDER_HEIGHT,
+    ),
     ## Reference Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "UsableHeight",
         "ReferenceParameters",
@@ -724,7 +780,13 @@ def eco_compartments_properties(obj: fc.DocumentObject) -> None:
             "the amount of the bin that can be effectively used"
         ),
         read_only=True,
-    )
+    ),
+)
+
+
+def eco_compartments_properties(obj: fc.DocumentObject) -> None:
+    """Create Eco bin dividers."""
+    property_schema.add_properties(obj, ECO_COMPARTMENTS_PROPERTIES)
     ## Hidden Parameters
     obj.setEditorMode("ScrewHoles", 2)
 
@@ -827,12 +889,12 @@ def make_eco_compartments(
         obj.BaseProfileTopChamfer + obj.BaseWallThickness - tp_chf_offset,
         v_chf_rad,
     )
-    assembly = bottom_chamfer.multiFuse([vertical_section, top_chamfer])
+    assembly = booleans.multi_fuse(bottom_chamfer, [vertical_section, top_chamfer])
 
     eco_base_cut = utils.copy_in_layout(assembly, layout, obj.xGridSize, obj.yGridSize)
     eco_base_cut.translate(fc.Vector(obj.xGridSize / 2, obj.yGridSize / 2))
 
-    func_fuse = bin_inside_solid.fuse(eco_base_cut)
+    func_fuse = booleans.fuse(bin_inside_solid, eco_base_cut)
 
     trim_tanslation = fc.Vector(
         obj.xTotalWidth / 2 + obj.Clearance,
@@ -854,9 +916,9 @@ def make_eco_compartments(
         obj.BinOuterRadius,
     ).translate(trim_tanslation)
 
-    outer_trim2 = outer_trim2.cut(outer_trim1)
+    outer_trim2 = booleans.cut(outer_trim2, outer_trim1)
 
-    func_fuse = func_fuse.cut(outer_trim2)
+    func_fuse = booleans.cut(func_fuse, outer_trim2)
 
     xcomp_w = (obj.xTotalWidth - obj.WallThickness * 2 - obj.xDividers * obj.DividerThickness) / (
         obj.xDividers + 1
@@ -865,70 +927,64 @@ def make_eco_compartments(
         obj.yDividers + 1
     )
     if obj.xDividers > 0 or obj.yDividers > 0:
-        func_fuse = func_fuse.cut(_eco_bin_deviders(obj, xcomp_w, ycomp_w))
+        func_fuse = booleans.cut(func_fuse, _eco_bin_deviders(obj, xcomp_w, ycomp_w))
 
-    func_fuse = func_fuse.cut(_corner_fillets(obj, xcomp_w, ycomp_w))
+    func_fuse = booleans.cut(func_fuse, _corner_fillets(obj, xcomp_w, ycomp_w))
 
     return func_fuse.translate(fc.Vector(-obj.xLocationOffset, -obj.yLocationOffset))
 
 
-def bin_base_values_properties(obj: fc.DocumentObject) -> None:
-    """Create BinBaseValues.
-
-    Args:
-        obj (FreeCAD.DocumentObject): Document object
-
-    """
+BIN_BASE_VALUES_PROPERTIES = (
     ## Expert Only Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "BaseProfileBottomChamfer",
         "zzExpertOnly",
         "height of chamfer in bottom of bin base profile <br> <br> default = 0.8 mm",
+        default=const.BIN_BASE_BOTTOM_CHAMFER,
         read_only=True,
-    ).BaseProfileBottomChamfer = const.BIN_BASE_BOTTOM_CHAMFER
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BaseProfileVerticalSection",
         "zzExpertOnly",
         "Height of the vertical section in bin base profile",
+        default=const.BIN_BASE_VERTICAL_SECTION,
         read_only=True,
-    ).BaseProfileVerticalSection = const.BIN_BASE_VERTICAL_SECTION
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BaseProfileTopChamfer",
         "zzExpertOnly",
         "Height of the top chamfer in the bin base profile",
+        default=const.BIN_BASE_TOP_CHAMFER,
         read_only=True,
-    ).BaseProfileTopChamfer = const.BIN_BASE_TOP_CHAMFER
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BinOuterRadius",
         "zzExpertOnly",
         "Outer radius of the bin",
+        default=const.BIN_OUTER_RADIUS,
         read_only=True,
-    ).BinOuterRadius = const.BIN_OUTER_RADIUS
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BinVerticalRadius",
         "zzExpertOnly",
         "Radius of the base profile Vertical section",
+        default=const.BIN_BASE_VERTICAL_RADIUS,
         read_only=True,
-    ).BinVerticalRadius = const.BIN_BASE_VERTICAL_RADIUS
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "BinBottomRadius",
         "zzExpertOnly",
         "bottom of bin corner radius",
+        default=const.BIN_BASE_BOTTOM_RADIUS,
         read_only=True,
-    ).BinBottomRadius = const.BIN_BASE_BOTTOM_RADIUS
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "Clearance",
         "zzExpertOnly",
@@ -937,22 +993,28 @@ def bin_base_values_properties(obj: fc.DocumentObject) -> None:
             "gives some clearance between bins <br> <br>"
             "default = 0.25 mm"
         ),
-    ).Clearance = const.CLEARANCE
-
+        default=const.CLEARANCE,
+    ),
     ## Reference Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "BaseProfileHeight",
         "ReferenceParameters",
         "Height of the Gridfinity Base Profile, bottom of the bin",
         read_only=True,
-    )
+        expression="BaseProfileBottomChamfer + BaseProfileVerticalSection + BaseProfileTopChamfer",
+    ),
+)
 
-    ## Expressions
-    obj.setExpression(
-        "BaseProfileHeight",
-        "BaseProfileBottomChamfer + BaseProfileVerticalSection + BaseProfileTopChamfer",
-    )
+
+def bin_base_values_properties(obj: fc.DocumentObject) -> None:
+    """Create BinBaseValues.
+
+    Args:
+        obj (FreeCAD.DocumentObject): Document object
+
+    """
+    property_schema.add_properties(obj, BIN_BASE_VALUES_PROPERTIES)
 
 
 def make_complex_bin_base(
@@ -988,32 +1050,51 @@ def make_complex_bin_base(
         - 2 * baseplate_size_adjustment
     )
 
-    bottom_chamfer = utils.rounded_rectangle_chamfer(
-        x_bt_cmf_width,
-        y_bt_cmf_width,
-        -obj.TotalHeight,
-        obj.BaseProfileBottomChamfer,
-        obj.BinBottomRadius,
-    )
+    def build() -> Part.Shape:
+        bottom_chamfer = utils.rounded_rectangle_chamfer(
+            x_bt_cmf_width,
+            y_bt_cmf_width,
+            0,
+            obj.BaseProfileBottomChamfer,
+            obj.BinBottomRadius,
+        )
 
-    vertical_section = utils.rounded_rectangle_extrude(
-        x_vert_width,
-        y_vert_width,
-        -obj.TotalHeight + obj.BaseProfileBottomChamfer,
-        obj.BaseProfileVerticalSection,
-        obj.BinVerticalRadius,
-    )
-    assembly = bottom_chamfer.fuse(vertical_section)
+        vertical_section = utils.rounded_rectangle_extrude(
+            x_vert_width,
+            y_vert_width,
+            obj.BaseProfileBottomChamfer,
+            obj.BaseProfileVerticalSection,
+            obj.BinVerticalRadius,
+        )
 
-    top_chamfer = utils.rounded_rectangle_chamfer(
-        x_vert_width,
-        y_vert_width,
-        -obj.TotalHeight + obj.BaseProfileBottomChamfer + obj.BaseProfileVerticalSection,
-        obj.BaseProfileTopChamfer,
-        obj.BinVerticalRadius,
-    )
+        top_chamfer = utils.rounded_rectangle_chamfer(
+            x_vert_width,
+            y_vert_width,
+            obj.BaseProfileBottomChamfer + obj.BaseProfileVerticalSection,
+            obj.BaseProfileTopChamfer,
+            obj.BinVerticalRadius,
+        )
 
-    assembly = bottom_chamfer.multiFuse([vertical_section, top_chamfer])
+        return booleans.multi_fuse(bottom_chamfer, [vertical_section, top_chamfer])
+
+    # The base of a single grid cell is shared by all bins with the same base profile.
+    key = "-".join(
+        repr(float(value))
+        for value in (
+            x_bt_cmf_width,
+            y_bt_cmf_width,
+            x_vert_width,
+            y_vert_width,
+            obj.BaseProfileBottomChamfer,
+            obj.BaseProfileVerticalSection,
+            obj.BaseProfileTopChamfer,
+            obj.BinBottomRadius,
+            obj.BinVerticalRadius,
+            booleans.fuzzy_value(),
+        )
+    )
+    assembly = shape_cache.cached("bin_base_cell", key, build)
+    assembly = assembly.translated(fc.Vector(0, 0, -obj.TotalHeight))
 
     fuse_total = utils.copy_in_layout(assembly, layout, obj.xGridSize, obj.yGridSize)
 
@@ -1022,15 +1103,21 @@ def make_complex_bin_base(
     )
 
 
-def blank_bin_recessed_top_properties(obj: fc.DocumentObject) -> None:
-    """Create blank bin recessed top section."""
+BLANK_BIN_RECESSED_TOP_PROPERTIES = (
     ## Gridfinity Non Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "RecessedTopDepth",
         "GridfinityNonStandard",
         "height per unit <br> <br> default = 0 mm",
-    ).RecessedTopDepth = const.RECESSED_TOP_DEPTH
+        default=const.RECESSED_TOP_DEPTH,
+    ),
+)
+
+
+def blank_bin_recessed_top_properties(obj: fc.DocumentObject) -> None:
+    """Create blank bin recessed top section."""
+    property_schema.add_properties(obj, BLANK_BIN_RECESSED_TOP_PROPERTIES)
 
 
 def make_blank_bin_recessed_top(obj: fc.DocumentObject, bin_inside_shape: Part.Wire) -> Part.Shape:
@@ -1040,52 +1127,61 @@ def make_blank_bin_recessed_top(obj: fc.DocumentObject, bin_inside_shape: Part.W
     return fuse_total.translate(fc.Vector(-obj.xLocationOffset, -obj.yLocationOffset))
 
 
-def bin_bottom_holes_properties(obj: fc.DocumentObject, *, magnet_holes_default: bool) -> None:
-    """Create bin solid mid section.
-
-    Args:
-        obj (FreeCAD.DocumentObject): Document object
-        magnet_holes_default (bool): does the object have magnet holes
-
-    """
-    magnet_hole_module.add_properties(
-        obj,
-        remove_channel=True,
-        chamfer=False,
-        magnet_holes_default=magnet_holes_default,
-    )
-
+BIN_BOTTOM_HOLES_PROPERTIES = (
     ## Gridfinity Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyBool",
         "ScrewHoles",
         "Gridfinity",
         "Toggle the screw holes on or off",
-    ).ScrewHoles = const.SCREW_HOLES
-
+        default=const.SCREW_HOLES,
+    ),
     ## Gridfinity Non Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "SequentialBridgingLayerHeight",
         "GridfinityNonStandard",
-        "Layer Height that you print in for optimal print results,"
-        "used for  screw holes bridging with magnet holes also on",
-    ).SequentialBridgingLayerHeight = const.SEQUENTIAL_BRIDGING_LAYER_HEIGHT
-
-    obj.addProperty(
+        (
+            "Layer Height that you print in for optimal print results,"
+            "used for  screw holes bridging with magnet holes also on"
+        ),
+        default=const.SEQUENTIAL_BRIDGING_LAYER_HEIGHT,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "ScrewHoleDiameter",
         "GridfinityNonStandard",
-        "Diameter of Screw Holes, used to put screws in bin to secure in place"
-        "<br> <br> default = 3.0 mm",
-    ).ScrewHoleDiameter = const.SCREW_HOLE_DIAMETER
-
-    obj.addProperty(
+        (
+            "Diameter of Screw Holes, used to put screws in bin to secure in place"
+            "<br> <br> default = 3.0 mm"
+        ),
+        default=const.SCREW_HOLE_DIAMETER,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "ScrewHoleDepth",
         "GridfinityNonStandard",
         "Depth of Screw Holes <br> <br> default = 6.0 mm",
-    ).ScrewHoleDepth = const.SCREW_HOLE_DEPTH
+        default=const.SCREW_HOLE_DEPTH,
+    ),
+)
+
+
+def bin_bottom_holes_properties(obj: fc.DocumentObject, *, magnet_holes_default: bool) -> None:
+    """Create bin solid mid section.
+
+    Args:
+        obj (FreeCAD.DocumentObject): Document object
+        magnet_holes_default (bool): does the object have magnet holes
+
+    """
+    magnet_hole_module.add_properties(
+        obj,
+        remove_channel=True,
+        chamfer=False,
+        magnet_holes_default=magnet_holes_default,
+    )
+    property_schema.add_properties(obj, BIN_BOTTOM_HOLES_PROPERTIES)
 
 
 def _make_holes_interface(obj: fc.DocumentObject) -> Part.Shape:
@@ -1121,7 +1217,28 @@ def _make_holes_interface(obj: fc.DocumentObject) -> Part.Shape:
     sq1_1 = Part.Face(w1)
     sq1_1 = sq1_1.extrude(fc.Vector(0, 0, sqbr1_depth))
 
-    return sq1_1.fuse(b1)
+    return booleans.fuse(sq1_1, b1)
+
+
+# Parameters the holes of a grid cell are made from.
+_HOLE_PARAMETERS = (
+    "MagnetHoles",
+    "MagnetHolesShape",
+    "MagnetHoleDiameter",
+    "MagnetHoleDepth",
+    "MagnetHoleChamfer",
+    "CrushRibsCount",
+    "CrushRibsWaviness",
+    "MagnetRemoveChannel",
+    "MagnetHoleDistanceFromEdge",
+    "ScrewHoles",
+    "ScrewHoleDiameter",
+    "ScrewHoleDepth",
+    "SequentialBridgingLayerHeight",
+    "Baseplate",
+    "xGridSize",
+    "yGridSize",
+)
 
 
 def make_bin_bottom_holes(
@@ -1129,24 +1246,32 @@ def make_bin_bottom_holes(
     layout: GridfinityLayout,
 ) -> Part.Shape:
     """Make bin bottom holes."""
-    shapes = []
-    if obj.MagnetHoles:
-        shapes.append(magnet_hole_module.from_obj(obj))
-    if obj.ScrewHoles:
-        shapes.append(Part.makeCylinder(obj.ScrewHoleDiameter / 2, obj.ScrewHoleDepth))
-    if obj.ScrewHoles and obj.MagnetHoles:
-        shapes.append(_make_holes_interface(obj))
-    shape = utils.multi_fuse(shapes)
-
-    x_pos = obj.xGridSize / 2 - obj.MagnetHoleDistanceFromEdge
-    y_pos = obj.yGridSize / 2 - obj.MagnetHoleDistanceFromEdge
-    shape = utils.copy_and_translate(shape, utils.corners(x_pos, y_pos, -obj.TotalHeight))
-
-    if obj.MagnetHoles and obj.MagnetRemoveChannel:
-        remove_channel = magnet_hole_module.remove_channel(obj).translate(
-            fc.Vector(0, 0, -obj.TotalHeight),
-        )
-        shape = shape.fuse(remove_channel)
+
+    def build() -> Part.Shape:
+        shapes = []
+        if obj.MagnetHoles:
+            shapes.append(magnet_hole_module.from_obj(obj))
+        if obj.ScrewHoles:
+            shapes.append(Part.makeCylinder(obj.ScrewHoleDiameter / 2, obj.ScrewHoleDepth))
+        if obj.ScrewHoles and obj.MagnetHoles:
+            shapes.append(_make_holes_interface(obj))
+        shape = utils.multi_fuse(shapes)
+
+        x_pos = obj.xGridSize / 2 - obj.MagnetHoleDistanceFromEdge
+        y_pos = obj.yGridSize / 2 - obj.MagnetHoleDistanceFromEdge
+        shape = utils.copy_and_translate(shape, utils.corners(x_pos, y_pos, 0))
+
+        if obj.MagnetHoles and obj.MagnetRemoveChannel:
+            shape = booleans.fuse(shape, magnet_hole_module.remove_channel(obj))
+        return shape
+
+    # The holes of a single grid cell are shared by all bins with the same hole parameters.
+    key = "-".join(
+        [f"{name}={getattr(obj, name, None)!s}" for name in _HOLE_PARAMETERS]
+        + [repr(booleans.fuzzy_value())],
+    )
+    shape = shape_cache.cached("bin_hole_cell", key, build)
+    shape = shape.translated(fc.Vector(0, 0, -obj.TotalHeight))
 
     shape = utils.copy_in_layout(shape, layout, obj.xGridSize, obj.yGridSize)
     shape.translate(
@@ -1170,6 +1295,7 @@ def calc_stacking_lip_offset(obj: fc.DocumentObject) -> fc.Units.Quantity:
     )
 
 
+@memo.memoized
 def _stacking_lip_profile(obj: fc.DocumentObject) -> Part.Wire:
     """Create stacking lip profile wire."""
     ## Calculated Values
@@ -1216,150 +1342,152 @@ def _stacking_lip_profile(obj: fc.DocumentObject) -> Part.Wire:
     return stacking_lip_profile
 
 
-def stacking_lip_properties(
-    obj: fc.DocumentObject,
-    *,
-    stacking_lip_default: bool,
-) -> None:
-    """Create bin stacking lip.
-
-    Args:
-        obj (FreeCAD.DocumentObject): Document object
-        stacking_lip_default (bool): stacking lip on or off
-
-    """
+STACKING_LIP_PROPERTIES = (
     ## Gridfinity Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyBool",
         "StackingLip",
         "Gridfinity",
         "Toggle the stacking lip on or off",
-    ).StackingLip = stacking_lip_default
-
+    ),
     ## Gridfinity Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyBool",
         "StackingLipThinStyle",
         "Gridfinity",
         "Toggle the thin style stacking lip on or off",
-    ).StackingLipThinStyle = const.STACKING_LIP_THIN_STYLE
-
+        default=const.STACKING_LIP_THIN_STYLE,
+    ),
     ## Expert Only Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "StackingLipTopLedge",
         "zzExpertOnly",
         "Top Ledge of the stacking lip <br> <br> default = 0.4 mm",
+        default=const.STACKING_LIP_TOP_LEDGE,
         read_only=True,
-    ).StackingLipTopLedge = const.STACKING_LIP_TOP_LEDGE
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "StackingLipTopChamfer",
         "zzExpertOnly",
         "Top Chamfer of the Stacking lip",
         read_only=True,
-    )
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "StackingLipBottomChamfer",
         "zzExpertOnly",
         "Bottom Chamfer of the Stacking lip<br> <br> default = 0.7 mm",
+        default=const.STACKING_LIP_BOTTOM_CHAMFER,
         read_only=True,
-    ).StackingLipBottomChamfer = const.STACKING_LIP_BOTTOM_CHAMFER
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "StackingLipVerticalSection",
         "zzExpertOnly",
         "vertical section of the Stacking lip<br> <br> default = 1.8 mm",
+        default=const.STACKING_LIP_VERTICAL_SECTION,
         read_only=True,
-    ).StackingLipVerticalSection = const.STACKING_LIP_VERTICAL_SECTION
+    ),
+)
 
 
-def make_stacking_lip(obj: fc.DocumentObject, bin_outside_shape: Part.Wire) -> Part.Shape:
-    """Create stacking lip based on input bin shape.
+def stacking_lip_properties(
+    obj: fc.DocumentObject,
+    *,
+    stacking_lip_default: bool,
+) -> None:
+    """Create bin stacking lip.
 
     Args:
-        obj (FreeCAD.DocumentObject): DocumentObject
-        bin_outside_shape (Part.Wire): exterior wall of the bin
+        obj (FreeCAD.DocumentObject): Document object
+        stacking_lip_default (bool): stacking lip on or off
 
     """
-    wire = _stacking_lip_profile(obj)
-    stacking_lip = Part.Wire(bin_outside_shape).makePipe(wire)
-    stacking_lip = Part.makeSolid(stacking_lip)
-    stacking_lip = stacking_lip.translate(
-        fc.Vector(-obj.xLocationOffset, -obj.yLocationOffset),
-    )
-
-    return stacking_lip
+    property_schema.add_properties(obj, STACKING_LIP_PROPERTIES, StackingLip=stacking_lip_default)
 
 
-def bin_solid_mid_section_properties(
-    obj: fc.DocumentObject,
-    default_height_units: int,
-    default_wall_thickness: float,
-) -> None:
-    """Create bin solid mid section and add properties.
+def make_stacking_lip(obj: fc.DocumentObject, bin_outside_shape: Part.Wire) -> Part.Shape:
+    """Create stacking lip based on input bin shape.
 
     Args:
-        obj (FreeCAD.DocumentObject): Document object
-        default_height_units (int): height units of the bin at generation
-        default_wall_thickness (int): Wall thickness of the bin at generation
+        obj (FreeCAD.DocumentObject): DocumentObject
+        bin_outside_shape (Part.Wire): exterior wall of the bin
 
     """
+    stacking_lip = stacking_lip_module.make(bin_outside_shape, _stacking_lip_profile(obj))
+    return stacking_lip.translated(fc.Vector(-obj.xLocationOffset, -obj.yLocationOffset))
+
+
+BIN_SOLID_MID_SECTION_PROPERTIES = (
     ## Gridfinity Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyInteger",
         "HeightUnits",
         "Gridfinity",
         "Height of the bin in units, each is 7 mm",
-    ).HeightUnits = default_height_units
-
+    ),
     ## Gridfinity Non Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "CustomHeight",
         "GridfinityNonStandard",
         "total height of the bin using the custom height instead of increments of 7 mm",
-    ).CustomHeight = 42
-
-    obj.addProperty(
+        default=42,
+    ),
+    PropertySpec(
         "App::PropertyBool",
         "NonStandardHeight",
         "GridfinityNonStandard",
         "use a custom height if selected",
-    ).NonStandardHeight = False
-
-    obj.addProperty(
+        default=False,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "WallThickness",
         "GridfinityNonStandard",
         "for stacking lip",
-    ).WallThickness = default_wall_thickness
-
+    ),
     ## Reference Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "TotalHeight",
         "ReferenceParameters",
         "total height of the bin",
         read_only=True,
-    )
+        expression="NonStandardHeight == 1 ? CustomHeight : (HeightUnits * HeightUnitValue)",
+    ),
     ## Expert Only Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "HeightUnitValue",
         "zzExpertOnly",
         "height per unit, default is 7mm",
+        default=const.HEIGHT_UNIT_VALUE,
         read_only=True,
-    ).HeightUnitValue = const.HEIGHT_UNIT_VALUE
+    ),
+)
 
-    ## Expressions
-    obj.setExpression(
-        "TotalHeight",
-        "NonStandardHeight == 1 ? CustomHeight : (HeightUnits * HeightUnitValue)",
+
+def bin_solid_mid_section_properties(
+    obj: fc.DocumentObject,
+    default_height_units: int,
+    default_wall_thickness: float,
+) -> None:
+    """Create bin solid mid section and add properties.
+
+    Args:
+        obj (FreeCAD.DocumentObject): Document object
+        default_height_units (int): height units of the bin at generation
+        default_wall_thickness (int): Wall thickness of the bin at generation
+
+    """
+    property_schema.add_properties(
+        obj,
+        BIN_SOLID_MID_SECTION_PROPERTIES,
+        HeightUnits=default_height_units,
+        WallThickness=default_wall_thickness,
     )
 
 
@@ -1371,9 +1499,27 @@ def make_bin_solid_mid_section(obj: fc.DocumentObject, bin_outside_shape: Part.W
         bin_outside_shape (Part.Wire): shape of the bin
 
     """
-    face = Part.Face(bin_outside_shape)
+    fuse_total = bin_outside_solid(obj, bin_outside_shape)
+    return fuse_total.translated(fc.Vector(-obj.xLocationOffset, -obj.yLocationOffset))
+
+
+@memo.memoized
+def bin_outside_wire(obj: fc.DocumentObject) -> Part.Wire:
+    """Return the outside wall of a rectangular bin, at the top of the bin base."""
+    bin_outside_shape = utils.create_rounded_rectangle(
+        obj.xTotalWidth,
+        obj.yTotalWidth,
+        0,
+        obj.BinOuterRadius,
+    )
+    bin_outside_shape.translate(
+        fc.Vector(obj.xTotalWidth / 2 + obj.Clearance, obj.yTotalWidth / 2 + obj.Clearance),
+    )
+    return bin_outside_shape
 
-    fuse_total = face.extrude(fc.Vector(0, 0, -obj.TotalHeight + obj.BaseProfileHeight))
-    fuse_total = fuse_total.translate(fc.Vector(-obj.xLocationOffset, -obj.yLocationOffset))
 
-    return fuse_total
+@memo.memoized
+def bin_outside_solid(obj: fc.DocumentObject, bin_outside_shape: Part.Wire) -> Part.Shape:
+    """Extrude the outside wall of a bin down to the top of the bin base."""
+    face = Part.Face(bin_outside_shape)
+    return face.extrude(fc.Vector(0, 0, -obj.TotalHeight + obj.BaseProfileHeight))
@@ -2,13 +2,29 @@
 
 # ruff: noqa: D101, D102, D107
 
+import itertools
+import math
 from abc import abstractmethod
 
 import FreeCAD as fc  # noqa: N813
 import Part
 
 from . import baseplate_feature_construction as baseplate_feat
-from . import check_version, const, grid_initial_layout, label_shelf, utils
+from . import (
+    booleans,
+    check_version,
+    complexity,
+    const,
+    grid_initial_layout,
+    height_family,
+    label_shelf,
+    memo,
+    property_schema,
+    recompute,
+    shape_cache,
+    utils,
+    validation,
+)
 from . import feature_construction as feat
 from .custom_shape_features import (
     clean_up_layout,
@@ -16,14 +32,20 @@ from .custom_shape_features import (
     custom_shape_stacking_lip,
     custom_shape_trim,
     cut_outside_shape,
+    trimmed_rounded_solid,
     vertical_edge_fillet,
     vertical_edge_fillet_with_concave_edges,
 )
+from .property_schema import PropertySpec
 from .version import __version__
 
 unitmm = fc.Units.Quantity("1 mm")
 
 
+def _has_base_feature(obj: fc.DocumentObject) -> bool:
+    return hasattr(obj, "BaseFeature") and obj.BaseFeature is not None
+
+
 class FoundationGridfinity:
     def __init__(self, obj: fc.DocumentObject) -> None:
         obj.addProperty(
@@ -33,30 +55,105 @@ class FoundationGridfinity:
             "Gridfinity Workbench Version",
             read_only=True,
         ).version = __version__
+        self._document_properties(obj)
 
         obj.Proxy = self
 
+    @staticmethod
+    def _document_properties(obj: fc.DocumentObject) -> None:
+        """Add properties controlling how the object is stored in the document."""
+        if not hasattr(obj, "TransientShape"):
+            obj.addProperty(
+                "App::PropertyBool",
+                "TransientShape",
+                "zzExpertOnly",
+                "Don't save the shape in the document file, regenerate it when the document is "
+                "opened. Regenerated shapes are restored from a local shape cache when possible."
+                "<br> <br> default = False",
+            ).TransientShape = False
+        if not hasattr(obj, "BooleanFuzzyValue"):
+            obj.addProperty(
+                "App::PropertyFloat",
+                "BooleanFuzzyValue",
+                "zzExpertOnly",
+                "Treat sub-shapes closer than this distance in mm as coincident in boolean "
+                "operations, 0 for exact boolean operations. A negative value uses the workbench "
+                "preference.<br> <br> default = -1",
+            ).BooleanFuzzyValue = -1
+
+    def onChanged(self, obj: fc.DocumentObject, prop: str) -> None:  # noqa: N802
+        if prop == "TransientShape":
+            obj.setPropertyStatus("Shape", "Transient" if obj.TransientShape else "-Transient")
+
     def onDocumentRestored(self, obj: fc.DocumentObject) -> None:  # noqa: N802
-        check_version.migrate_object_version(obj)
+        geometry_changed = check_version.migrate_object_version(obj)
+        self._document_properties(obj)
+
+        if obj.TransientShape:
+            obj.setPropertyStatus("Shape", "Transient")
+            if not geometry_changed and obj.Shape.isNull() and not _has_base_feature(obj):
+                cached_shape = shape_cache.load(shape_cache.fingerprint(obj))
+                if cached_shape is not None:
+                    # assigning a shape outside of execute also sets the object placement
+                    cached_shape.Placement = obj.Placement
+                    obj.Shape = cached_shape
+
+        # The stored shape is still valid for property-only migrations, skip the rebuild for those.
+        if geometry_changed or obj.Shape.isNull():
+            check_version.schedule_recompute(obj)
 
     def execute(self, fp: Part.Feature) -> None:
-        gridfinity_shape = self.generate_gridfinity_shape(fp)
-
-        if hasattr(fp, "BaseFeature") and fp.BaseFeature is not None:
+        if recompute.defer(fp):
+            return
+
+        # Fail before building any geometry if the parameters can't produce a shape.
+        validation.raise_on_errors(self.validate(fp))
+
+        gridfinity_shape = None
+        if not _has_base_feature(fp):
+            # Objects with identical parameters share the shape generated by the first of them.
+            key = shape_cache.fingerprint(fp)
+            gridfinity_shape = shape_cache.shared_shape(fp, key)
+            if gridfinity_shape is not None:
+                fc.Console.PrintLog(f"{fp.Name}: reusing the shape of an identical object\n")
+
+        if gridfinity_shape is None and complexity.use_preview(fp):
+            fp.Shape = complexity.preview_shape(fp)
+            return
+
+        if gridfinity_shape is None:
+            with memo.scope() as sub_shapes, booleans.object_options(fp):
+                gridfinity_shape = self.generate_gridfinity_shape(fp)
+            if sub_shapes.saved:
+                fc.Console.PrintLog(
+                    f"{fp.Name}: built {sub_shapes.builds} sub-shapes, "
+                    f"saved {sub_shapes.saved} duplicate builds\n",
+                )
+            if not _has_base_feature(fp):
+                shape_cache.register(fp, key)
+                if fp.TransientShape:
+                    shape_cache.store(key, gridfinity_shape)
+
+        if _has_base_feature(fp):
             # we're inside a PartDesign Body, thus need to fuse with the base feature
 
             gridfinity_shape.Placement = (
                 fp.Placement
             )  # ensure the bin is placed correctly before fusing
 
-            result_shape = fp.BaseFeature.Shape.fuse(gridfinity_shape)
-            result_shape.transformShape(fp.Placement.inverse().toMatrix(), copy=True)
+            with booleans.object_options(fp):
+                result_shape = booleans.fuse(fp.BaseFeature.Shape, gridfinity_shape)
+            result_shape.transformShape(fp.Placement.inverse().toMatrix(), copy=True)  # type: ignore[call-arg]
 
             fp.Shape = result_shape
 
         else:
             fp.Shape = gridfinity_shape
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:  # noqa: ARG002
+        """Check the parameters of the object, see the `validation` module."""
+        return []
+
     @abstractmethod
     def generate_gridfinity_shape(self, fp: fc.DocumentObject) -> Part.Shape:
         """Generate the TopoShape of the object."""
@@ -98,18 +195,18 @@ class FullBin(FoundationGridfinity):
         feat.bin_bottom_holes_properties(obj, magnet_holes_default=const.MAGNET_HOLES)
         feat.bin_base_values_properties(obj)
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return [
+            *validation.grid_units(obj),
+            *validation.outer_radius(obj),
+            *validation.wall_thickness(obj),
+            *validation.bin_bottom_holes(obj),
+        ]
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         layout = grid_initial_layout.make_rectangle_layout(obj)
 
-        bin_outside_shape = utils.create_rounded_rectangle(
-            obj.xTotalWidth,
-            obj.yTotalWidth,
-            0,
-            obj.BinOuterRadius,
-        )
-        bin_outside_shape.translate(
-            fc.Vector(obj.xTotalWidth / 2 + obj.Clearance, obj.yTotalWidth / 2 + obj.Clearance),
-        )
+        bin_outside_shape = feat.bin_outside_wire(obj)
 
         bin_inside_shape = utils.create_rounded_rectangle(
             obj.xTotalWidth - obj.WallThickness * 2,
@@ -122,16 +219,19 @@ class FullBin(FoundationGridfinity):
         )
 
         fuse_total = feat.make_bin_solid_mid_section(obj, bin_outside_shape)
-        fuse_total = fuse_total.fuse(feat.make_complex_bin_base(obj, layout))
+        fuse_total = booleans.fuse(fuse_total, feat.make_complex_bin_base(obj, layout))
 
         if obj.RecessedTopDepth > 0:
-            fuse_total = fuse_total.cut(feat.make_blank_bin_recessed_top(obj, bin_inside_shape))
+            fuse_total = booleans.cut(
+                fuse_total,
+                feat.make_blank_bin_recessed_top(obj, bin_inside_shape),
+            )
 
         if obj.StackingLip:
-            fuse_total = fuse_total.fuse(feat.make_stacking_lip(obj, bin_outside_shape))
+            fuse_total = booleans.fuse(fuse_total, feat.make_stacking_lip(obj, bin_outside_shape))
 
         if obj.ScrewHoles or obj.MagnetHoles:
-            fuse_total = fuse_total.cut(feat.make_bin_bottom_holes(obj, layout))
+            fuse_total = booleans.cut(fuse_total, feat.make_bin_bottom_holes(obj, layout))
 
         return fuse_total
 
@@ -189,18 +289,24 @@ class StorageBin(FoundationGridfinity):
 
         obj.setExpression("UsableHeight", "TotalHeight - HeightUnitValue")
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return [
+            *validation.grid_units(obj),
+            *validation.outer_radius(obj),
+            *validation.wall_thickness(
+                obj,
+                min_inside_radius=validation.MIN_STORAGE_BIN_INSIDE_RADIUS,
+            ),
+            *validation.compartments(obj),
+            *validation.divider_heights(obj),
+            *validation.scoop(obj),
+            *validation.bin_bottom_holes(obj),
+        ]
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         layout = grid_initial_layout.make_rectangle_layout(obj)
 
-        bin_outside_shape = utils.create_rounded_rectangle(
-            obj.xTotalWidth,
-            obj.yTotalWidth,
-            0,
-            obj.BinOuterRadius,
-        )
-        bin_outside_shape.translate(
-            fc.Vector(obj.xTotalWidth / 2 + obj.Clearance, obj.yTotalWidth / 2 + obj.Clearance),
-        )
+        bin_outside_shape = feat.bin_outside_wire(obj)
 
         bin_inside_shape = utils.create_rounded_rectangle(
             obj.xTotalWidth - obj.WallThickness * 2,
@@ -213,23 +319,23 @@ class StorageBin(FoundationGridfinity):
         )
 
         fuse_total = feat.make_bin_solid_mid_section(obj, bin_outside_shape)
-        fuse_total = fuse_total.fuse(feat.make_complex_bin_base(obj, layout))
+        fuse_total = booleans.fuse(fuse_total, feat.make_complex_bin_base(obj, layout))
         face = Part.Face(bin_inside_shape).translate(fc.Vector(0, 0, -obj.UsableHeight))
         compartments = face.extrude(fc.Vector(0, 0, obj.UsableHeight))
 
-        fuse_total = fuse_total.cut(feat.make_compartments(obj, compartments))
+        fuse_total = booleans.cut(fuse_total, feat.make_compartments(obj, compartments))
 
         if obj.StackingLip:
-            fuse_total = fuse_total.fuse(feat.make_stacking_lip(obj, bin_outside_shape))
+            fuse_total = booleans.fuse(fuse_total, feat.make_stacking_lip(obj, bin_outside_shape))
 
         if obj.ScrewHoles or obj.MagnetHoles:
-            fuse_total = fuse_total.cut(feat.make_bin_bottom_holes(obj, layout))
+            fuse_total = booleans.cut(fuse_total, feat.make_bin_bottom_holes(obj, layout))
 
         if obj.LabelShelfStyle != "Off":
-            fuse_total = fuse_total.fuse(feat.make_label_shelf(obj, "standard"))
+            fuse_total = booleans.fuse(fuse_total, feat.make_label_shelf(obj, "standard"))
 
         if obj.Scoop:
-            fuse_total = fuse_total.fuse(feat.make_scoop(obj))
+            fuse_total = booleans.fuse(fuse_total, feat.make_scoop(obj))
 
         return fuse_total.removeSplitter()
 
@@ -275,18 +381,21 @@ class EcoBin(FoundationGridfinity):
 
         obj.setExpression("UsableHeight", "TotalHeight - HeightUnitValue")
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return [
+            *validation.grid_units(obj),
+            *validation.outer_radius(obj),
+            *validation.wall_thickness(obj),
+            *validation.compartments(obj),
+            *validation.divider_heights(obj),
+            *validation.scoop(obj, obj.TotalHeight - obj.BaseWallThickness, eco=True),
+            *validation.bin_bottom_holes(obj),
+        ]
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         layout = grid_initial_layout.make_rectangle_layout(obj)
 
-        bin_outside_shape = utils.create_rounded_rectangle(
-            obj.xTotalWidth,
-            obj.yTotalWidth,
-            0,
-            obj.BinOuterRadius,
-        )
-        bin_outside_shape.translate(
-            fc.Vector(obj.xTotalWidth / 2 + obj.Clearance, obj.yTotalWidth / 2 + obj.Clearance, 0),
-        )
+        bin_outside_shape = feat.bin_outside_wire(obj)
 
         bin_inside_shape = utils.create_rounded_rectangle(
             obj.xTotalWidth - obj.WallThickness * 2,
@@ -299,7 +408,7 @@ class EcoBin(FoundationGridfinity):
         )
 
         fuse_total = feat.make_bin_solid_mid_section(obj, bin_outside_shape)
-        fuse_total = fuse_total.fuse(feat.make_complex_bin_base(obj, layout))
+        fuse_total = booleans.fuse(fuse_total, feat.make_complex_bin_base(obj, layout))
         face = Part.Face(bin_inside_shape).translate(
             fc.Vector(
                 0,
@@ -314,27 +423,189 @@ class EcoBin(FoundationGridfinity):
 
         # First cut eco compartments to create the interior spaces
         eco_compartments = feat.make_eco_compartments(obj, layout, compartment_solid)
-        fuse_total = fuse_total.cut(eco_compartments)
+        fuse_total = booleans.cut(fuse_total, eco_compartments)
 
         # Now add scoop, but only where eco compartments exist (reversed logic)
         if obj.Scoop:
             scoop = feat.make_scoop(obj, usable_height=obj.TotalHeight - obj.BaseWallThickness)
             # Only add scoop where compartments exist - use intersection to constrain
-            scoop_constrained = scoop.common(eco_compartments)
-            fuse_total = fuse_total.fuse(scoop_constrained)
+            scoop_constrained = booleans.common(scoop, eco_compartments)
+            fuse_total = booleans.fuse(fuse_total, scoop_constrained)
 
         if obj.ScrewHoles or obj.MagnetHoles:
-            fuse_total = fuse_total.cut(feat.make_bin_bottom_holes(obj, layout))
+            fuse_total = booleans.cut(fuse_total, feat.make_bin_bottom_holes(obj, layout))
 
         if obj.StackingLip:
-            fuse_total = fuse_total.fuse(feat.make_stacking_lip(obj, bin_outside_shape))
+            fuse_total = booleans.fuse(fuse_total, feat.make_stacking_lip(obj, bin_outside_shape))
 
         if obj.LabelShelfStyle != "Off":
-            fuse_total = fuse_total.fuse(feat.make_label_shelf(obj, "eco"))
+            fuse_total = booleans.fuse(fuse_total, feat.make_label_shelf(obj, "eco"))
 
         return fuse_total.removeSplitter()
 
 
+BIN_FAMILY_PROPERTIES = (
+    PropertySpec(
+        "App::PropertyIntegerList",
+        "xGridUnitsList",
+        "Gridfinity",
+        "Grid units in the x direction of the variants",
+        default=[1, 2, 3],
+    ),
+    PropertySpec(
+        "App::PropertyIntegerList",
+        "yGridUnitsList",
+        "Gridfinity",
+        "Grid units in the y direction of the variants",
+        default=[1, 2, 3],
+    ),
+    PropertySpec(
+        "App::PropertyIntegerList",
+        "HeightUnitsList",
+        "Gridfinity",
+        "Heights of the variants in units, each is 7 mm",
+        default=[3, 6],
+    ),
+    PropertySpec(
+        "App::PropertyLength",
+        "VariantSpacing",
+        "GridfinityNonStandard",
+        "Distance between the variants in the 3D view <br> <br> default = 10 mm",
+        default=10,
+    ),
+    PropertySpec(
+        "App::PropertyStringList",
+        "VariantNames",
+        "ReferenceParameters",
+        "Names of the variants, in the order of the shapes in the compound",
+        read_only=True,
+    ),
+)
+BIN_FAMILY_DIVIDERS_PROPERTIES = (
+    PropertySpec(
+        "App::PropertyIntegerList",
+        "xDividersList",
+        "Gridfinity",
+        "Number of dividers in the x direction of the variants",
+        default=[0],
+    ),
+    PropertySpec(
+        "App::PropertyIntegerList",
+        "yDividersList",
+        "Gridfinity",
+        "Number of dividers in the y direction of the variants",
+        default=[0],
+    ),
+)
+# Properties of the bin type which are set per variant.
+_VARIANT_PROPERTIES = {
+    "xGridUnits": "xGridUnitsList",
+    "yGridUnits": "yGridUnitsList",
+    "xDividers": "xDividersList",
+    "yDividers": "yDividersList",
+}
+
+
+class BinFamily(FoundationGridfinity):
+    """Gridfinity bins of one type in every combination of sizes, heights and dividers.
+
+    The object has all properties of its bin type, which apply to every variant, and lists of the
+    grid units, heights and divider counts of the variants. All variants are generated in a single
+    execute, each height from the lowest one of its footprint, see `height_family`. The shape is a
+    compound of the variants, in the order of `VariantNames`.
+    """
+
+    def __init__(self, obj: fc.DocumentObject, bin_type: str = "PartsBin") -> None:
+        FAMILY_BIN_TYPES[bin_type](obj)
+        self.bin_type = bin_type
+        self.bin = obj.Proxy
+
+        property_schema.add_properties(obj, BIN_FAMILY_PROPERTIES)
+        if hasattr(obj, "xDividers"):
+            property_schema.add_properties(obj, BIN_FAMILY_DIVIDERS_PROPERTIES)
+        for name in [*_VARIANT_PROPERTIES, "HeightUnits"]:
+            if hasattr(obj, name):
+                obj.setEditorMode(name, 2)
+
+        obj.Proxy = self
+
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        errors = self.bin.validate(obj)
+        if obj.NonStandardHeight:
+            errors.append(
+                validation.ParameterError("NonStandardHeight", "must be off for a bin family"),
+            )
+        for prop in [*_VARIANT_PROPERTIES.values(), "HeightUnitsList"]:
+            if not hasattr(obj, prop):
+                continue
+            minimum = 0 if "Dividers" in prop else 1
+            values = getattr(obj, prop)
+            if not values:
+                errors.append(validation.ParameterError(prop, "must have at least one value"))
+            elif min(values) < minimum:
+                errors.append(validation.ParameterError(prop, f"must be at least {minimum}"))
+        return errors
+
+    def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
+        variant_properties = {
+            name: getattr(obj, values)
+            for name, values in _VARIANT_PROPERTIES.items()
+            if hasattr(obj, values)
+        }
+        original = {name: getattr(obj, name) for name in variant_properties}
+
+        names = []
+        shapes = []
+        try:
+            for values in itertools.product(*variant_properties.values()):
+                for name, value in zip(variant_properties, values):
+                    setattr(obj, name, value)
+                family = height_family.generate(obj, obj.HeightUnitsList, proxy=self.bin)
+                for height_units, shape in family.items():
+                    x, y, *dividers = values
+                    name = f"{self.bin_type}_{x}x{y}x{height_units}"
+                    if dividers:
+                        name += "_dividers_{}x{}".format(*dividers)
+                    names.append(name)
+                    shapes.append(shape)
+        finally:
+            for name, value in original.items():
+                setattr(obj, name, value)
+            height_family.evaluate_expressions(obj)
+
+        obj.VariantNames = names
+
+        # Lay the variants out in a grid, so they don't overlap in the 3D view.
+        columns = math.ceil(math.sqrt(len(shapes)))
+        x_pitch = max(shape.BoundBox.XLength for shape in shapes) + obj.VariantSpacing.Value
+        y_pitch = max(shape.BoundBox.YLength for shape in shapes) + obj.VariantSpacing.Value
+        return Part.makeCompound(
+            [
+                shape.translated(fc.Vector(i % columns * x_pitch, i // columns * y_pitch))
+                for i, shape in enumerate(shapes)
+            ],
+        )
+
+    def dumps(self) -> dict:
+        """Needed for JSON Serialization when saving a file containing gridfinity object."""
+        return {"bin_type": self.bin_type}
+
+    def loads(self, state: dict) -> None:
+        """Needed for JSON Serialization when opening a file containing gridfinity object."""
+        self.bin_type = state["bin_type"]
+        bin_class = FAMILY_BIN_TYPES[self.bin_type]
+        # The properties of the bin type are stored with the object, so don't initialize it.
+        self.bin = bin_class.__new__(bin_class)
+
+
+FAMILY_BIN_TYPES: dict[str, type[FoundationGridfinity]] = {
+    "BinBlank": BinBlank,
+    "SimpleStorageBin": SimpleStorageBin,
+    "PartsBin": PartsBin,
+    "EcoBin": EcoBin,
+}
+
+
 class Baseplate(FoundationGridfinity):
     def __init__(self, obj: fc.DocumentObject) -> None:
         super().__init__(obj)
@@ -343,6 +614,12 @@ class Baseplate(FoundationGridfinity):
         baseplate_feat.solid_shape_properties(obj)
         baseplate_feat.base_values_properties(obj)
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return [
+            *validation.grid_units(obj),
+            *validation.outer_radius(obj),
+        ]
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         layout = grid_initial_layout.make_rectangle_layout(obj)
 
@@ -362,7 +639,7 @@ class Baseplate(FoundationGridfinity):
 
         fuse_total = feat.make_complex_bin_base(obj, layout)
         fuse_total.translate(fc.Vector(0, 0, obj.TotalHeight))
-        fuse_total = solid_shape.cut(fuse_total)
+        fuse_total = booleans.cut(solid_shape, fuse_total)
 
         return fuse_total
 
@@ -377,6 +654,12 @@ class MagnetBaseplate(FoundationGridfinity):
         baseplate_feat.magnet_holes_properties(obj)
         baseplate_feat.center_cut_properties(obj)
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return [
+            *validation.grid_units(obj),
+            *validation.outer_radius(obj),
+        ]
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         layout = grid_initial_layout.make_rectangle_layout(obj)
 
@@ -396,9 +679,9 @@ class MagnetBaseplate(FoundationGridfinity):
 
         fuse_total = feat.make_complex_bin_base(obj, layout)
         fuse_total.translate(fc.Vector(0, 0, obj.TotalHeight))
-        fuse_total = solid_shape.cut(fuse_total)
-        fuse_total = fuse_total.cut(baseplate_feat.make_magnet_holes(obj, layout))
-        fuse_total = fuse_total.cut(baseplate_feat.make_center_cut(obj, layout))
+        fuse_total = booleans.cut(solid_shape, fuse_total)
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_magnet_holes(obj, layout))
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_center_cut(obj, layout))
 
         return fuse_total
 
@@ -415,6 +698,13 @@ class ScrewTogetherBaseplate(FoundationGridfinity):
         baseplate_feat.screw_bottom_chamfer_properties(obj)
         baseplate_feat.connection_holes_properties(obj)
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return [
+            *validation.grid_units(obj),
+            *validation.outer_radius(obj),
+            *validation.screw_holes(obj),
+        ]
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         layout = grid_initial_layout.make_rectangle_layout(obj)
 
@@ -434,11 +724,11 @@ class ScrewTogetherBaseplate(FoundationGridfinity):
 
         fuse_total = feat.make_complex_bin_base(obj, layout)
         fuse_total.translate(fc.Vector(0, 0, obj.TotalHeight))
-        fuse_total = solid_shape.cut(fuse_total)
-        fuse_total = fuse_total.cut(baseplate_feat.make_magnet_holes(obj, layout))
-        fuse_total = fuse_total.cut(baseplate_feat.make_center_cut(obj, layout))
-        fuse_total = fuse_total.cut(baseplate_feat.make_screw_bottom_chamfer(obj, layout))
-        fuse_total = fuse_total.cut(baseplate_feat.make_connection_holes(obj, layout))
+        fuse_total = booleans.cut(solid_shape, fuse_total)
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_magnet_holes(obj, layout))
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_center_cut(obj, layout))
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_screw_bottom_chamfer(obj, layout))
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_connection_holes(obj, layout))
 
         return fuse_total
 
@@ -463,6 +753,9 @@ class CustomBlankBin(FoundationGridfinity):
 
         obj.Proxy = self
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return validation.bin_bottom_holes(obj)
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         """Generate BinBlank Shape."""
         ## calculated here
@@ -480,11 +773,15 @@ class CustomBlankBin(FoundationGridfinity):
         layout = clean_up_layout(self.layout)
         grid_initial_layout.make_custom_shape_layout(obj, layout)
         solid_shape = custom_shape_solid(obj, layout, obj.TotalHeight - obj.BaseProfileHeight)
-        outside_trim = custom_shape_trim(obj, layout, obj.Clearance, obj.Clearance)
-        fuse_total = solid_shape.cut(outside_trim)
-        fuse_total = fuse_total.removeSplitter()
-        fuse_total = vertical_edge_fillet(fuse_total, obj.BinOuterRadius)
-        fuse_total = fuse_total.fuse(feat.make_complex_bin_base(obj, layout))
+        fuse_total = trimmed_rounded_solid(
+            obj,
+            solid_shape,
+            layout,
+            obj.Clearance,
+            obj.Clearance,
+            obj.BinOuterRadius,
+        )
+        fuse_total = booleans.fuse(fuse_total, feat.make_complex_bin_base(obj, layout))
 
         if obj.RecessedTopDepth > 0:
             recessed_solid = custom_shape_solid(obj, layout, obj.RecessedTopDepth)
@@ -494,18 +791,19 @@ class CustomBlankBin(FoundationGridfinity):
                 obj.Clearance.Value + obj.WallThickness.Value,
                 obj.Clearance.Value + obj.WallThickness.Value,
             )
-            recessed_solid = recessed_solid.cut(recessed_outside_trim)
+            recessed_solid = booleans.cut(recessed_solid, recessed_outside_trim)
             recessed_solid = recessed_solid.removeSplitter()
             recessed_solid = vertical_edge_fillet(
                 recessed_solid,
                 obj.BinOuterRadius - obj.WallThickness,
             )
-            fuse_total = fuse_total.cut(recessed_solid)
+            fuse_total = booleans.cut(fuse_total, recessed_solid)
         if obj.ScrewHoles or obj.MagnetHoles:
             holes = feat.make_bin_bottom_holes(obj, layout)
-            fuse_total = Part.Shape.cut(fuse_total, holes)
+            fuse_total = booleans.cut(fuse_total, holes)
         if obj.StackingLip:
-            fuse_total = fuse_total.fuse(
+            fuse_total = booleans.fuse(
+                fuse_total,
                 custom_shape_stacking_lip(obj, solid_shape, layout),
             )
 
@@ -540,6 +838,9 @@ class CustomBinBase(FoundationGridfinity):
 
         obj.Proxy = self
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return validation.bin_bottom_holes(obj)
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         """Generate BinBase Shape."""
         ## calculated here
@@ -556,11 +857,15 @@ class CustomBinBase(FoundationGridfinity):
         layout = clean_up_layout(self.layout)
         grid_initial_layout.make_custom_shape_layout(obj, layout)
         solid_shape = custom_shape_solid(obj, layout, obj.TotalHeight - obj.BaseProfileHeight)
-        outside_trim = custom_shape_trim(obj, layout, obj.Clearance, obj.Clearance)
-        fuse_total = solid_shape.cut(outside_trim)
-        fuse_total = fuse_total.removeSplitter()
-        fuse_total = vertical_edge_fillet(fuse_total, obj.BinOuterRadius)
-        fuse_total = fuse_total.fuse(feat.make_complex_bin_base(obj, layout))
+        fuse_total = trimmed_rounded_solid(
+            obj,
+            solid_shape,
+            layout,
+            obj.Clearance,
+            obj.Clearance,
+            obj.BinOuterRadius,
+        )
+        fuse_total = booleans.fuse(fuse_total, feat.make_complex_bin_base(obj, layout))
 
         if obj.RecessedTopDepth > 0:
             recessed_solid = custom_shape_solid(obj, layout, obj.RecessedTopDepth)
@@ -570,18 +875,19 @@ class CustomBinBase(FoundationGridfinity):
                 obj.Clearance.Value + obj.WallThickness.Value,
                 obj.Clearance.Value + obj.WallThickness.Value,
             )
-            recessed_solid = recessed_solid.cut(recessed_outside_trim)
+            recessed_solid = booleans.cut(recessed_solid, recessed_outside_trim)
             recessed_solid = recessed_solid.removeSplitter()
             recessed_solid = vertical_edge_fillet(
                 recessed_solid,
                 obj.BinOuterRadius - obj.WallThickness,
             )
-            fuse_total = fuse_total.cut(recessed_solid)
+            fuse_total = booleans.cut(fuse_total, recessed_solid)
         if obj.ScrewHoles or obj.MagnetHoles:
             holes = feat.make_bin_bottom_holes(obj, layout)
-            fuse_total = Part.Shape.cut(fuse_total, holes)
+            fuse_total = booleans.cut(fuse_total, holes)
         if obj.StackingLip:
-            fuse_total = fuse_total.fuse(
+            fuse_total = booleans.fuse(
+                fuse_total,
                 custom_shape_stacking_lip(obj, solid_shape, layout),
             )
 
@@ -618,6 +924,13 @@ class CustomEcoBin(FoundationGridfinity):
 
         obj.Proxy = self
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return [
+            *validation.divider_heights(obj),
+            *validation.scoop(obj, obj.TotalHeight - obj.BaseWallThickness, eco=True),
+            *validation.bin_bottom_holes(obj),
+        ]
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         """Generate EcoBin Shape."""
         ## calculated here
@@ -635,11 +948,15 @@ class CustomEcoBin(FoundationGridfinity):
         layout = clean_up_layout(self.layout)
         grid_initial_layout.make_custom_shape_layout(obj, layout)
         solid_shape = custom_shape_solid(obj, layout, obj.TotalHeight - obj.BaseProfileHeight)
-        outside_trim = custom_shape_trim(obj, layout, obj.Clearance, obj.Clearance)
-        fuse_total = solid_shape.cut(outside_trim)
-        fuse_total = fuse_total.removeSplitter()
-        fuse_total = vertical_edge_fillet(fuse_total, obj.BinOuterRadius)
-        fuse_total = fuse_total.fuse(feat.make_complex_bin_base(obj, layout))
+        fuse_total = trimmed_rounded_solid(
+            obj,
+            solid_shape,
+            layout,
+            obj.Clearance,
+            obj.Clearance,
+            obj.BinOuterRadius,
+        )
+        fuse_total = booleans.fuse(fuse_total, feat.make_complex_bin_base(obj, layout))
 
         feat.eco_error_check(obj)
         compartments_solid = custom_shape_solid(
@@ -653,7 +970,7 @@ class CustomEcoBin(FoundationGridfinity):
             obj.Clearance + obj.WallThickness,
             obj.Clearance + obj.WallThickness,
         )
-        compartments_solid = compartments_solid.cut(compartment_trim)
+        compartments_solid = booleans.cut(compartments_solid, compartment_trim)
         compartments_solid = compartments_solid.removeSplitter()
         compartments_solid = vertical_edge_fillet(
             compartments_solid,
@@ -664,7 +981,10 @@ class CustomEcoBin(FoundationGridfinity):
             layout,
             obj.TotalHeight,
         )
-        inside_wall_solid_full_height = inside_wall_solid_full_height.cut(compartment_trim)
+        inside_wall_solid_full_height = booleans.cut(
+            inside_wall_solid_full_height,
+            compartment_trim,
+        )
         inside_wall_solid_full_height = inside_wall_solid_full_height.removeSplitter()
         inside_wall_solid_full_height = vertical_edge_fillet(
             inside_wall_solid_full_height,
@@ -673,26 +993,27 @@ class CustomEcoBin(FoundationGridfinity):
         # First cut eco compartments to create the interior spaces
         compartments = feat.make_eco_compartments(obj, layout, compartments_solid)
         inside_wall_negative = cut_outside_shape(obj, inside_wall_solid_full_height)
-        compartments = compartments.cut(inside_wall_negative)
-        fuse_total = fuse_total.cut(compartments)
+        compartments = booleans.cut(compartments, inside_wall_negative)
+        fuse_total = booleans.cut(fuse_total, compartments)
 
         # Now add scoop, but only where eco compartments exist (reversed logic)
         if obj.Scoop:
             scoop = feat.make_scoop(obj, usable_height=obj.TotalHeight - obj.BaseWallThickness)
             # Only add scoop where compartments exist - use intersection to constrain
-            scoop_constrained = scoop.common(compartments)
-            fuse_total = fuse_total.fuse(scoop_constrained)
+            scoop_constrained = booleans.common(scoop, compartments)
+            fuse_total = booleans.fuse(fuse_total, scoop_constrained)
 
         if obj.LabelShelfStyle != "Off":
             label_shelf = feat.make_label_shelf(obj, "eco")
-            label_shelf = label_shelf.cut(inside_wall_negative)
-            fuse_total = fuse_total.fuse(label_shelf)
+            label_shelf = booleans.cut(label_shelf, inside_wall_negative)
+            fuse_total = booleans.fuse(fuse_total, label_shelf)
 
         if obj.ScrewHoles or obj.MagnetHoles:
             holes = self.bin_bottom_holes.make(obj, layout)
-            fuse_total = Part.Shape.cut(fuse_total, holes)
+            fuse_total = booleans.cut(fuse_total, holes)
         if obj.StackingLip:
-            fuse_total = fuse_total.fuse(
+            fuse_total = booleans.fuse(
+                fuse_total,
                 custom_shape_stacking_lip(obj, solid_shape, layout),
             )
 
@@ -731,6 +1052,13 @@ class CustomStorageBin(FoundationGridfinity):
 
         obj.Proxy = self
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return [
+            *validation.divider_heights(obj),
+            *validation.scoop(obj),
+            *validation.bin_bottom_holes(obj),
+        ]
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         """Generate StorageBin Shape."""
         ## calculated here
@@ -754,11 +1082,15 @@ class CustomStorageBin(FoundationGridfinity):
         layout = clean_up_layout(self.layout)
         grid_initial_layout.make_custom_shape_layout(obj, layout)
         solid_shape = custom_shape_solid(obj, layout, obj.TotalHeight - obj.BaseProfileHeight)
-        outside_trim = custom_shape_trim(obj, layout, obj.Clearance, obj.Clearance)
-        fuse_total = solid_shape.cut(outside_trim)
-        fuse_total = fuse_total.removeSplitter()
-        fuse_total = vertical_edge_fillet(fuse_total, obj.BinOuterRadius)
-        fuse_total = fuse_total.fuse(feat.make_complex_bin_base(obj, layout))
+        fuse_total = trimmed_rounded_solid(
+            obj,
+            solid_shape,
+            layout,
+            obj.Clearance,
+            obj.Clearance,
+            obj.BinOuterRadius,
+        )
+        fuse_total = booleans.fuse(fuse_total, feat.make_complex_bin_base(obj, layout))
 
         compartments_solid = custom_shape_solid(obj, layout, obj.UsableHeight)
         compartment_trim = custom_shape_trim(
@@ -767,7 +1099,7 @@ class CustomStorageBin(FoundationGridfinity):
             obj.Clearance + obj.WallThickness,
             obj.Clearance + obj.WallThickness,
         )
-        compartments_solid = compartments_solid.cut(compartment_trim)
+        compartments_solid = booleans.cut(compartments_solid, compartment_trim)
         compartments_solid = compartments_solid.removeSplitter()
         compartments_solid = vertical_edge_fillet_with_concave_edges(
             compartments_solid,
@@ -776,26 +1108,27 @@ class CustomStorageBin(FoundationGridfinity):
         )
         compartments = feat.make_compartments(obj, compartments_solid)
 
-        fuse_total = fuse_total.cut(compartments)
+        fuse_total = booleans.cut(fuse_total, compartments)
 
         if obj.ScrewHoles or obj.MagnetHoles:
             holes = feat.make_bin_bottom_holes(obj, layout)
-            fuse_total = Part.Shape.cut(fuse_total, holes)
+            fuse_total = booleans.cut(fuse_total, holes)
         if obj.StackingLip:
-            fuse_total = fuse_total.fuse(
+            fuse_total = booleans.fuse(
+                fuse_total,
                 custom_shape_stacking_lip(obj, solid_shape, layout),
             )
         outside_bin_solid = cut_outside_shape(obj, compartments_solid)
 
         if obj.LabelShelfStyle != "Off":
             label_shelf = feat.make_label_shelf(obj, "standard")
-            label_shelf = label_shelf.cut(outside_bin_solid)
-            fuse_total = fuse_total.fuse(label_shelf)
+            label_shelf = booleans.cut(label_shelf, outside_bin_solid)
+            fuse_total = booleans.fuse(fuse_total, label_shelf)
 
         if obj.Scoop:
             scoop = feat.make_scoop(obj)
-            scoop = scoop.cut(outside_bin_solid)
-            fuse_total = fuse_total.fuse(scoop)
+            scoop = booleans.cut(scoop, outside_bin_solid)
+            fuse_total = booleans.fuse(fuse_total, scoop)
 
         return fuse_total.removeSplitter()
 
@@ -833,13 +1166,13 @@ class CustomBaseplate(FoundationGridfinity):
             obj,
             layout,
             obj.TotalHeight,
-        ).translate(fc.Vector(0, 0, obj.TotalHeight))
+        ).translated(fc.Vector(0, 0, obj.TotalHeight))
         solid_shape = solid_shape.removeSplitter()
         solid_shape = vertical_edge_fillet(solid_shape, obj.BinOuterRadius)
 
         fuse_total = feat.make_complex_bin_base(obj, layout)
         fuse_total.translate(fc.Vector(0, 0, obj.TotalHeight))
-        fuse_total = solid_shape.cut(fuse_total)
+        fuse_total = booleans.cut(solid_shape, fuse_total)
 
         return fuse_total
 
@@ -879,15 +1212,15 @@ class CustomMagnetBaseplate(FoundationGridfinity):
             obj,
             layout,
             obj.TotalHeight,
-        ).translate(fc.Vector(0, 0, obj.BaseProfileHeight))
+        ).translated(fc.Vector(0, 0, obj.BaseProfileHeight))
         solid_shape = solid_shape.removeSplitter()
         solid_shape = vertical_edge_fillet(solid_shape, obj.BinOuterRadius)
 
         fuse_total = feat.make_complex_bin_base(obj, layout)
         fuse_total.translate(fc.Vector(0, 0, obj.TotalHeight))
-        fuse_total = solid_shape.cut(fuse_total)
-        fuse_total = fuse_total.cut(baseplate_feat.make_magnet_holes(obj, layout))
-        fuse_total = fuse_total.cut(baseplate_feat.make_center_cut(obj, layout))
+        fuse_total = booleans.cut(solid_shape, fuse_total)
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_magnet_holes(obj, layout))
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_center_cut(obj, layout))
 
         return fuse_total
 
@@ -917,6 +1250,9 @@ class CustomScrewTogetherBaseplate(FoundationGridfinity):
 
         obj.Proxy = self
 
+    def validate(self, obj: fc.DocumentObject) -> list[validation.ParameterError]:
+        return validation.screw_holes(obj)
+
     def generate_gridfinity_shape(self, obj: fc.DocumentObject) -> Part.Shape:
         """Generate Screw Together Baseplate Shape."""
         ## calculated here
@@ -929,17 +1265,17 @@ class CustomScrewTogetherBaseplate(FoundationGridfinity):
             obj,
             layout,
             obj.TotalHeight,
-        ).translate(fc.Vector(0, 0, obj.BaseProfileHeight))
+        ).translated(fc.Vector(0, 0, obj.BaseProfileHeight))
         solid_shape = solid_shape.removeSplitter()
         solid_shape = vertical_edge_fillet(solid_shape, obj.BinOuterRadius)
 
         fuse_total = feat.make_complex_bin_base(obj, layout)
         fuse_total.translate(fc.Vector(0, 0, obj.TotalHeight))
-        fuse_total = solid_shape.cut(fuse_total)
-        fuse_total = fuse_total.cut(baseplate_feat.make_magnet_holes(obj, layout))
-        fuse_total = fuse_total.cut(baseplate_feat.make_center_cut(obj, layout))
-        fuse_total = fuse_total.cut(baseplate_feat.make_screw_bottom_chamfer(obj, layout))
-        fuse_total = fuse_total.cut(baseplate_feat.make_connection_holes(obj, layout))
+        fuse_total = booleans.cut(solid_shape, fuse_total)
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_magnet_holes(obj, layout))
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_center_cut(obj, layout))
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_screw_bottom_chamfer(obj, layout))
+        fuse_total = booleans.cut(fuse_total, baseplate_feat.make_connection_holes(obj, layout))
 
         return fuse_total
 
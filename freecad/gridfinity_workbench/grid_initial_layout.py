@@ -2,105 +2,117 @@
 
 import FreeCAD as fc  # noqa: N813
 
-from . import const
+from . import const, property_schema
+from .property_schema import PropertySpec
 
-
-def _location_properties(obj: fc.DocumentObject) -> None:
-    """Properties used by all gridfinity objects."""
-    obj.addProperty(
+_LOCATION_PROPERTIES = (
+    PropertySpec(
         "App::PropertyEnumeration",
         "GenerationLocation",
         "Gridfinity",
         "Location of the bin. Change depending on how you want to customize",
-    ).GenerationLocation = ["Positive from Origin", "Centered at Origin"]
-
-    obj.addProperty(
+        default=["Positive from Origin", "Centered at Origin"],
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "xLocationOffset",
         "ShouldBeHidden",
         "changing bin location in the x direction",
         hidden=True,
-    )
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "yLocationOffset",
         "ShouldBeHidden",
         "changing bin location in the y direction",
         hidden=True,
-    )
+    ),
+)
 
 
-def _total_width_properties(obj: fc.DocumentObject) -> None:
-    """Total Width Properties."""
-    obj.addProperty(
+_TOTAL_WIDTH_PROPERTIES = (
+    PropertySpec(
         "App::PropertyLength",
         "xTotalWidth",
         "ReferenceParameters",
         "total width of Gridfinity object in x direction",
         read_only=True,
-    )
-
-    obj.addProperty(
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "yTotalWidth",
         "ReferenceParameters",
         "total width of Gridfinity object in y direction",
         read_only=True,
-    )
+    ),
+)
 
 
-def _grid_size_properties(obj: fc.DocumentObject) -> None:
-    """Grid Size Properties."""
-    obj.addProperty(
+_GRID_SIZE_PROPERTIES = (
+    PropertySpec(
         "App::PropertyLength",
         "xGridSize",
         "zzExpertOnly",
         "Size of each grid in x direction <br> <br> default = 42 mm",
-    ).xGridSize = const.X_GRID_SIZE
-
-    obj.addProperty(
+        default=const.X_GRID_SIZE,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "yGridSize",
         "zzExpertOnly",
         "Size of each grid in y direction <br> <br> default = 42 mm",
-    ).yGridSize = const.Y_GRID_SIZE
-
+        default=const.Y_GRID_SIZE,
+    ),
+)
 
-def rectangle_layout_properties(obj: fc.DocumentObject, *, baseplate_default: bool) -> None:
-    """Create Rectangle Layout.
-
-    Args:
-        obj (FreeCAD.DocumentObject): Document object
-        baseplate_default (Bool): is Gridfinity Object baseplate
-
-    """
-    _location_properties(obj)
-    _total_width_properties(obj)
-    _grid_size_properties(obj)
 
+RECTANGLE_LAYOUT_PROPERTIES = (
     ## Standard Gridfinity Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyFloat",
         "xGridUnits",
         "Gridfinity",
         "Number of grid units in the x direction <br> <br> default = 2",
-    ).xGridUnits = const.X_GRID_UNITS
-    obj.addProperty(
+        default=const.X_GRID_UNITS,
+    ),
+    PropertySpec(
         "App::PropertyFloat",
         "yGridUnits",
         "Gridfinity",
         "Number of grid units in the y direction <br> <br> default = 2",
-    ).yGridUnits = const.Y_GRID_UNITS
+        default=const.Y_GRID_UNITS,
+    ),
+)
 
+_BASEPLATE_PROPERTIES = (
     ## Hidden Properties
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyBool",
         "Baseplate",
         "ShouldBeHidden",
         "Is the Gridfinity Object a baseplate",
         hidden=True,
-    ).Baseplate = baseplate_default
+    ),
+)
+
+
+def rectangle_layout_properties(obj: fc.DocumentObject, *, baseplate_default: bool) -> None:
+    """Create Rectangle Layout.
+
+    Args:
+        obj (FreeCAD.DocumentObject): Document object
+        baseplate_default (Bool): is Gridfinity Object baseplate
+
+    """
+    property_schema.add_properties(
+        obj,
+        _LOCATION_PROPERTIES
+        + _TOTAL_WIDTH_PROPERTIES
+        + _GRID_SIZE_PROPERTIES
+        + RECTANGLE_LAYOUT_PROPERTIES
+        + _BASEPLATE_PROPERTIES,
+        Baseplate=baseplate_default,
+    )
 
     ## Expressions
     obj.setExpression(
@@ -137,23 +149,16 @@ def custom_shape_layout_properties(obj: fc.DocumentObject, *, baseplate_default:
         baseplate_default (Bool): is Gridfinity Object baseplate
 
     """
-    _total_width_properties(obj)
-    _grid_size_properties(obj)
-
-    _location_properties(obj)
+    property_schema.add_properties(
+        obj,
+        _TOTAL_WIDTH_PROPERTIES
+        + _GRID_SIZE_PROPERTIES
+        + _LOCATION_PROPERTIES
+        + _BASEPLATE_PROPERTIES,
+        Baseplate=baseplate_default,
+    )
     obj.setEditorMode("GenerationLocation", 2)
 
-    ## Standard Gridfinity Parameters
-
-    ## Hidden Properties
-    obj.addProperty(
-        "App::PropertyBool",
-        "Baseplate",
-        "ShouldBeHidden",
-        "Is the Gridfinity Object a baseplate",
-        hidden=True,
-    ).Baseplate = baseplate_default
-
 
 def make_custom_shape_layout(obj: fc.DocumentObject, layout: list[list[bool]]) -> None:
     """Calculate values for custom shape.
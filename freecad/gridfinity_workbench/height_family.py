@@ -0,0 +1,236 @@
+"""Generate a bin at several heights without rebuilding it for every height.
+
+Bins of the same footprint differ in height only by their straight mid-section. The base, the
+holes and the floor are placed relative to the bottom of the bin, the stacking lip, the label shelf
+and a recessed top relative to its top, at z = 0. Between them the cross section of the bin
+doesn't change.
+
+`generate` builds the bin once at the lowest height where such a prismatic band exists, and cuts
+it into a lower and an upper part at a height within the band. Every taller variant is assembled
+from these parts: the lower part is moved down by the height difference and the gap is filled by
+extruding the cross section, so a family of heights costs little more than one bin.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import graphlib
+import math
+import re
+from typing import TYPE_CHECKING
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from . import booleans, memo, validation
+from . import feature_construction as feat
+from .feature_construction import _stacking_lip_profile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Distance in mm below which heights are considered equal.
+TOLERANCE = 1e-6
+# Narrowest prismatic band in mm a bin is split in.
+MIN_BAND = 0.1
+
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+
+
+def _is_vertical(face: Part.Face) -> bool:
+    """Check if a face is a vertical plane or a cylinder with a vertical axis."""
+    surface = face.Surface
+    if isinstance(surface, Part.Plane):
+        return abs(surface.Axis.z) < TOLERANCE
+    if isinstance(surface, Part.Cylinder):
+        return abs(abs(surface.Axis.z) - 1) < TOLERANCE
+    return False
+
+
+def prismatic_bands(shape: Part.Shape) -> list[tuple[float, float]]:
+    """Return the height ranges in which the cross section of a shape doesn't change.
+
+    Within a band every face is vertical and no face starts or ends.
+    """
+    events = []
+    for face in shape.Faces:
+        box = face.BoundBox
+        if _is_vertical(face):
+            events += [(box.ZMin, box.ZMin), (box.ZMax, box.ZMax)]
+        else:
+            events.append((box.ZMin, box.ZMax))
+    events.sort()
+
+    bands = []
+    top = -math.inf
+    for low, high in events:
+        if low > top + TOLERANCE and top > -math.inf:
+            bands.append((top, low))
+        top = max(top, high)
+    return bands
+
+
+def _bottom_height(obj: fc.DocumentObject) -> float:
+    """Get the height above the bottom of the bin up to which features follow the bottom."""
+    heights = [float(obj.BaseProfileHeight)]
+    if hasattr(obj, "BaseWallThickness"):  # eco bins
+        floor = obj.BaseProfileHeight + obj.BaseWallThickness
+        scoop_usable_height = obj.TotalHeight - obj.BaseWallThickness
+    elif hasattr(obj, "UsableHeight"):
+        floor = obj.TotalHeight - obj.UsableHeight
+        scoop_usable_height = obj.UsableHeight
+    else:
+        return max(heights)
+
+    heights.append(float(floor + obj.InsideFilletRadius))
+    if obj.Scoop:
+        scoop_bottom = obj.TotalHeight - scoop_usable_height
+        heights.append(float(scoop_bottom + feat.scoop_radius(obj, scoop_usable_height)))
+    for dividers, height in (("xDividers", "xDividerHeight"), ("yDividers", "yDividerHeight")):
+        if getattr(obj, dividers) > 0 and getattr(obj, height) != 0:
+            heights.append(float(getattr(obj, height)))
+    return max(heights)
+
+
+def _top_depth(obj: fc.DocumentObject) -> float:
+    """Get the depth below the top of the bin down to which features follow the top."""
+    depths = [0.0]
+    if getattr(obj, "RecessedTopDepth", 0) > 0:
+        depths.append(float(obj.RecessedTopDepth))
+    if obj.StackingLip:
+        depths.append(-_stacking_lip_profile(obj).BoundBox.ZMin)
+    if getattr(obj, "LabelShelfStyle", "Off") != "Off":
+        angle = 0 if obj.LabelShelfStyle == "Overhang" else obj.LabelShelfAngle.Value
+        width = float(feat.calc_stacking_lip_offset(obj) + obj.LabelShelfWidth)
+        offset = float(obj.LabelShelfStackingOffset) if obj.StackingLip else 0
+        thickness = float(obj.LabelShelfVerticalThickness)
+        depths.append(offset + thickness + math.tan(math.radians(angle)) * width)
+    return max(depths)
+
+
+@dataclasses.dataclass(frozen=True)
+class Split:
+    """A shape cut at a height within a prismatic band."""
+
+    lower: Part.Shape
+    upper: Part.Shape
+    section: Part.Shape
+
+    def stretched(self, height: float) -> Part.Shape:
+        """Return the shape with the prismatic band extended downwards by a height."""
+        move = fc.Vector(0, 0, -height)
+        middle = self.section.translated(move).extrude(-move)
+        shape = booleans.multi_fuse(self.upper, [middle, self.lower.translated(move)])
+        return shape.removeSplitter()
+
+
+def split(shape: Part.Shape, z: float) -> Split:
+    """Cut a shape at a height within a prismatic band into a lower and an upper part."""
+    box = shape.BoundBox
+    corner = fc.Vector(box.XMin - 1, box.YMin - 1, box.ZMin - 1)
+    below = Part.makeBox(box.XLength + 2, box.YLength + 2, z - box.ZMin + 1, corner)
+    lower = booleans.common(shape, below)
+    upper = booleans.cut(shape, below)
+    section = Part.makeCompound(
+        [
+            face
+            for face in lower.Faces
+            if abs(face.BoundBox.ZMin - z) < TOLERANCE and face.BoundBox.ZLength < TOLERANCE
+        ],
+    )
+    return Split(lower, upper, section)
+
+
+def split_height(obj: fc.DocumentObject, shape: Part.Shape) -> float | None:
+    """Get a height to split a generated bin at, None if its features leave no prismatic band."""
+    low = float(-obj.TotalHeight) + _bottom_height(obj)
+    high = -_top_depth(obj)
+    for start, end in prismatic_bands(shape):
+        start, end = max(start, low), min(end, high)  # noqa: PLW2901
+        if end - start >= MIN_BAND:
+            return (start + end) / 2
+    return None
+
+
+def evaluate_expressions(obj: fc.DocumentObject) -> None:
+    """Update the properties of an object computed by expressions, without a recompute.
+
+    Expressions are evaluated once each, after the expressions they use. Expressions bound to a
+    sub-property, such as `.Placement.Base.z`, are left to the next recompute.
+    """
+    expressions = {name: expression for name, expression in obj.ExpressionEngine if "." not in name}
+    dependencies = {
+        name: {
+            identifier
+            for identifier in _IDENTIFIER.findall(expression)
+            if identifier in expressions and identifier != name
+        }
+        for name, expression in expressions.items()
+    }
+    for name in graphlib.TopologicalSorter(dependencies).static_order():
+        setattr(obj, name, obj.evalExpression(expressions[name]))
+
+
+def _apply_height(obj: fc.DocumentObject, height_units: int) -> None:
+    """Set the height of a bin and update the properties computed from it."""
+    obj.HeightUnits = height_units
+    evaluate_expressions(obj)
+
+
+def generate(
+    obj: fc.DocumentObject,
+    height_units: Iterable[int],
+    *,
+    proxy: object | None = None,
+) -> dict[int, Part.Shape]:
+    """Generate a bin at several heights.
+
+    The object is generated at the lowest height as usual. Taller variants are derived from it if
+    it has a prismatic band between the features following the bottom and the top of the bin, and
+    generated as usual until one has. The height of the object is restored afterwards.
+
+    Args:
+        obj (FreeCAD.DocumentObject): BinBlank, StorageBin or EcoBin object with a standard height.
+        height_units (Iterable[int]): Heights to generate in height units.
+        proxy (object | None): Feature class instance generating the bin, the object proxy if None.
+
+    Returns:
+        dict[int, Part.Shape]: Shape by height units.
+
+    Raises:
+        TypeError: If the object is not a supported bin.
+        ValueError: If the object has a non standard height.
+        validation.InvalidParametersError: If the parameters are invalid at one of the heights.
+
+    """
+    from . import features
+
+    if proxy is None:
+        proxy = obj.Proxy
+    if not isinstance(proxy, (features.FullBin, features.StorageBin, features.EcoBin)):
+        raise TypeError(f"Height families are not supported for {type(proxy).__name__}")
+    if obj.NonStandardHeight:
+        raise ValueError("Height families need a bin with a standard height")
+
+    original = obj.HeightUnits
+    shapes = {}
+    reference: tuple[Split, float] | None = None
+    try:
+        for units in sorted(set(height_units)):
+            _apply_height(obj, units)
+            validation.raise_on_errors(proxy.validate(obj))
+            if reference is not None:
+                template, height = reference
+                with booleans.object_options(obj):
+                    shapes[units] = template.stretched(float(obj.TotalHeight) - height)
+                continue
+
+            with memo.scope(), booleans.object_options(obj):
+                shape = proxy.generate_gridfinity_shape(obj)
+                z = split_height(obj, shape)
+                if z is not None:
+                    reference = split(shape, z), float(obj.TotalHeight)
+            shapes[units] = shape
+    finally:
+        _apply_height(obj, original)
+    return shapes
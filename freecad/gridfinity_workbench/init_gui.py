@@ -9,8 +9,6 @@ from pathlib import Path
 import FreeCAD as fc  # noqa: N813
 import FreeCADGui as fcg  # noqa: N813
 
-from . import commands
-
 try:
     from FreeCADGui import Workbench
 except ImportError:
@@ -21,6 +19,7 @@ except ImportError:
 
 
 ICONPATH = Path(__file__).parent / "icons"
+UIPATH = Path(__file__).parent / "ui"
 
 
 class GridfinityWorkbench(Workbench):
@@ -49,6 +48,8 @@ class GridfinityWorkbench(Workbench):
         """
         fc.Console.PrintMessage("switching to Gridfinity Workbench\n")
 
+        from . import commands
+
         workbench_commands = OrderedDict(
             [
                 ("CreateBinBlank", commands.CreateBinBlank()),
@@ -56,11 +57,15 @@ class GridfinityWorkbench(Workbench):
                 ("CreateSimpleStorageBin", commands.CreateSimpleStorageBin()),
                 ("CreateEcoBin", commands.CreateEcoBin()),
                 ("CreatePartsBin", commands.CreatePartsBin()),
+                ("CreateBinFamily", commands.CreateBinFamily()),
                 ("CreateBaseplate", commands.CreateBaseplate()),
                 ("CreateMagnetBaseplate", commands.CreateMagnetBaseplate()),
                 ("CreateScrewTogetherBaseplate", commands.CreateScrewTogetherBaseplate()),
                 ("CreateCustomBin", commands.DrawBin()),
                 ("CreateCustomBaseplate", commands.DrawBaseplate()),
+                ("PlanDrawer", commands.PlanDrawer()),
+                ("ExportObjects", commands.ExportObjects()),
+                ("RecomputeParallel", commands.RecomputeParallel()),
                 ("ChangeLayout", commands.ChangeLayout()),
                 ("StandaloneLabelShelf", commands.StandaloneLabelShelf()),
             ],
@@ -74,5 +79,6 @@ class GridfinityWorkbench(Workbench):
 
 
 fcg.addWorkbench(GridfinityWorkbench())
+fcg.addPreferencePage(str(UIPATH / "preferences.ui"), "Gridfinity")
 
 fc.__unit_test__ += ["freecad.gridfinity_workbench.test_gridfinity"]
@@ -7,7 +7,7 @@ import math
 import FreeCAD as fc  # noqa: N813
 import Part
 
-from . import utils
+from . import booleans, edge_index, utils
 
 unitmm = fc.Units.Quantity("1 mm")
 
@@ -42,12 +42,12 @@ def outside_fillet(
     right_fillet.rotate(fc.Vector(0, 0, 0), fc.Vector(0, 0, 1), -90)
     right_fillet.translate(fc.Vector(offset, y_width))
     right_fillet = right_fillet.extrude(fc.Vector(0, 0, -height))
-    shape = shape.cut(right_fillet)
+    shape = booleans.cut(shape, right_fillet)
 
     left_fillet = _corner_fillet(radius)
     left_fillet.translate(fc.Vector(offset, offset))
     left_fillet = left_fillet.extrude(fc.Vector(0, 0, -height))
-    shape = shape.cut(left_fillet)
+    shape = booleans.cut(shape, left_fillet)
 
     return shape
 
@@ -83,14 +83,7 @@ def from_dimensions(
     shape = face.extrude(fc.Vector(0, length))
 
     # Front fillet
-    def fillet_point(p: Part.Vertex) -> bool:
-        return p.Z == -thickness and p.X == width
-
-    h_edges = [
-        edge
-        for edge in shape.Edges
-        if fillet_point(edge.Vertexes[0]) and fillet_point(edge.Vertexes[1])
-    ]
+    h_edges = edge_index.of(shape).horizontal(z=-float(thickness), x=float(width))
     assert len(h_edges) == 1
     shape = shape.makeFillet(thickness.Value - 0.01, h_edges)
 
@@ -3,48 +3,34 @@
 from __future__ import annotations
 
 import math
+from functools import partial
 
 import FreeCAD as fc  # noqa: N813
 import Part
 
-from . import const, utils
+from . import booleans, const, property_schema, shape_cache, utils
+from .property_schema import PropertySpec
 
 unitmm = fc.Units.Quantity("1 mm")
 
 
-def add_properties(
-    obj: fc.DocumentObject,
-    *,
-    remove_channel: bool,
-    chamfer: bool,
-    magnet_holes_default: bool,
-) -> None:
-    """Add magnet holes properties to an object.
-
-    Args:
-        obj (FreeCAD.DocumentObject): Document object.
-        remove_channel (bool): Does the object support magnet remove channel.
-        chamfer (bool): Does the object support hole chamfer.
-        magnet_holes_default (bool): Should magnet holes be enabled by default.
-
-    """
+MAGNET_HOLE_PROPERTIES = (
     ## Gridfinity Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyBool",
         "MagnetHoles",
         "Gridfinity",
         "Toggle the magnet holes on or off",
-    ).MagnetHoles = magnet_holes_default
-
+    ),
     ## Gridfinity Non Standard Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "MagnetHoleDepth",
         "GridfinityNonStandard",
         "Depth of Magnet Holes <br> <br> default = 2.4 mm",
-    ).MagnetHoleDepth = const.MAGNET_HOLE_DEPTH
-
-    obj.addProperty(
+        default=const.MAGNET_HOLE_DEPTH,
+    ),
+    PropertySpec(
         "App::PropertyLength",
         "MagnetHoleDiameter",
         "GridfinityNonStandard",
@@ -52,9 +38,9 @@ def add_properties(
             "Diameter of Magnet Holes. Press fit by default, increase to 6.5 mm if using glue."
             "For crush ribs, 5.7mm is recommended. <br> <br> default = 6.2 mm"
         ),
-    ).MagnetHoleDiameter = const.MAGNET_HOLE_DIAMETER
-
-    obj.addProperty(
+        default=const.MAGNET_HOLE_DIAMETER,
+    ),
+    PropertySpec(
         "App::PropertyEnumeration",
         "MagnetHolesShape",
         "GridfinityNonStandard",
@@ -65,66 +51,107 @@ def add_properties(
             "<br> <br> Crush ribs are an alternative press fit style."
             "<br> <br> Hex is a legacy press fit style."
         ),
-    ).MagnetHolesShape = const.HOLE_SHAPES
-
-    if chamfer:
-        obj.addProperty(
-            "App::PropertyLength",
-            "MagnetHoleChamfer",
-            "GridfinityNonStandard",
-            "The depth at which magnet hole chamfer starts.",
-        ).MagnetHoleChamfer = 0.25
-
-    if remove_channel:
-        obj.addProperty(
-            "App::PropertyBool",
-            "MagnetRemoveChannel",
-            "GridfinityNonStandard",
-            "Toggle the magnet remove channel on or off",
-        ).MagnetRemoveChannel = False
-
-    obj.addProperty(
+        default=const.HOLE_SHAPES,
+    ),
+)
+
+MAGNET_HOLE_CHAMFER_PROPERTY = PropertySpec(
+    "App::PropertyLength",
+    "MagnetHoleChamfer",
+    "GridfinityNonStandard",
+    "The depth at which magnet hole chamfer starts.",
+    default=0.25,
+)
+
+MAGNET_REMOVE_CHANNEL_PROPERTY = PropertySpec(
+    "App::PropertyBool",
+    "MagnetRemoveChannel",
+    "GridfinityNonStandard",
+    "Toggle the magnet remove channel on or off",
+    default=False,
+)
+
+CRUSH_RIBS_PROPERTIES = (
+    PropertySpec(
         "App::PropertyInteger",
         "CrushRibsCount",
         "GridfinityNonStandard",
         "Number of crush ribs <br><br> default = 12",
-    ).CrushRibsCount = const.CRUSH_RIB_N
-
-    obj.addProperty(
+        default=const.CRUSH_RIB_N,
+    ),
+    PropertySpec(
         "App::PropertyFloatConstraint",
         "CrushRibsWaviness",
         "GridfinityNonStandard",
         "Waviness of crush ribs, from range [0, 1]",
-    ).CrushRibsWaviness = (const.CRUSH_RIB_WAVINESS, 0, 1, 0.05)
+        default=(const.CRUSH_RIB_WAVINESS, 0, 1, 0.05),
+    ),
+)
 
+MAGNET_HOLE_EXPERT_PROPERTIES = (
     ## Expert Only Parameters
-    obj.addProperty(
+    PropertySpec(
         "App::PropertyLength",
         "MagnetHoleDistanceFromEdge",
         "zzExpertOnly",
         "Distance of the magnet holes from bin edge <br> <br> default = 8.0 mm",
+        default=const.MAGNET_HOLE_DISTANCE_FROM_EDGE,
         read_only=True,
-    ).MagnetHoleDistanceFromEdge = const.MAGNET_HOLE_DISTANCE_FROM_EDGE
+    ),
+)
 
 
-def _crush_ribs(radius: fc.Units.Quantity, *, n: int, beta: float) -> tuple[Part.Face, float]:
-    """Make crush ribs inner face.
+def add_properties(
+    obj: fc.DocumentObject,
+    *,
+    remove_channel: bool,
+    chamfer: bool,
+    magnet_holes_default: bool,
+) -> None:
+    """Add magnet holes properties to an object.
 
     Args:
-        radius (fc.Units.Quantity): Inner radius.
-        n (int): Number of ribs.
-        beta (float): Waviness of the ribs. It is the angle at wich inner at outer arcs meet.
-        A value of 0 would result in a perfect circle.
+        obj (FreeCAD.DocumentObject): Document object.
+        remove_channel (bool): Does the object support magnet remove channel.
+        chamfer (bool): Does the object support hole chamfer.
+        magnet_holes_default (bool): Should magnet holes be enabled by default.
 
     """
+    specs = list(MAGNET_HOLE_PROPERTIES)
+    if chamfer:
+        specs.append(MAGNET_HOLE_CHAMFER_PROPERTY)
+    if remove_channel:
+        specs.append(MAGNET_REMOVE_CHANNEL_PROPERTY)
+    specs += CRUSH_RIBS_PROPERTIES + MAGNET_HOLE_EXPERT_PROPERTIES
+
+    property_schema.add_properties(obj, specs, MagnetHoles=magnet_holes_default)
+
+
+def _crush_ribs_radii(radius: float, *, n: int, beta: float) -> tuple[float, float, float]:
+    """Get inner radius, radius where the arcs meet and outer radius of crush ribs."""
     alpha = math.pi / n / 2
 
     def get_midpoint(beta: float) -> float:
         return (math.sin(beta) - math.sin(alpha)) / math.sin(beta - alpha)
 
-    r1 = radius.Value
-    r2 = radius.Value / get_midpoint(beta)
+    r1 = radius
+    r2 = radius / get_midpoint(beta)
     r3 = r2 * get_midpoint(-beta)
+    return r1, r2, r3
+
+
+def _crush_ribs(radius: float, *, n: int, beta: float) -> Part.Face:
+    """Make crush ribs inner face.
+
+    Args:
+        radius (float): Inner radius in mm.
+        n (int): Number of ribs.
+        beta (float): Waviness of the ribs. It is the angle at wich inner at outer arcs meet.
+        A value of 0 would result in a perfect circle.
+
+    """
+    alpha = math.pi / n / 2
+    r1, r2, r3 = _crush_ribs_radii(radius, n=n, beta=beta)
 
     p1 = fc.Vector(r2, 0)
     p2 = fc.Vector(r2 * math.cos(2 * alpha), r2 * math.sin(2 * alpha))
@@ -142,23 +169,49 @@ def _crush_ribs(radius: fc.Units.Quantity, *, n: int, beta: float) -> tuple[Part
             math.degrees((i + 0.5) / len(lines) * 2 * math.pi),
         )
         arc.rotate(placement)
-    return utils.curve_to_face(lines), r3 - r1
+    return utils.curve_to_face(lines)
 
 
-def _hex_shape(radius: fc.Units.Quantity) -> Part.Shape:
+def _hex_shape(radius: float) -> Part.Face:
+    """Make a hexagon face with a corner on the x axis, around a circle of the given radius."""
     # Ratio of 2/sqrt(3) converts from inscribed circle radius to circumscribed
     # circle radius
     radius = 2 * radius / math.sqrt(3)
 
-    p = fc.ActiveDocument.addObject("Part::RegularPolygon")
-    p.Polygon = 6
-    p.Circumradius = radius
-    p.recompute()
+    points = [
+        fc.Vector(radius * math.cos(i * math.pi / 3), radius * math.sin(i * math.pi / 3))
+        for i in range(6)
+    ]
+    return Part.Face(Part.makePolygon([*points, points[0]]))
 
-    p_wire: Part.Wire = p.Shape
-    shape = Part.Face(p_wire)
-    fc.ActiveDocument.removeObject(p.Name)
-    return shape
+
+def _round_shape(radius: float) -> Part.Face:
+    return Part.Face(Part.Wire(Part.makeCircle(radius)))
+
+
+def profile(hole_shape: str, radius: float, *, n: int = 0, beta: float = 0) -> Part.Shape:
+    """Get the cross section of a magnet hole.
+
+    Profiles are pure geometry and memoized per parameter set in the shape cache, they must not be
+    modified by the caller.
+
+    Args:
+        hole_shape (str): "Hex", "Crush ribs" or "Round".
+        radius (float): Radius of the magnet in mm.
+        n (int): Number of crush ribs.
+        beta (float): Waviness of the crush ribs, see `_crush_ribs`.
+
+    """
+    if hole_shape == "Hex":
+        key, build = f"hex-{radius!r}", partial(_hex_shape, radius)
+    elif hole_shape == "Crush ribs":
+        key = f"crush_ribs-{radius!r}-{n}-{beta!r}"
+        build = partial(_crush_ribs, radius, n=n, beta=beta)
+    elif hole_shape == "Round":
+        key, build = f"round-{radius!r}", partial(_round_shape, radius)
+    else:
+        raise ValueError(f"Unrecognised magnet hole shape {hole_shape!r}")
+    return shape_cache.cached("magnet_hole_profile", key, build)
 
 
 def from_obj(obj: fc.DocumentObject) -> Part.Shape:
@@ -171,23 +224,17 @@ def from_obj(obj: fc.DocumentObject) -> Part.Shape:
     depth = obj.MagnetHoleDepth
     chamfer_depth = obj.MagnetHoleChamfer if hasattr(obj, "MagnetHoleChamfer") else None
 
+    n = obj.CrushRibsCount
+    beta = obj.CrushRibsWaviness * math.pi / 2
     if hole_shape == "Hex":
-        shape = _hex_shape(radius)
         chamfer_width = (2 / math.sqrt(3) - 1) * radius
     elif hole_shape == "Crush ribs":
-        shape, ch = _crush_ribs(
-            radius,
-            n=obj.CrushRibsCount,
-            beta=obj.CrushRibsWaviness * math.pi / 2,
-        )
-        chamfer_width = ch * unitmm
-    elif hole_shape == "Round":
-        shape = Part.Face(Part.Wire(Part.makeCircle(radius)))
-        chamfer_width = chamfer_depth
+        r1, _, r3 = _crush_ribs_radii(radius.Value, n=n, beta=beta)
+        chamfer_width = (r3 - r1) * unitmm
     else:
-        raise ValueError(f"Unrecognised magnet hole shape {hole_shape:!r}")
+        chamfer_width = chamfer_depth
 
-    shape = shape.extrude(fc.Vector(0, 0, depth))
+    shape = profile(hole_shape, radius.Value, n=n, beta=beta).extrude(fc.Vector(0, 0, depth))
 
     if obj.Baseplate:
         assert chamfer_depth is not None
@@ -197,7 +244,7 @@ def from_obj(obj: fc.DocumentObject) -> Part.Shape:
             chamfer_depth,
             fc.Vector(0, 0, depth - chamfer_depth),
         )
-        shape = shape.fuse(chamfer_shape)
+        shape = booleans.fuse(shape, chamfer_shape)
 
     return shape
 
@@ -0,0 +1,122 @@
+"""Share sub-shapes built more than once while generating the shape of one object.
+
+A single `generate_gridfinity_shape` call can request the same sub-shape several times, for
+example the rounded outline of a custom shape bin is needed for the bin walls and again to sweep
+the stacking lip along. Functions decorated with `memoized` build such a sub-shape once per
+`scope` and return the same result to every later call with equal arguments.
+
+`FoundationGridfinity.execute` opens a scope around every shape generation. Outside of a scope
+memoized functions are called as usual.
+
+Two calls are equal when their arguments are equal, with these rules:
+
+- Quantities compare by value, so `obj.Clearance` and `obj.Clearance.Value` are the same argument.
+- Lists, tuples and vectors compare by their items, which covers layouts.
+- Shapes, document objects and any other object compare by identity. Objects are not expected to
+  change during a scope, so memoized functions must only be called after the derived properties
+  of the object are set, which is how every `generate_gridfinity_shape` is structured.
+
+Results are shared between callers and must not be modified in place: use `translated` instead of
+`translate` on them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import functools
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+import FreeCAD as fc  # noqa: N813
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+@dataclasses.dataclass
+class MemoStatistics:
+    """Number of sub-shapes built and of duplicate builds saved."""
+
+    builds: int = 0
+    saved: int = 0
+
+
+@dataclasses.dataclass
+class Scope:
+    """Results of the memoized calls of one shape generation."""
+
+    results: dict[Hashable, object] = dataclasses.field(default_factory=dict)
+    builds: int = 0
+    saved: int = 0
+    # Arguments compared by identity are kept alive, so their id isn't reused during the scope.
+    pinned: list[object] = dataclasses.field(default_factory=list)
+
+
+_scopes: list[Scope] = []
+_statistics: dict[str, MemoStatistics] = {}
+
+
+@contextlib.contextmanager
+def scope() -> Iterator[Scope]:
+    """Memoize sub-shapes until the context exits.
+
+    Nested scopes don't share results, so an object recomputed while generating another one
+    doesn't see the sub-shapes of the outer object.
+    """
+    current = Scope()
+    _scopes.append(current)
+    try:
+        yield current
+    finally:
+        _scopes.pop()
+
+
+def memoized(func: Callable[P, T]) -> Callable[P, T]:
+    """Return the result of an earlier call with equal arguments in the active scope."""
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        if not _scopes:
+            return func(*args, **kwargs)
+
+        current = _scopes[-1]
+        stats = _statistics.setdefault(name, MemoStatistics())
+        key = (name, _key(args, current), _key(sorted(kwargs.items()), current))
+        if key in current.results:
+            current.saved += 1
+            stats.saved += 1
+            return current.results[key]  # type: ignore[return-value]
+
+        result = current.results[key] = func(*args, **kwargs)
+        current.builds += 1
+        stats.builds += 1
+        return result
+
+    return wrapper
+
+
+def _key(value: object, current: Scope) -> Hashable:
+    if isinstance(value, fc.Units.Quantity):
+        return value.Value
+    if isinstance(value, fc.Vector):
+        return (value.x, value.y, value.z)
+    if isinstance(value, (list, tuple)):
+        return tuple(_key(item, current) for item in value)
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    current.pinned.append(value)
+    return ("id", id(value))
+
+
+def statistics() -> dict[str, MemoStatistics]:
+    """Return the builds and saved duplicate builds of every memoized function."""
+    return {name: dataclasses.replace(stats) for name, stats in _statistics.items()}
+
+
+def reset_statistics() -> None:
+    """Reset the statistics of all memoized functions."""
+    _statistics.clear()
@@ -0,0 +1,180 @@
+"""User preferences of the Gridfinity workbench.
+
+Preferences are stored in the FreeCAD parameter tree under `PARAMETER_PATH` and can be edited
+with Tools > Edit parameters.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+
+import FreeCAD as fc  # noqa: N813
+
+PARAMETER_PATH = "User parameter:BaseApp/Preferences/Mod/Gridfinity"
+
+
+def parameters() -> fc.ParameterGrp:
+    """Get the parameter group of the workbench."""
+    return fc.ParamGet(PARAMETER_PATH)
+
+
+@dataclasses.dataclass(frozen=True)
+class TessellationPreset:
+    """Settings to derive tessellation tolerances from the size of a part.
+
+    The linear deviation is `relative_deviation` times the bounding box diagonal, but never coarser
+    than `feature_fraction` of the smallest radius of the part, and clamped to
+    [min_deviation, max_deviation]. The feature limit grows with the part diagonal beyond
+    `reference_size`, small features of a large part don't need the detail of a small part. The
+    angular deflection starts at `angular_deflection` and is doubled for every 10 times the part
+    diagonal exceeds `reference_size`, up to `max_angular_deflection`.
+
+    The relative deviation of the "Normal" preset is close to the FreeCAD default of 0.5 % of the
+    mean bounding box edge length, so large parts get no more triangles than with the default.
+    """
+
+    relative_deviation: float
+    feature_fraction: float
+    min_deviation: float
+    max_deviation: float
+    angular_deflection: float
+    max_angular_deflection: float
+    reference_size: float = 100
+
+
+TESSELLATION_PRESETS = {
+    "Fine": TessellationPreset(1e-3, 0.25, 0.005, 2, 10, 20),
+    "Normal": TessellationPreset(3e-3, 0.5, 0.01, 10, 20, 40),
+    "Coarse": TessellationPreset(6e-3, 1, 0.02, 20, 28.5, 50),
+}
+DEFAULT_TESSELLATION_PRESET = "Normal"
+
+
+def adaptive_tessellation() -> bool:
+    """Check if the 3D view tessellation should be adapted to the size of Gridfinity objects."""
+    return parameters().GetBool("AdaptiveTessellation", True)  # noqa: FBT003
+
+
+def tessellation_preset() -> TessellationPreset:
+    """Get the tessellation preset selected by the user.
+
+    The preset is chosen with the `TessellationPreset` parameter. Each field of the preset can be
+    overridden by a float parameter named `Tessellation` followed by the field name in
+    PascalCase, for example `TessellationMaxDeviation`. Overrides set to 0 are ignored.
+    """
+    params = parameters()
+    name = params.GetString("TessellationPreset", DEFAULT_TESSELLATION_PRESET)
+    if name not in TESSELLATION_PRESETS:
+        fc.Console.PrintWarning(f"Unknown Gridfinity tessellation preset '{name}', using default\n")
+        name = DEFAULT_TESSELLATION_PRESET
+    preset = TESSELLATION_PRESETS[name]
+
+    overrides = {}
+    for field in dataclasses.fields(preset):
+        value = params.GetFloat("Tessellation" + field.name.title().replace("_", ""), 0)
+        if value > 0:
+            overrides[field.name] = value
+    return dataclasses.replace(preset, **overrides)
+
+
+COMPLEXITY_GUARDS = ("Off", "Warn", "Ask", "Preview")
+DEFAULT_COMPLEXITY_GUARD = "Warn"
+
+
+def complexity_guard() -> str:
+    """Get how objects estimated to take too long to generate are handled.
+
+    One of `COMPLEXITY_GUARDS`, set with the `ComplexityGuard` parameter, see the `complexity`
+    module.
+    """
+    mode = parameters().GetString("ComplexityGuard", DEFAULT_COMPLEXITY_GUARD)
+    if mode not in COMPLEXITY_GUARDS:
+        fc.Console.PrintWarning(f"Unknown Gridfinity complexity guard '{mode}', using default\n")
+        mode = DEFAULT_COMPLEXITY_GUARD
+    return mode
+
+
+def complexity_threshold() -> float:
+    """Get the estimated generation time in seconds above which the complexity guard applies."""
+    return parameters().GetFloat("ComplexityThreshold", 20.0)
+
+
+def shape_cache_budget() -> int:
+    """Get the memory budget of the in-memory shape cache in MB."""
+    return parameters().GetInt("ShapeCacheBudget", 256)
+
+
+def boolean_fuzzy_value() -> float:
+    """Get the fuzzy value in mm of boolean operations, see the `booleans` module."""
+    return max(parameters().GetFloat("BooleanFuzzyValue", 0.0), 0.0)
+
+
+STACKING_LIP_METHODS = ("Sweep", "Offset sections")
+DEFAULT_STACKING_LIP_METHOD = "Sweep"
+
+
+def stacking_lip_method() -> str:
+    """Get how stacking lips are generated.
+
+    One of `STACKING_LIP_METHODS`, set with the `StackingLipMethod` parameter, see the
+    `stacking_lip` module.
+    """
+    method = parameters().GetString("StackingLipMethod", DEFAULT_STACKING_LIP_METHOD)
+    if method not in STACKING_LIP_METHODS:
+        fc.Console.PrintWarning(f"Unknown Gridfinity stacking lip method '{method}', using sweep\n")
+        method = DEFAULT_STACKING_LIP_METHOD
+    return method
+
+
+def smallest_feature_radius(obj: fc.DocumentObject) -> float | None:
+    """Get the smallest radius of a rounded feature of an object in mm, None if it has none."""
+    radii = [
+        getattr(obj, name).Value
+        for name in ("BinBottomRadius", "InsideFilletRadius")
+        if hasattr(obj, name)
+    ]
+    if getattr(obj, "MagnetHoles", False) and getattr(obj, "MagnetHolesShape", "") == "Crush ribs":
+        # width of a single rib
+        radii.append(obj.MagnetHoleDiameter.Value * math.pi / 2 / obj.CrushRibsCount)
+    radii = [r for r in radii if r > 0]
+    return min(radii) if radii else None
+
+
+def tessellation_tolerances(
+    size: float,
+    feature_radius: float | None,
+    preset: TessellationPreset | None = None,
+) -> tuple[float, float]:
+    """Get linear deviation in mm and angular deflection in degrees for a part.
+
+    Args:
+        size (float): Diagonal of the bounding box of the part in mm.
+        feature_radius (float | None): Smallest radius of a rounded feature in mm.
+        preset (TessellationPreset | None): Preset to use, the user preference if None.
+
+    """
+    if preset is None:
+        preset = tessellation_preset()
+
+    scale = max(size / preset.reference_size, 1)
+    deviation = size * preset.relative_deviation
+    if feature_radius is not None:
+        deviation = min(deviation, feature_radius * preset.feature_fraction * scale)
+    deviation = min(max(deviation, preset.min_deviation), preset.max_deviation)
+
+    angular = preset.angular_deflection * 2 ** math.log10(scale)
+    return deviation, min(angular, preset.max_angular_deflection)
+
+
+def object_tessellation_tolerances(obj: fc.DocumentObject) -> tuple[float, float]:
+    """Get linear deviation in mm and angular deflection in degrees for a Gridfinity object.
+
+    The size is taken from the object dimensions, so the shape does not need to be generated.
+    Objects without these dimensions use the bounding box of their shape.
+    """
+    if all(hasattr(obj, name) for name in ("xTotalWidth", "yTotalWidth", "TotalHeight")):
+        size = math.hypot(obj.xTotalWidth.Value, obj.yTotalWidth.Value, obj.TotalHeight.Value)
+    else:
+        size = obj.Shape.BoundBox.DiagonalLength
+    return tessellation_tolerances(size, smallest_feature_radius(obj))
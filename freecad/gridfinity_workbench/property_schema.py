@@ -0,0 +1,75 @@
+"""Declarative definition of the properties of Gridfinity objects.
+
+Properties are described by `PropertySpec` tables next to the code that uses them. The same
+tables add the properties when an object is created and add missing properties when an object of
+an older version is migrated.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import FreeCAD as fc  # noqa: N813
+
+
+@dataclass(frozen=True)
+class PropertySpec:
+    """A property of a Gridfinity object.
+
+    The first four fields are the arguments of `addProperty`. `default` is assigned after the
+    property is added, unless it is None. For enumerations it is the list of options. `expression`
+    is set on the property after all properties of a table have been added, so it may refer to
+    any of them.
+    """
+
+    type: str
+    name: str
+    group: str
+    doc: str
+    default: Any = None
+    read_only: bool = False
+    hidden: bool = False
+    expression: str | None = None
+
+
+def add_properties(
+    obj: fc.DocumentObject,
+    specs: Iterable[PropertySpec],
+    **overrides: object,
+) -> None:
+    """Add the properties of a table to an object.
+
+    Properties the object already has are left untouched, including their value and expression.
+    This makes the function usable for migrations, which only need to add what is missing.
+
+    Args:
+        obj (FreeCAD.DocumentObject): Object to add the properties to.
+        specs (Iterable[PropertySpec]): Properties to add.
+        **overrides: Values assigned instead of the default of the table, by property name.
+
+    """
+    existing = set(obj.PropertiesList)
+    added = [spec for spec in specs if spec.name not in existing]
+
+    add_property = obj.addProperty
+    for spec in added:
+        prop = add_property(
+            spec.type,
+            spec.name,
+            spec.group,
+            spec.doc,
+            read_only=spec.read_only,
+            hidden=spec.hidden,
+        )
+        if spec.default is not None:
+            setattr(prop, spec.name, spec.default)
+        if spec.name in overrides:
+            setattr(prop, spec.name, overrides[spec.name])
+
+    for spec in added:
+        if spec.expression is not None:
+            obj.setExpression(spec.name, spec.expression)
@@ -0,0 +1,197 @@
+"""Control when Gridfinity objects are recomputed.
+
+Scripts editing many objects can wrap their edits in `batch`, which postpones the shape generation
+of all Gridfinity objects in the document until the edits are done:
+
+    from freecad import gridfinity_workbench as gridfinity
+
+    with gridfinity.batch(doc):
+        for obj in bins:
+            obj.xGridUnits = 2
+            obj.HeightUnits = 4
+            ...
+
+`parallel_recompute` recomputes a document with the Gridfinity objects generated in worker
+processes, one object per CPU at a time. `batch(doc, parallel=True)` uses it for the postponed
+recompute.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+from concurrent.futures import BrokenExecutor, Future
+from typing import TYPE_CHECKING
+
+import FreeCAD as fc  # noqa: N813
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Executor
+
+# Names of the objects whose execute was postponed, per document name with an active batch.
+_deferred: dict[str, set[str]] = {}
+
+
+@contextlib.contextmanager
+def batch(doc: fc.Document, *, parallel: bool = False) -> Iterator[None]:
+    """Postpone the shape generation of Gridfinity objects in a document.
+
+    While the context is active, recomputes still evaluate expressions and recompute other
+    objects, but Gridfinity objects keep their current shape. On exit every Gridfinity object that
+    was touched or recomputed in the meantime is recomputed exactly once, by a single document
+    recompute, which follows the dependencies between objects. Nested batches of the same document
+    are merged into the outermost one.
+
+    If the block raises, the document is not recomputed, the postponed objects are left touched.
+
+    Args:
+        doc (FreeCAD.Document): Document to postpone recomputes for.
+        parallel (bool): Generate the postponed objects in worker processes, see
+            `parallel_recompute`.
+
+    """
+    if doc.Name in _deferred:
+        yield
+        return
+
+    deferred = _deferred[doc.Name] = set()
+    try:
+        yield
+    finally:
+        del _deferred[doc.Name]
+        for name in deferred:
+            obj = doc.getObject(name)
+            if obj is not None:
+                obj.touch()
+
+    if deferred:
+        fc.Console.PrintLog(f"Recomputing {len(deferred)} postponed Gridfinity objects.\n")
+    if parallel:
+        parallel_recompute(doc)
+    else:
+        doc.recompute()
+
+
+def defer(obj: fc.DocumentObject) -> bool:
+    """Postpone the execute of an object if its document has an active batch.
+
+    Returns:
+        bool: True if the object should not be executed now.
+
+    """
+    deferred = _deferred.get(obj.Document.Name)
+    if deferred is None:
+        return False
+    deferred.add(obj.Name)
+    return True
+
+
+def _assign(obj: fc.DocumentObject, brep: str, outputs: dict[str, object]) -> None:
+    """Assign a shape generated in a worker process to an object, as its execute would."""
+    import Part
+
+    from . import shape_cache
+
+    shape = Part.Shape()
+    shape.importBrepFromString(brep)
+    for name, value in outputs.items():
+        setattr(obj, name, value)
+    # assigning a shape outside of execute also sets the object placement
+    shape.Placement = obj.Placement
+    obj.Shape = shape
+
+    key = shape_cache.fingerprint(obj)
+    shape_cache.register(obj, key)
+    if obj.TransientShape:
+        shape_cache.store(key, shape)
+    obj.purgeTouched()
+
+
+def _submit(
+    pool: Executor,
+    objects: list[fc.DocumentObject],
+) -> list[Future[tuple[str, dict[str, object]]]]:
+    """Start generating objects in worker processes, returns the build of each object.
+
+    Objects with identical parameters share one build, like in the serial recompute.
+    """
+    from . import worker
+
+    futures: dict[str, Future[tuple[str, dict[str, object]]]] = {}
+    keys = []
+    for obj in objects:
+        spec = worker.spec_of(obj)
+        keys.append(worker.spec_key(spec))
+        if keys[-1] in futures:
+            continue
+        try:
+            futures[keys[-1]] = pool.submit(worker.generate, spec)
+        except BrokenExecutor as e:
+            # the worker processes stopped, the build fails like the builds in progress
+            futures[keys[-1]] = Future()
+            futures[keys[-1]].set_exception(e)
+    return [futures[key] for key in keys]
+
+
+def parallel_recompute(doc: fc.Document, workers: int | None = None) -> int:
+    """Recompute a document, generating its Gridfinity objects in worker processes.
+
+    The document is recomputed once with the execute of Gridfinity objects postponed, which brings
+    their parameters up to date. The postponed objects are then generated from a snapshot of their
+    parameters and layout in a pool of worker processes, see `worker`, and their shapes are
+    assigned back. Objects the workers can't generate, like objects inside a PartDesign Body,
+    objects whose generation failed in a worker, also when the worker processes stopped, and
+    objects depending on the generated ones are recomputed as usual afterwards.
+
+    Args:
+        doc (FreeCAD.Document): Document to recompute.
+        workers (int | None): Number of worker processes, the number of CPUs if None.
+
+    Returns:
+        int: Number of objects generated in worker processes.
+
+    """
+    from . import worker
+
+    deferred = _deferred[doc.Name] = set()
+    try:
+        doc.recompute()
+    finally:
+        del _deferred[doc.Name]
+
+    objects = [obj for obj in map(doc.getObject, sorted(deferred)) if obj is not None]
+    remote = [obj for obj in objects if worker.supports(obj)]
+    local = [obj for obj in objects if not worker.supports(obj)]
+    # starting the workers costs more than generating a single object
+    if len(remote) < 2:  # noqa: PLR2004
+        local += remote
+        remote = []
+
+    generated = []
+    if remote:
+        start = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
+        with worker.executor(workers, warm=False) as pool:
+            for obj, future in zip(remote, _submit(pool, remote)):
+                try:
+                    _assign(obj, *future.result())
+                except Exception as e:  # noqa: BLE001
+                    # the usual recompute generates the object again and reports any error on it
+                    fc.Console.PrintLog(f"{obj.Name}: generating in a worker failed: {e!r}\n")
+                    local.append(obj)
+                    continue
+                generated.append(obj)
+        fc.Console.PrintLog(
+            f"Generated {len(generated)} Gridfinity objects in {workers} processes in "
+            f"{time.perf_counter() - start:.1f} s\n",
+        )
+
+    for obj in local:
+        obj.touch()
+    for obj in generated:
+        for dependent in obj.InList:
+            dependent.touch()
+    doc.recompute()
+    return len(generated)
@@ -0,0 +1,238 @@
+"""Local service generating Gridfinity objects for other programs, like a web configurator.
+
+Starting FreeCAD for every object costs seconds before anything is generated. The service keeps a
+pool of warm worker processes instead, see `worker`, and answers over HTTP on localhost or on a
+Unix socket:
+
+- `POST /generate` with a spec of the `worker` module as JSON body returns the generated file,
+  STL, STEP or BREP. Invalid specs are answered with status 422 and a JSON error message, other
+  failures with status 500 or, when the worker processes stopped, 503.
+- `GET /metrics` returns JSON with the number of builds waiting for a worker, request counts and
+  the latency of recent requests in seconds.
+
+Identical specs requested while one of them is generated share that build. Start the service with
+a python interpreter that can import `freecad`:
+
+    python -m freecad.gridfinity_workbench.server [--port 8765 | --socket PATH] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import http
+import json
+import socketserver
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import FreeCAD as fc  # noqa: N813
+
+from . import worker
+
+CONTENT_TYPES = {"STL": "model/stl", "STEP": "model/step", "BREP": "application/octet-stream"}
+
+# Number of recent requests the latency metrics are computed from.
+LATENCY_WINDOW = 1000
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Get a percentile of sorted values."""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class GenerationService:
+    """Generate specs in a pool of worker processes, sharing the builds of identical specs."""
+
+    def __init__(self, workers: int) -> None:
+        """Create the pool of worker processes, they start with the first builds or `start`."""
+        self.workers = workers
+        self._executor = worker.executor(workers)
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future[bytes]] = {}
+        self._latencies: collections.deque[float] = collections.deque(maxlen=LATENCY_WINDOW)
+        self._counts = {"requests": 0, "coalesced": 0, "completed": 0, "failed": 0}
+
+    def start(self) -> None:
+        """Start and warm up all worker processes, returns when they are ready."""
+        for future in [self._executor.submit(worker.ping) for _ in range(self.workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, after the builds in progress."""
+        self._executor.shutdown()
+
+    def submit(self, spec: dict[str, Any]) -> Future[bytes]:
+        """Start generating a spec, or join the build of an identical spec in progress."""
+        key = worker.spec_key(spec)
+        with self._lock:
+            self._counts["requests"] += 1
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._counts["coalesced"] += 1
+                return future
+            future = self._executor.submit(worker.build, spec)
+            self._in_flight[key] = future
+
+        # outside of the lock, the callback runs right away if the build is already done
+        future.add_done_callback(lambda done: self._finished(key, done))
+        return future
+
+    def _finished(self, key: str, future: Future[bytes]) -> None:
+        with self._lock:
+            del self._in_flight[key]
+            self._counts["failed" if future.exception() else "completed"] += 1
+
+    def generate(self, spec: dict[str, Any]) -> bytes:
+        """Generate a spec and wait for the result.
+
+        Raises:
+            worker.SpecError: If the spec is malformed or the object can't be generated.
+
+        """
+        start = time.perf_counter()
+        try:
+            return self.submit(spec).result()
+        finally:
+            with self._lock:
+                self._latencies.append(time.perf_counter() - start)
+
+    def metrics(self) -> dict[str, Any]:
+        """Get the queue depth, request counts and request latency of the service."""
+        with self._lock:
+            in_flight = len(self._in_flight)
+            latencies = sorted(self._latencies)
+            counts = dict(self._counts)
+
+        latency: dict[str, float] = {"count": len(latencies)}
+        if latencies:
+            latency |= {
+                "mean": sum(latencies) / len(latencies),
+                "p50": _percentile(latencies, 0.5),
+                "p95": _percentile(latencies, 0.95),
+                "max": latencies[-1],
+            }
+        return {
+            "workers": self.workers,
+            "in_flight": in_flight,
+            "queue_depth": max(in_flight - self.workers, 0),
+            **counts,
+            "latency": latency,
+        }
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """Answer the requests of the service, see the module documentation."""
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, data: dict[str, Any]) -> None:
+        self._send(status, json.dumps(data).encode(), "application/json")
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Return the metrics of the service."""
+        if self.path != "/metrics":
+            self._send_json(http.HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+            return
+        self._send_json(http.HTTPStatus.OK, self.server.service.metrics())
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Generate the spec in the request body."""
+        if self.path != "/generate":
+            self._send_json(http.HTTPStatus.NOT_FOUND, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            spec = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError as e:
+            self._send_json(http.HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {e}"})
+            return
+        if not isinstance(spec, dict):
+            self._send_json(http.HTTPStatus.BAD_REQUEST, {"error": "The spec must be an object"})
+            return
+
+        try:
+            data = self.server.service.generate(spec)
+        except worker.SpecError as e:
+            self._send_json(http.HTTPStatus.UNPROCESSABLE_ENTITY, {"error": str(e)})
+        except BrokenExecutor as e:
+            self._send_json(http.HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)})
+        # any other failure of a build is answered too, instead of dropping the connection
+        except Exception as e:  # noqa: BLE001
+            self._send_json(
+                http.HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": f"{type(e).__name__}: {e}"},
+            )
+        else:
+            content_type = CONTENT_TYPES[str(spec.get("format", "STL")).upper()]
+            self._send(http.HTTPStatus.OK, data, content_type)
+
+    def address_string(self) -> str:
+        """Get the client address for the log, clients of a Unix socket have none."""
+        return self.client_address[0] if self.client_address else "unix socket"
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Log requests to the FreeCAD report view instead of stderr."""
+        fc.Console.PrintLog(f"{self.address_string()} - {format % args}\n")
+
+
+class HTTPServer(ThreadingHTTPServer):
+    """HTTP server on a TCP port, with the service answering its requests."""
+
+    def __init__(self, address: tuple[str, int], service: GenerationService) -> None:
+        """Listen on a host and port."""
+        super().__init__(address, RequestHandler)
+        self.service = service
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP server on a Unix socket, with the service answering its requests."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, service: GenerationService) -> None:
+        """Listen on a Unix socket path."""
+        super().__init__(path, RequestHandler)
+        self.service = service
+
+
+def main() -> None:
+    """Run the service until it is interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--socket", type=Path, help="listen on this Unix socket instead")
+    parser.add_argument("--workers", type=int, default=2, help="number of worker processes")
+    args = parser.parse_args()
+
+    service = GenerationService(args.workers)
+    service.start()
+    server: socketserver.BaseServer
+    if args.socket is not None:
+        args.socket.unlink(missing_ok=True)
+        server = UnixHTTPServer(str(args.socket), service)
+        address = str(args.socket)
+    else:
+        server = HTTPServer((args.host, args.port), service)
+        address = f"http://{args.host}:{args.port}"
+
+    fc.Console.PrintMessage(f"Gridfinity generation service listening on {address}\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+"""Local cache for generated Gridfinity shapes.
+
+Shapes are keyed by a fingerprint of the parameters of the object that generated them. This allows
+to restore shapes which are not stored in a document without regenerating them.
+
+Intermediate shapes, like base cells or magnet holes, are kept by `cached` in an in-memory least
+recently used tier, bounded by the `ShapeCacheBudget` preference. Entries can optionally be written
+to the disk tier as well. Statistics are collected per namespace, see `statistics`.
+
+The topology of a shape is stored as OCCT binary BREP, which is smaller and several times faster to
+read than the text BREP format. Next to it a NumPy file holds metadata of the shape, which can be
+read memory mapped without loading the shape. Tessellations are cached as NumPy arrays too, see
+`stl.object_facets`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from . import booleans, preferences
+from .version import __version__
+
+# NumPy is provided by FreeCAD, but is not a dependency of the type check environment.
+# mypy: disable-error-code="import-not-found"
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy as np
+
+# Property groups of the Gridfinity parameters, all other groups belong to FreeCAD itself.
+PARAMETER_PROPERTY_GROUPS = {
+    "Gridfinity",
+    "GridfinityNonStandard",
+    "NonStandard",
+    "zzExpertOnly",
+    "ReferenceParameters",
+    "ReferenceDimensions",
+    "ShouldBeHidden",
+    "Hidden",
+}
+# Parameters which don't influence the generated shape. The fuzzy value is added to fingerprints
+# separately, as the property can defer to a preference.
+IGNORED_PROPERTIES = {"TransientShape", "BooleanFuzzyValue"}
+# Read only properties computed from the other parameters while a shape is generated. They are
+# stale until the first recompute of an object, so fingerprints leave them out.
+DERIVED_PROPERTIES = {
+    "xTotalWidth",
+    "yTotalWidth",
+    "TotalHeight",
+    "UsableHeight",
+    "StackingLipTopChamfer",
+    "VariantNames",
+}
+
+# Record stored next to each cached shape, see `load_metadata`.
+METADATA_DTYPE = [
+    ("bound_box", "<f8", (6,)),
+    ("volume", "<f8"),
+    ("area", "<f8"),
+    ("faces", "<u4"),
+    ("edges", "<u4"),
+    ("solids", "<u4"),
+]
+
+
+def fingerprint(obj: fc.DocumentObject) -> str:
+    """Get a key that identifies the shape generated for an object.
+
+    Two objects with the same fingerprint generate the same shape. The key is made from the
+    object type, the workbench version, the values of all Gridfinity parameters except the derived
+    ones, the custom shape
+    layout or the bin type of a bin family if the object has one, the fuzzy value of its boolean
+    operations and the stacking lip method preference.
+    """
+    parts = [type(obj.Proxy).__name__, __version__]
+    for name in sorted(obj.PropertiesList):
+        if (
+            name in IGNORED_PROPERTIES
+            or name in DERIVED_PROPERTIES
+            or obj.getGroupOfProperty(name) not in PARAMETER_PROPERTY_GROUPS
+        ):
+            continue
+        parts.append(f"{name}={getattr(obj, name)!s}")
+    layout = getattr(obj.Proxy, "layout", None)
+    if layout is not None:
+        parts.append(f"layout={layout!s}")
+    bin_type = getattr(obj.Proxy, "bin_type", None)
+    if bin_type is not None:
+        parts.append(f"bin_type={bin_type}")
+    fuzzy_value = booleans.object_fuzzy_value(obj)
+    if fuzzy_value > 0:
+        parts.append(f"BooleanFuzzyValue={fuzzy_value}")
+    parts.append(f"StackingLipMethod={preferences.stacking_lip_method()}")
+
+    return hashlib.sha1("\n".join(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def cache_dir() -> Path:
+    """Get the directory where cached shapes are stored."""
+    return Path(fc.getUserCachePath()) / "Gridfinity" / "shapes"
+
+
+def _shape_path(key: str) -> Path:
+    return cache_dir() / f"{key}.bbrep"
+
+
+def load(key: str) -> Part.Shape | None:
+    """Get a cached shape, None if the shape is not in the cache."""
+    path = _shape_path(key)
+    if not path.exists():
+        return None
+
+    shape = Part.Shape()
+    try:
+        shape.importBinary(str(path))
+    except Part.OCCError:
+        fc.Console.PrintWarning(f"Removing unreadable cached shape {path}\n")
+        path.unlink(missing_ok=True)
+        return None
+    return None if shape.isNull() else shape
+
+
+def metadata(shape: Part.Shape) -> np.ndarray:
+    """Get the metadata record of a shape, as stored in the cache."""
+    import numpy as np
+
+    bbox = shape.BoundBox
+    record = np.zeros((), dtype=METADATA_DTYPE)
+    record["bound_box"] = (bbox.XMin, bbox.YMin, bbox.ZMin, bbox.XMax, bbox.YMax, bbox.ZMax)
+    record["volume"] = shape.Volume
+    record["area"] = shape.Area
+    record["faces"] = len(shape.Faces)
+    record["edges"] = len(shape.Edges)
+    record["solids"] = len(shape.Solids)
+    return record
+
+
+def store(key: str, shape: Part.Shape) -> None:
+    """Store a shape and its metadata in the cache, overwriting an existing entry."""
+    path = _shape_path(key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file first, so an interrupted write never leaves a corrupt entry.
+    fd, tmp_name = tempfile.mkstemp(suffix=".bbrep", dir=path.parent)
+    os.close(fd)
+    try:
+        shape.exportBinary(tmp_name)
+        Path(tmp_name).replace(path)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+    store_array(f"{key}.meta", metadata(shape))
+
+
+def load_metadata(key: str) -> np.void | None:
+    """Get the metadata of a cached shape without loading the shape.
+
+    The record is memory mapped, its fields are `bound_box` (xmin, ymin, zmin, xmax, ymax, zmax),
+    `volume`, `area` and the number of `faces`, `edges` and `solids`. None if the shape is not in
+    the cache.
+    """
+    record = load_array(f"{key}.meta")
+    if record is None or record.dtype != METADATA_DTYPE:
+        return None
+    return record[()]
+
+
+def load_array(name: str) -> np.ndarray | None:
+    """Get a cached array, memory mapped read only. None if the array is not in the cache."""
+    import numpy as np
+
+    path = cache_dir() / f"{name}.npy"
+    if not path.exists():
+        return None
+
+    try:
+        return np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        fc.Console.PrintWarning(f"Removing unreadable cached array {path}\n")
+        path.unlink(missing_ok=True)
+        return None
+
+
+def store_array(name: str, array: np.ndarray) -> None:
+    """Store an array in the cache, next to the cached shapes."""
+    import numpy as np
+
+    path = cache_dir() / f"{name}.npy"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(suffix=".npy", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, array)
+        Path(tmp_name).replace(path)
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
+def clear() -> None:
+    """Remove all cached shapes and arrays."""
+    # Text BREP files were written by older versions of the workbench.
+    for pattern in ("*.bbrep", "*.brep", "*.npy"):
+        for path in cache_dir().glob(pattern):
+            path.unlink(missing_ok=True)
+
+
+# Per document, the object that generated the shape for a fingerprint.
+_generated_by: dict[str, dict[str, str]] = {}
+
+
+def register(obj: fc.DocumentObject, key: str) -> None:
+    """Make the shape of an object available to other objects in its document with the same key."""
+    # forget the objects of closed documents
+    documents = fc.listDocuments()
+    for doc_name in [name for name in _generated_by if name not in documents]:
+        del _generated_by[doc_name]
+    _generated_by.setdefault(obj.Document.Name, {})[key] = obj.Name
+
+
+def shared_shape(obj: fc.DocumentObject, key: str) -> Part.Shape | None:
+    """Get the shape generated by another object in the document with the same fingerprint.
+
+    The returned shape shares its geometry with the shape of the other object, only its placement
+    is reset. None if no up to date object with the same fingerprint exists.
+    """
+    name = _generated_by.get(obj.Document.Name, {}).get(key)
+    if name is None or name == obj.Name:
+        return None
+
+    other = obj.Document.getObject(name)
+    if (
+        other is None
+        or other.Shape.isNull()
+        or {"Touched", "Invalid"} & set(other.State)
+        or fingerprint(other) != key
+    ):
+        return None
+
+    shape = other.Shape
+    shape.Placement = fc.Placement()
+    return shape
+
+
+# Rough memory use of OCCT topology, measured on Gridfinity shapes with typical surface types.
+BYTES_PER_FACE = 4000
+BYTES_PER_EDGE = 1000
+
+
+def estimated_bytes(shape: Part.Shape) -> int:
+    """Estimate the memory used by a shape from its face and edge count."""
+    return len(shape.Faces) * BYTES_PER_FACE + len(shape.Edges) * BYTES_PER_EDGE
+
+
+@dataclasses.dataclass
+class CacheStatistics:
+    """Counters of the in-memory cache for a namespace."""
+
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+# In-memory tier, the least recently used entry first. Keys are (namespace, key) pairs.
+_memory: OrderedDict[tuple[str, str], tuple[Part.Shape, int]] = OrderedDict()
+_statistics: dict[str, CacheStatistics] = {}
+
+
+def _namespace_statistics(namespace: str) -> CacheStatistics:
+    return _statistics.setdefault(namespace, CacheStatistics())
+
+
+def _remove(entry: tuple[str, str]) -> None:
+    _, size = _memory.pop(entry)
+    stats = _namespace_statistics(entry[0])
+    stats.entries -= 1
+    stats.bytes -= size
+
+
+def cached(
+    namespace: str,
+    key: str,
+    build: Callable[[], Part.Shape],
+    *,
+    disk: bool = False,
+) -> Part.Shape:
+    """Get a shape from the cache, building and caching it on a miss.
+
+    The returned shape must not be modified, use `copy` or `translated` on it instead.
+
+    Args:
+        namespace (str): Kind of shape, for example "magnet_hole". Statistics are per namespace.
+        key (str): Identifies the shape within the namespace, made from all values it depends on.
+        build (Callable): Creates the shape on a cache miss.
+        disk (bool): Also look up and store the shape in the disk tier.
+
+    """
+    stats = _namespace_statistics(namespace)
+    entry = (namespace, key)
+    if entry in _memory:
+        _memory.move_to_end(entry)
+        stats.hits += 1
+        return _memory[entry][0]
+
+    disk_key = f"{namespace}-{key}"
+    shape = load(disk_key) if disk else None
+    if shape is not None:
+        stats.disk_hits += 1
+    else:
+        stats.misses += 1
+        shape = build()
+        if disk:
+            store(disk_key, shape)
+
+    size = estimated_bytes(shape)
+    _memory[entry] = (shape, size)
+    stats.entries += 1
+    stats.bytes += size
+    trim()
+    return shape
+
+
+def memory_budget() -> int:
+    """Get the byte budget of the in-memory tier, from the ShapeCacheBudget preference in MB."""
+    return preferences.shape_cache_budget() * 1024 * 1024
+
+
+def trim(budget: int | None = None) -> None:
+    """Evict least recently used entries until the in-memory tier fits a byte budget.
+
+    Args:
+        budget (int | None): Bytes to keep, the `memory_budget` if None.
+
+    """
+    if budget is None:
+        budget = memory_budget()
+    total = sum(size for _, size in _memory.values())
+    while _memory and total > budget:
+        entry = next(iter(_memory))
+        total -= _memory[entry][1]
+        _remove(entry)
+        _namespace_statistics(entry[0]).evictions += 1
+
+
+def clear_memory(namespace: str | None = None) -> None:
+    """Remove the entries of a namespace, or all entries, from the in-memory tier."""
+    for entry in [entry for entry in _memory if namespace in (None, entry[0])]:
+        _remove(entry)
+
+
+def statistics() -> dict[str, CacheStatistics]:
+    """Get a copy of the in-memory cache statistics per namespace."""
+    return {namespace: dataclasses.replace(stats) for namespace, stats in _statistics.items()}
+
+
+def reset_statistics() -> None:
+    """Reset the hit, miss and eviction counters, keeping the cached entries."""
+    for stats in _statistics.values():
+        stats.hits = stats.disk_hits = stats.misses = stats.evictions = 0
@@ -0,0 +1,145 @@
+"""Generators of the stacking lip solid.
+
+The stacking lip is the profile of `feature_construction._stacking_lip_profile` carried along the
+outline of a bin. Two generators are available, chosen with the `StackingLipMethod` preference:
+
+- "Sweep" sweeps the profile along the outline with `makePipe`.
+- "Offset sections" offsets the outline face inwards by the width of the lip at every break of
+  the profile and lofts between the offsets. The lip is a prism of the outline face with these
+  lofts cut from it. On custom shapes with many concave corners this avoids the sweep, which is
+  slow there and sometimes fails. Profiles it can't handle fall back to the sweep.
+
+Generated lips are kept in the shape cache, keyed by the geometry of the outline and the profile.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from . import booleans, preferences, shape_cache
+
+# Distance in mm below which profile coordinates are considered equal.
+TOLERANCE = 1e-6
+
+
+def sweep(outline: Part.Wire, profile: Part.Wire) -> Part.Shape:
+    """Sweep a profile wire, placed on the outline, along the outline."""
+    stacking_lip = Part.Wire(outline).makePipe(profile)
+    stacking_lip = Part.makeSolid(stacking_lip)
+    return stacking_lip
+
+
+def _section(outline: Part.Face, width: float, z: float) -> Part.Wire:
+    """Return the outline offset inwards by a width, at a height."""
+    face = outline if width <= TOLERANCE else outline.makeOffset2D(-width)
+    return face.OuterWire.translated(fc.Vector(0, 0, z - outline.BoundBox.ZMin))
+
+
+def _profile_points(outline: Part.Wire, profile: Part.Wire) -> list[tuple[float, float]]:
+    """Return the profile vertices as distance inwards from the outline and height."""
+    z = outline.BoundBox.ZMin
+    points = []
+    for vertex in profile.OrderedVertexes:
+        point = vertex.Point
+        distance = outline.distToShape(Part.Vertex(fc.Vector(point.x, point.y, z)))[0]
+        points.append((distance, point.z))
+    return points
+
+
+def _inner_edges(
+    points: list[tuple[float, float]],
+) -> list[tuple[tuple[float, float], tuple[float, float]]]:
+    """Return the profile edges facing the inside of the bin, from bottom to top.
+
+    Raises:
+        ValueError: If the profile is not bounded by the outline on one side and by exactly one
+            inner edge at every height on the other side.
+
+    """
+    edges = []
+    for start, end in zip(points, points[1:] + points[:1]):
+        on_outline = start[0] <= TOLERANCE and end[0] <= TOLERANCE
+        if on_outline or abs(start[1] - end[1]) <= TOLERANCE:
+            continue
+        edges.append((start, end) if start[1] < end[1] else (end, start))
+    edges.sort(key=lambda edge: edge[0][1])
+
+    heights = [z for _, z in points]
+    ends = [(min(heights), edges[0][0][1] if edges else None)]
+    ends += [(lower[1][1], upper[0][1]) for lower, upper in zip(edges, edges[1:])]
+    ends.append((max(heights), edges[-1][1][1] if edges else None))
+    if any(end is None or abs(start - end) > TOLERANCE for start, end in ends):
+        raise ValueError("Stacking lip profile is not a section of the outline at every height")
+    return edges
+
+
+def offset_sections(outline: Part.Wire, profile: Part.Wire) -> Part.Shape:
+    """Build the solid of a profile carried along an outline from offsets of the outline.
+
+    Raises:
+        ValueError: If the profile isn't bounded by the outline on its outer side.
+
+    """
+    points = _profile_points(outline, profile)
+    if all(distance > TOLERANCE for distance, _ in points):
+        raise ValueError("Stacking lip profile does not touch the outline")
+    edges = _inner_edges(points)
+
+    face = Part.Face(Part.Wire(outline))
+    bottom = min(z for _, z in points)
+    top = max(z for _, z in points)
+
+    cutters: list[Part.Shape] = []
+    for (width1, z1), (width2, z2) in edges:
+        section = _section(face, width1, z1)
+        if abs(width1 - width2) <= TOLERANCE:
+            cutters.append(Part.Face(section).extrude(fc.Vector(0, 0, z2 - z1)))
+        else:
+            sections = [section, _section(face, width2, z2)]
+            cutters.append(Part.makeLoft(sections, solid=True, ruled=True))
+
+    prism = face.translated(fc.Vector(0, 0, bottom - face.BoundBox.ZMin))
+    prism = prism.extrude(fc.Vector(0, 0, top - bottom))
+    return booleans.cut(prism, Part.makeCompound(cutters)).removeSplitter()
+
+
+def _coordinates(point: fc.Vector) -> str:
+    return f"{point.x:.6f},{point.y:.6f},{point.z:.6f}"
+
+
+def _key(method: str, outline: Part.Wire, profile: Part.Wire) -> str:
+    parts = [method, f"{booleans.fuzzy_value()!r}"]
+    for edge in Part.Wire(outline).Edges:
+        parts.append(type(edge.Curve).__name__)
+        parts.extend(_coordinates(edge.valueAt(u)) for u in edge.ParameterRange)
+        if hasattr(edge.Curve, "Radius"):
+            parts.append(f"{edge.Curve.Radius:.6f}")
+    parts.extend(_coordinates(vertex.Point) for vertex in profile.OrderedVertexes)
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def make(outline: Part.Wire, profile: Part.Wire) -> Part.Shape:
+    """Get the stacking lip of an outline with the generator chosen in the preferences.
+
+    The returned shape is shared through the shape cache and must not be modified, use `copy` or
+    `translated` on it instead.
+
+    Args:
+        outline (Part.Wire): Outside wall of the bin.
+        profile (Part.Wire): Stacking lip profile, placed on the outline.
+
+    """
+    method = preferences.stacking_lip_method()
+
+    def build() -> Part.Shape:
+        if method == "Offset sections":
+            try:
+                return offset_sections(outline, profile)
+            except (ValueError, Part.OCCError) as e:
+                fc.Console.PrintLog(f"Offset sections stacking lip failed, sweeping it: {e}\n")
+        return sweep(outline, profile)
+
+    return shape_cache.cached("stacking_lip", _key(method, outline, profile), build)
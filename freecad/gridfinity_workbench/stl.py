@@ -0,0 +1,121 @@
+"""Binary STL export from cached triangulations.
+
+The triangulation of a Gridfinity shape is stored as a NumPy array laid out exactly like the
+facet records of a binary STL file, next to the shape cache. Exporting an unchanged object again
+only reads this array and writes it out, without generating or tessellating the shape.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+# NumPy is provided by FreeCAD, but is not a dependency of the type check environment.
+# mypy: disable-error-code="import-not-found"
+import FreeCAD as fc  # noqa: N813
+import numpy as np
+
+from . import complexity, shape_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import Mesh
+    import Part
+
+# One binary STL facet record: normal, three vertices and an unused attribute, 50 bytes.
+FACET_DTYPE = np.dtype([("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attr", "<u2")])
+
+
+def mesh_from_shape(shape: Part.Shape, deviation: float, angular_deflection: float) -> Mesh.Mesh:
+    """Tessellate a shape.
+
+    Args:
+        shape (Part.Shape): Shape to tessellate.
+        deviation (float): Maximum linear deviation from the surface in mm.
+        angular_deflection (float): Maximum angle between neighbouring facets in degrees.
+
+    """
+    import MeshPart
+
+    return MeshPart.meshFromShape(
+        Shape=shape,
+        LinearDeflection=deviation,
+        AngularDeflection=math.radians(angular_deflection),
+        Relative=False,
+    )
+
+
+def facets_from_shape(shape: Part.Shape, deviation: float, angular_deflection: float) -> np.ndarray:
+    """Tessellate a shape into STL facet records."""
+    points, triangles = mesh_from_shape(shape, deviation, angular_deflection).Topology
+    vertices = np.array([(p.x, p.y, p.z) for p in points], dtype=np.float64)
+    corners = vertices[np.array(triangles, dtype=np.int64).reshape(-1, 3)]
+
+    facets = np.zeros(len(corners), dtype=FACET_DTYPE)
+    facets["vertices"] = corners
+    facets["normal"] = _normals(corners)
+    return facets
+
+
+def _normals(corners: np.ndarray) -> np.ndarray:
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    return np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+
+def transformed(facets: np.ndarray, placement: fc.Placement) -> np.ndarray:
+    """Get a copy of facet records moved by a placement."""
+    if placement.isIdentity():
+        return facets
+    matrix = placement.toMatrix()
+    rotation = np.array(matrix.A, dtype=np.float64).reshape(4, 4)[:3, :3]
+    translation = np.array([placement.Base.x, placement.Base.y, placement.Base.z])
+
+    result = np.array(facets)
+    result["vertices"] = facets["vertices"] @ rotation.T + translation
+    result["normal"] = facets["normal"] @ rotation.T
+    return result
+
+
+def object_facets(
+    obj: fc.DocumentObject,
+    deviation: float,
+    angular_deflection: float,
+) -> np.ndarray:
+    """Get the STL facet records of a Gridfinity object, in document coordinates.
+
+    The triangulation is cached by the fingerprint of the object and the tolerances, so it is only
+    computed the first time an unchanged object is exported. Objects inside a PartDesign Body are
+    always tessellated, their shape depends on the base feature.
+    """
+    if hasattr(obj, "BaseFeature") and obj.BaseFeature is not None:
+        return facets_from_shape(obj.Shape, deviation, angular_deflection)
+
+    name = f"{shape_cache.fingerprint(obj)}-{deviation:g}-{angular_deflection:g}.stl"
+    facets = shape_cache.load_array(name)
+    if facets is None or facets.dtype != FACET_DTYPE:
+        shape = complexity.full_shape(obj)
+        shape.Placement = fc.Placement()
+        facets = facets_from_shape(shape, deviation, angular_deflection)
+        shape_cache.store_array(name, facets)
+
+    return transformed(facets, obj.Placement)
+
+
+def _header(facets: np.ndarray, name: str) -> bytes:
+    """Get the header and facet count preceding the facet records of a binary STL file."""
+    header = f"Gridfinity {name}".encode()[:80].ljust(80, b" ")
+    return header + np.array(len(facets), dtype="<u4").tobytes()
+
+
+def write_binary_stl(path: Path, facets: np.ndarray, name: str = "") -> None:
+    """Write facet records to a binary STL file."""
+    with path.open("wb") as f:
+        f.write(_header(facets, name))
+        np.asarray(facets, dtype=FACET_DTYPE).tofile(f)
+
+
+def binary_stl(facets: np.ndarray, name: str = "") -> bytes:
+    """Get the content of a binary STL file of facet records."""
+    return _header(facets, name) + np.asarray(facets, dtype=FACET_DTYPE).tobytes()
@@ -1,13 +1,16 @@
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from tempfile import gettempdir
+from unittest import mock
 
 import FreeCAD as fc  # noqa: N813
 import FreeCADGui as fcg  # noqa: N813
 
 from freecad.gridfinity_workbench.custom_shape import GridDialogData
 
-from . import custom_shape
+from . import custom_shape, features, recompute, worker
 
 TEMPDIR = Path(gettempdir())
 DOC_NAME = "GridfinityDocument"
@@ -62,6 +65,18 @@ class TestCommands(unittest.TestCase):
         fc.closeDocument(DOC_NAME)
 
 
+class TestExportCommand(TestWithDocument):
+    def test_active_with_other_objects(self) -> None:
+        self.doc.addObject("Part::Box", "Box")
+        self.doc.recompute()
+        fcg.Selection.clearSelection()
+        self.assertFalse(fcg.Command.get("ExportObjects").isActive())
+
+        fcg.Command.get("CreatePartsBin").run()
+        fcg.Selection.clearSelection()
+        self.assertTrue(fcg.Command.get("ExportObjects").isActive())
+
+
 class TestSave(unittest.TestCase):
     def test_reopen(self) -> None:
         filepath = str(TEMPDIR / self.__class__.__name__) + ".FCStd"
@@ -124,6 +139,125 @@ class TestGenerationLocation(TestWithDocument):
             self.assertAlmostEqual(center.y, 0, msg=command_name)
 
 
+class TestSharedShapes(TestWithDocument):
+    def test_identical_objects_share_shape(self) -> None:
+        fcg.Command.get("CreatePartsBin").run()
+        obj1 = fcg.ActiveDocument.ActiveObject.Object
+        fcg.Command.get("CreatePartsBin").run()
+        obj2 = fcg.ActiveDocument.ActiveObject.Object
+        self.assertTrue(obj2.Shape.isPartner(obj1.Shape))
+
+        obj2.Placement = fc.Placement(fc.Vector(100, 0, 0), fc.Rotation())
+        self.doc.recompute()
+        self.assertTrue(obj2.Shape.isPartner(obj1.Shape))
+        self.assertAlmostEqual(obj2.Shape.BoundBox.XMin, obj1.Shape.BoundBox.XMin + 100)
+
+        obj2.xGridUnits = 3
+        self.doc.recompute()
+        self.assertFalse(obj2.Shape.isPartner(obj1.Shape))
+        self.assertGreater(obj2.Shape.Volume, obj1.Shape.Volume)
+
+    def test_new_objects_share_shape(self) -> None:
+        objects = []
+        for i in range(3):
+            obj = self.doc.addObject("Part::FeaturePython", f"Bin{i}")
+            features.PartsBin(obj)
+            objects.append(obj)
+        self.doc.recompute()
+
+        for obj in objects[1:]:
+            self.assertTrue(obj.Shape.isPartner(objects[0].Shape), msg=obj.Name)
+
+
+class TestBatch(TestWithDocument):
+    def test_recompute_postponed(self) -> None:
+        fcg.Command.get("CreatePartsBin").run()
+        obj = fcg.ActiveDocument.ActiveObject.Object
+        volume = obj.Shape.Volume
+
+        with recompute.batch(self.doc):
+            obj.xGridUnits = 3
+            self.doc.recompute()
+            self.assertAlmostEqual(obj.Shape.Volume, volume)
+
+        self.assertGreater(obj.Shape.Volume, volume)
+        self.assertNotIn("Touched", obj.State)
+
+    def test_recompute_parallel(self) -> None:
+        for command_name in ("CreatePartsBin", "CreateEcoBin", "CreateBaseplate"):
+            fcg.Command.get(command_name).run()
+        objects = self.doc.Objects
+        volumes = {}
+        for obj in objects:
+            obj.xGridUnits = 3
+            obj.recompute()
+            volumes[obj.Name] = obj.Shape.Volume
+            obj.xGridUnits = 1
+        self.doc.recompute()
+
+        with recompute.batch(self.doc, parallel=True):
+            for obj in objects:
+                obj.xGridUnits = 3
+
+        for obj in objects:
+            self.assertAlmostEqual(obj.Shape.Volume, volumes[obj.Name], msg=obj.Name)
+            self.assertAlmostEqual(obj.xTotalWidth.Value, 3 * obj.xGridSize.Value, msg=obj.Name)
+            self.assertNotIn("Touched", obj.State)
+
+    def _assert_recomputed_locally(self, x_grid_units: int) -> None:
+        objects = self.doc.Objects
+        with recompute.batch(self.doc, parallel=True):
+            for obj in objects:
+                obj.xGridUnits = x_grid_units
+
+        for obj in objects:
+            self.assertAlmostEqual(obj.xTotalWidth.Value, x_grid_units * obj.xGridSize.Value)
+            self.assertAlmostEqual(obj.Shape.BoundBox.XLength, obj.xTotalWidth.Value)
+            self.assertNotIn("Touched", obj.State)
+
+    def test_recompute_parallel_fallback(self) -> None:
+        for _ in range(2):
+            fcg.Command.get("CreatePartsBin").run()
+
+        # a build failing in a worker
+        with (
+            mock.patch.object(worker, "executor", return_value=ThreadPoolExecutor()),
+            mock.patch.object(worker, "generate", side_effect=RuntimeError("crashed")),
+        ):
+            self._assert_recomputed_locally(2)
+
+        # worker processes that stopped
+        pool = mock.MagicMock()
+        pool.__exit__.return_value = False
+        pool.__enter__.return_value.submit.side_effect = BrokenProcessPool("stopped")
+        with mock.patch.object(worker, "executor", return_value=pool):
+            self._assert_recomputed_locally(3)
+
+
+class TestValidation(TestWithDocument):
+    def test_scoop_with_low_dividers(self) -> None:
+        fcg.Command.get("CreatePartsBin").run()
+        obj = fcg.ActiveDocument.ActiveObject.Object
+        obj.xDividers = 1
+        obj.xDividerHeight = 5
+        obj.recompute()
+
+        self.assertNotIn("Invalid", obj.State)
+        self.assertFalse(obj.Shape.isNull())
+        self.assertGreater(obj.xDividerHeight.Value, 5)
+
+    def test_fillet_larger_than_inside_corner(self) -> None:
+        fcg.Command.get("CreatePartsBin").run()
+        obj = fcg.ActiveDocument.ActiveObject.Object
+        obj.WallThickness = 3.5
+        obj.InsideFilletRadius = 1.85
+        obj.recompute()
+
+        self.assertNotIn("Invalid", obj.State)
+        self.assertTrue(obj.Shape.isValid())
+        self.assertEqual(len(obj.Shape.Solids), 1)
+
+
 class TestVolumes(TestWithDocument):
     def test_custom_bin_rectangle(self) -> None:
         custom_shape.custom_bin_dialog = lambda _1, _2: GridDialogData(
@@ -174,6 +308,38 @@ class TestVolumes(TestWithDocument):
         obj.recompute()
         self.assertAlmostEqual(obj.Shape.Volume, 24728.976287436377)
 
+    def test_bin_family(self) -> None:
+        fcg.Command.get("CreatePartsBin").run()
+        single = fcg.ActiveDocument.ActiveObject.Object
+        single.MagnetHoles = False
+        single.xGridUnits = 1
+        single.yGridUnits = 1
+        single.HeightUnits = 3
+        single.recompute()
+
+        fcg.Command.get("CreateBinFamily").run()
+        obj = fcg.ActiveDocument.ActiveObject.Object
+        obj.MagnetHoles = False
+        obj.xGridUnitsList = [1, 2]
+        obj.yGridUnitsList = [1]
+        obj.HeightUnitsList = [3, 6]
+        height_units = obj.HeightUnits
+        obj.recompute()
+        self.assertEqual(
+            obj.VariantNames,
+            ["PartsBin_1x1x3", "PartsBin_1x1x6", "PartsBin_2x1x3", "PartsBin_2x1x6"],
+        )
+        variants = obj.Shape.childShapes()
+        self.assertEqual(len(variants), 4)
+        self.assertAlmostEqual(variants[0].Volume, single.Shape.Volume)
+        self.assertGreater(variants[1].Volume, variants[0].Volume)
+        # the variant properties are restored after generating the family
+        self.assertEqual(obj.HeightUnits, height_units)
+
+        obj.NonStandardHeight = True
+        errors = obj.Proxy.validate(obj)
+        self.assertEqual([error.prop for error in errors], ["NonStandardHeight"])
+
     def test_baseplate(self) -> None:
         fcg.Command.get("CreateBaseplate").run()
         obj = fcg.ActiveDocument.ActiveObject.Object
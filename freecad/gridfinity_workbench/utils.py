@@ -13,6 +13,8 @@ import FreeCAD as fc  # noqa: N813
 import FreeCADGui as fcg  # noqa: N813
 import Part
 
+from . import booleans
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
@@ -263,7 +265,7 @@ def multi_fuse(lst: list[Part.Shape]) -> Part.Shape:
         raise ValueError("The list is empty")
     if len(lst) == 1:
         return lst[0]
-    return lst[0].multiFuse(lst[1:])
+    return booleans.multi_fuse(lst[0], lst[1:])
 
 
 def loop(lst: list[fc.Vector]) -> list[Part.LineSegment]:
@@ -0,0 +1,189 @@
+"""Check the parameters of Gridfinity objects before generating their shape.
+
+Invalid parameter combinations make the shape generation fail, often after a lot of geometry has
+been built already. The checks in this module only compare property values, so they can run at
+the start of every recompute. Each feature class combines the checks matching its features in
+`FoundationGridfinity.validate`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import FreeCAD as fc  # noqa: N813
+
+from . import feature_construction as feat
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+unitmm = fc.Units.Quantity("1 mm")
+
+# Smallest inside radius used by storage bins, see `StorageBin.generate_gridfinity_shape`.
+MIN_STORAGE_BIN_INSIDE_RADIUS = 0.5 * unitmm
+
+
+@dataclass(frozen=True)
+class ParameterError:
+    """An invalid property value."""
+
+    prop: str
+    message: str
+
+    def __str__(self) -> str:
+        """Format the error for messages, prefixed with the property name."""
+        return f"{self.prop}: {self.message}"
+
+
+class InvalidParametersError(ValueError):
+    """Raised when an object can't be generated with its current parameters."""
+
+    def __init__(self, errors: Iterable[ParameterError]) -> None:
+        """Store the errors, the message lists one error per line."""
+        self.errors = list(errors)
+        super().__init__("\n".join(str(error) for error in self.errors))
+
+
+def validate(obj: fc.DocumentObject) -> list[ParameterError]:
+    """Check all parameters of a Gridfinity object.
+
+    Properties set by expressions, like `xTotalWidth`, are only updated by a recompute, so after
+    changing grid units or grid size the object has to be recomputed to validate them.
+
+    Returns:
+        list[ParameterError]: Problems found, empty if the object can be generated.
+
+    """
+    return obj.Proxy.validate(obj)
+
+
+def raise_on_errors(errors: list[ParameterError]) -> None:
+    """Raise an InvalidParametersError if there are any errors."""
+    if errors:
+        raise InvalidParametersError(errors)
+
+
+def grid_units(obj: fc.DocumentObject) -> list[ParameterError]:
+    """Check that a rectangular layout has at least one grid unit in each direction."""
+    return [
+        ParameterError(prop, "must be at least 1")
+        for prop in ("xGridUnits", "yGridUnits")
+        if getattr(obj, prop) + 1e-6 < 1
+    ]
+
+
+def outer_radius(obj: fc.DocumentObject) -> list[ParameterError]:
+    """Check the corner radius of a rectangular bin or baseplate against its size."""
+    half_width = min(obj.xTotalWidth, obj.yTotalWidth) / 2
+    if obj.BinOuterRadius <= 0:
+        return [ParameterError("BinOuterRadius", "must be greater than 0 mm")]
+    if obj.BinOuterRadius >= half_width:
+        return [ParameterError("BinOuterRadius", f"must be smaller than {half_width}")]
+    return []
+
+
+def wall_thickness(
+    obj: fc.DocumentObject,
+    *,
+    min_inside_radius: fc.Units.Quantity | None = None,
+) -> list[ParameterError]:
+    """Check the wall thickness against the outer radius and the size of a rectangular bin.
+
+    Args:
+        obj (FreeCAD.DocumentObject): Document object.
+        min_inside_radius (Quantity | None): Smallest inside corner radius the bin uses instead of
+            the outer radius minus the wall thickness. If None, the wall must be thinner than the
+            outer radius.
+
+    """
+    inside_radius = obj.BinOuterRadius - obj.WallThickness
+    if min_inside_radius is not None:
+        inside_radius = max(inside_radius, min_inside_radius)
+    elif inside_radius <= 0:
+        return [
+            ParameterError(
+                "WallThickness",
+                f"must be smaller than BinOuterRadius {obj.BinOuterRadius}",
+            ),
+        ]
+
+    half_inside_width = min(obj.xTotalWidth, obj.yTotalWidth) / 2 - obj.WallThickness
+    if inside_radius >= half_inside_width:
+        return [ParameterError("WallThickness", "leaves no room inside the bin")]
+    return []
+
+
+def compartments(obj: fc.DocumentObject) -> list[ParameterError]:
+    """Check that the dividers leave room for the compartments."""
+    errors = []
+    for axis in ("x", "y"):
+        dividers = getattr(obj, f"{axis}Dividers")
+        if dividers < 0:
+            errors.append(ParameterError(f"{axis}Dividers", "must not be negative"))
+            continue
+        inside_width = getattr(obj, f"{axis}TotalWidth") - obj.WallThickness * 2
+        if dividers * obj.DividerThickness >= inside_width:
+            errors.append(
+                ParameterError(f"{axis}Dividers", "dividers don't fit inside the bin"),
+            )
+    return errors
+
+
+def divider_heights(obj: fc.DocumentObject) -> list[ParameterError]:
+    """Check the divider heights, 0 makes dividers as high as the bin.
+
+    Heights below the minimum of `feature_construction.min_divider_height` are not an error, they
+    are raised to the minimum with a warning while generating the shape.
+    """
+    return [
+        ParameterError(prop, "must not be negative")
+        for prop in ("xDividerHeight", "yDividerHeight")
+        if getattr(obj, prop) < 0
+    ]
+
+
+def scoop(
+    obj: fc.DocumentObject,
+    usable_height: fc.Units.Quantity | None = None,
+    *,
+    eco: bool = False,
+) -> list[ParameterError]:
+    """Check that a scoop fits the compartments, if the scoop is enabled.
+
+    The x divider height is raised to its minimum first, like when the shape is generated.
+    """
+    if not obj.Scoop:
+        return []
+    if usable_height is None:
+        usable_height = obj.UsableHeight
+    x_divider_height = obj.xDividerHeight
+    if x_divider_height != 0:
+        x_divider_height = max(x_divider_height, feat.min_divider_height(obj, eco=eco))
+    if feat.scoop_radius(obj, usable_height, x_divider_height) <= 0:
+        return [
+            ParameterError(
+                "ScoopRadius",
+                "no scoop fits the compartment width, divider height and usable height",
+            ),
+        ]
+    return []
+
+
+def bin_bottom_holes(obj: fc.DocumentObject) -> list[ParameterError]:
+    """Check the magnet hole diameter against the screw hole diameter of bins."""
+    if not (obj.MagnetHoles and obj.ScrewHoles):
+        return []
+    return screw_holes(obj)
+
+
+def screw_holes(obj: fc.DocumentObject) -> list[ParameterError]:
+    """Check that screw holes fit inside the magnet holes."""
+    if obj.MagnetHoleDiameter <= obj.ScrewHoleDiameter:
+        return [
+            ParameterError(
+                "MagnetHoleDiameter",
+                f"must be greater than ScrewHoleDiameter {obj.ScrewHoleDiameter}",
+            ),
+        ]
+    return []
@@ -0,0 +1,289 @@
+"""Generate Gridfinity objects described by plain data, in worker processes.
+
+An object is described by a spec, a JSON compatible dictionary with the feature type, the values
+of its parameters and, for custom shapes, the layout:
+
+    {
+        "type": "CustomStorageBin",
+        "properties": {"HeightUnits": 4, "MagnetHoles": false, "xDividers": 1},
+        "layout": [[true, true], [true, false]],
+        "stacking_lip_method": "Sweep",
+        "format": "STL"
+    }
+
+Properties not given keep the default of the feature type. Lengths and angles are given in mm
+and degrees. `stacking_lip_method` is one of `preferences.STACKING_LIP_METHODS`, the preference of
+the worker process by default. `format` is only used by `build` and is one of `FORMATS`, STL by
+default.
+
+Starting FreeCAD and importing the workbench takes seconds, so callers generating many objects
+keep a pool of processes running, see `executor`. Each process generates its objects in a hidden
+document and keeps the shape caches of the workbench warm between requests.
+
+`spec_of` takes the spec of an existing object, with the fuzzy value and stacking lip method in
+effect for it, as worker processes only see the saved preferences. `generate` returns its shape as
+BREP together with the properties computed while generating it, to be assigned back to the object.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import multiprocessing
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import FreeCAD as fc  # noqa: N813
+
+from . import booleans, complexity, features, preferences, shape_cache, stl
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+RECTANGULAR_TYPES = (
+    "BinBlank",
+    "BinBase",
+    "SimpleStorageBin",
+    "EcoBin",
+    "PartsBin",
+    "Baseplate",
+    "MagnetBaseplate",
+    "ScrewTogetherBaseplate",
+)
+CUSTOM_TYPES = (
+    "CustomBlankBin",
+    "CustomBinBase",
+    "CustomEcoBin",
+    "CustomStorageBin",
+    "CustomBaseplate",
+    "CustomMagnetBaseplate",
+    "CustomScrewTogetherBaseplate",
+)
+FORMATS = ("STL", "STEP", "BREP")
+
+# Name of the hidden document objects are generated in.
+DOCUMENT_NAME = "GridfinityWorker"
+
+
+class SpecError(ValueError):
+    """Raised when a spec doesn't describe an object that can be generated."""
+
+
+def spec_key(spec: dict[str, Any]) -> str:
+    """Get a key identifying a spec, equal for specs with the same content."""
+    canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def supports(obj: fc.DocumentObject) -> bool:
+    """Check if an object can be generated from its spec."""
+    feature_type = type(getattr(obj, "Proxy", None)).__name__
+    in_body = getattr(obj, "BaseFeature", None) is not None
+    return feature_type in RECTANGULAR_TYPES + CUSTOM_TYPES and not in_body
+
+
+def parameters(obj: fc.DocumentObject, *, read_only: bool) -> dict[str, Any]:
+    """Get the values of the parameters of an object, lengths and angles in mm and degrees.
+
+    Args:
+        obj (FreeCAD.DocumentObject): Gridfinity object.
+        read_only (bool): Get the read only parameters, computed from the others, instead of the
+            parameters set by the user.
+
+    """
+    values = {}
+    for name in obj.PropertiesList:
+        if (
+            name in shape_cache.IGNORED_PROPERTIES
+            or obj.getGroupOfProperty(name) not in shape_cache.PARAMETER_PROPERTY_GROUPS
+            or ("ReadOnly" in obj.getPropertyStatus(name)) != read_only
+        ):
+            continue
+        value = getattr(obj, name)
+        values[name] = getattr(value, "Value", value)
+    return values
+
+
+def spec_of(obj: fc.DocumentObject) -> dict[str, Any]:
+    """Get the spec generating an object with the current parameters, see `supports`."""
+    properties = parameters(obj, read_only=False)
+    properties["BooleanFuzzyValue"] = booleans.object_fuzzy_value(obj)
+    spec = {
+        "type": type(obj.Proxy).__name__,
+        "properties": properties,
+        "stacking_lip_method": preferences.stacking_lip_method(),
+    }
+    layout = getattr(obj.Proxy, "layout", None)
+    if layout is not None:
+        spec["layout"] = layout
+    return spec
+
+
+def _document() -> fc.Document:
+    if DOCUMENT_NAME in fc.listDocuments():
+        return fc.getDocument(DOCUMENT_NAME)
+    return fc.newDocument(DOCUMENT_NAME, hidden=True)
+
+
+def _set_properties(obj: fc.DocumentObject, properties: dict[str, Any]) -> None:
+    for name, value in properties.items():
+        if name not in obj.PropertiesList:
+            raise SpecError(f"{obj.Name} has no property {name}")
+        if obj.getGroupOfProperty(name) not in shape_cache.PARAMETER_PROPERTY_GROUPS:
+            raise SpecError(f"{name} is not a parameter of {obj.Name}")
+        try:
+            setattr(obj, name, value)
+        except (TypeError, ValueError) as e:
+            raise SpecError(f"{name}: {e}") from e
+
+
+@contextlib.contextmanager
+def _stacking_lip_method(method: str | None) -> Iterator[None]:
+    """Use a stacking lip method until the context exits, the preference if None."""
+    if method is None:
+        yield
+        return
+    if method not in preferences.STACKING_LIP_METHODS:
+        methods = ", ".join(preferences.STACKING_LIP_METHODS)
+        raise SpecError(f"Unknown stacking lip method {method!r}, expected one of {methods}")
+
+    params = preferences.parameters()
+    saved = params.GetString("StackingLipMethod", preferences.DEFAULT_STACKING_LIP_METHOD)
+    params.SetString("StackingLipMethod", method)
+    try:
+        yield
+    finally:
+        params.SetString("StackingLipMethod", saved)
+
+
+@contextlib.contextmanager
+def generated_object(spec: dict[str, Any]) -> Iterator[fc.DocumentObject]:
+    """Create and recompute the object of a spec, it is removed again when the context exits.
+
+    Raises:
+        SpecError: If the spec is malformed or the object can't be generated.
+
+    """
+    type_name = spec.get("type")
+    if type_name not in RECTANGULAR_TYPES + CUSTOM_TYPES:
+        raise SpecError(f"Unknown type {type_name!r}")
+    properties = spec.get("properties", {})
+    if not isinstance(properties, dict):
+        raise SpecError("The properties must be an object of property names and values")
+    layout = spec.get("layout")
+    if type_name in CUSTOM_TYPES and not (
+        isinstance(layout, list)
+        and layout
+        and all(
+            isinstance(row, list) and all(isinstance(cell, bool) for cell in row) for row in layout
+        )
+    ):
+        raise SpecError(f"{type_name} needs a layout, a list of rows of booleans")
+
+    doc = _document()
+    with _stacking_lip_method(spec.get("stacking_lip_method")):
+        obj = doc.addObject("Part::FeaturePython", type_name)
+        try:
+            feature = getattr(features, type_name)
+            if type_name in CUSTOM_TYPES:
+                feature(obj, [list(row) for row in layout])
+            else:
+                feature(obj)
+            _set_properties(obj, properties)
+
+            doc.recompute()
+            if obj.Shape.isNull() or "Invalid" in obj.State:
+                errors = obj.Proxy.validate(obj)
+                message = "\n".join(str(error) for error in errors) or "generation failed"
+                raise SpecError(f"{type_name}: {message}")
+            yield obj
+        finally:
+            doc.removeObject(obj.Name)
+
+
+def build(spec: dict[str, Any]) -> bytes:
+    """Generate the object of a spec and return the content of a file in the format of the spec.
+
+    Raises:
+        SpecError: If the spec is malformed or the object can't be generated.
+
+    """
+    fmt = str(spec.get("format", "STL")).upper()
+    if fmt not in FORMATS:
+        raise SpecError(f"Unknown format {fmt!r}, expected one of {', '.join(FORMATS)}")
+
+    with generated_object(spec) as obj:
+        shape = complexity.full_shape(obj)
+        if fmt == "STL":
+            tolerances = preferences.object_tessellation_tolerances(obj)
+            return stl.binary_stl(stl.facets_from_shape(shape, *tolerances), obj.Label)
+        if fmt == "BREP":
+            return shape.exportBrepToString().encode()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "shape.step"
+            shape.exportStep(str(path))
+            return path.read_bytes()
+
+
+def generate(spec: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Generate the object of a spec.
+
+    Returns:
+        tuple[str, dict[str, Any]]: Shape as BREP and the values of the read only parameters.
+
+    Raises:
+        SpecError: If the spec is malformed or the object can't be generated.
+
+    """
+    with generated_object(spec) as obj:
+        return complexity.full_shape(obj).exportBrepToString(), parameters(obj, read_only=True)
+
+
+def warm_up() -> None:
+    """Prepare a worker process: load the workbench and fill its caches with a default bin."""
+    build({"type": "BinBlank", "format": "BREP"})
+
+
+def ping() -> None:
+    """Do nothing, submitted to make sure a worker process has started."""
+
+
+def python_executable() -> str:
+    """Get the python interpreter to start worker processes with.
+
+    Inside FreeCAD `sys.executable` is the FreeCAD program, the interpreter is installed next to it.
+    """
+    executable = Path(sys.executable)
+    if executable.stem.lower().startswith("python"):
+        return str(executable)
+    candidates = [
+        executable.with_name("python.exe"),
+        executable.with_name("python3"),
+        executable.with_name("python"),
+        Path(sys.prefix) / "bin" / "python3",
+        Path(sys.prefix) / "bin" / "python",
+    ]
+    for candidate in candidates:
+        if candidate.is_file():
+            return str(candidate)
+    return str(executable)
+
+
+def executor(workers: int | None = None, *, warm: bool = True) -> ProcessPoolExecutor:
+    """Start a pool of worker processes.
+
+    Args:
+        workers (int | None): Number of processes, the number of CPUs if None.
+        warm (bool): Warm up each process with `warm_up` when it starts. Short lived pools
+            skip this, their first object warms up the caches anyway.
+
+    """
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(python_executable())
+    initializer = warm_up if warm else None
+    return ProcessPoolExecutor(workers, mp_context=context, initializer=initializer)
@@ -0,0 +1,241 @@
+"""Golden geometric metrics of every Gridfinity feature class.
+
+Every feature class is generated headless over a small parameter matrix, and the geometric metrics
+of each shape are compared with the metrics recorded in `golden/metrics.json`. A code change that
+should not change any geometry, like most performance work, can be checked with:
+
+    python tests/golden_metrics.py
+
+which reports every metric outside of the tolerance and the generation time next to the recorded
+one. After an intended change of the geometry, record new golden metrics with:
+
+    python tests/golden_metrics.py --update
+
+`test_unit_golden_metrics` runs the same comparison as part of the unit tests. It is skipped
+while no golden metrics are recorded, unless `GRIDFINITY_REQUIRE_GOLDEN_METRICS` is set. The golden
+metrics of a commit can be recorded in CI by running the Tests workflow manually with that commit
+as `golden-ref`, the recorded file is attached to the run.
+"""
+
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import argparse
+import dataclasses
+import fnmatch
+import json
+import math
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from freecad.gridfinity_workbench import features, preferences
+
+GOLDEN_PATH = Path(__file__).parent / "golden" / "metrics.json"
+
+# Relative tolerance of volume and area, absolute tolerance in mm of coordinates.
+RELATIVE_TOLERANCE = 1e-6
+ABSOLUTE_TOLERANCE = 1e-4
+
+RECTANGULAR_FEATURES = (
+    features.BinBlank,
+    features.BinBase,
+    features.SimpleStorageBin,
+    features.PartsBin,
+    features.EcoBin,
+    features.Baseplate,
+    features.MagnetBaseplate,
+    features.ScrewTogetherBaseplate,
+)
+CUSTOM_FEATURES = (
+    features.CustomBlankBin,
+    features.CustomBinBase,
+    features.CustomEcoBin,
+    features.CustomStorageBin,
+    features.CustomBaseplate,
+    features.CustomMagnetBaseplate,
+    features.CustomScrewTogetherBaseplate,
+)
+SIZES = {"1x1": (1, 1), "2x3": (2, 3)}
+LAYOUTS = {"1x1": [[True]], "L": [[True, True], [True, False]]}
+
+# Variants are generated for the smallest size of every feature class that has all of the
+# properties of the variant visible.
+VARIANTS: dict[str, dict[str, object]] = {
+    "no_magnets": {"MagnetHoles": False},
+    "screw_holes": {"ScrewHoles": True},
+    "no_stacking_lip": {"StackingLip": False},
+    "recessed_top": {"RecessedTopDepth": 2},
+    "dividers": {"xDividers": 2, "yDividers": 1},
+    "scoop_label": {"Scoop": True, "LabelShelfStyle": "Overhang"},
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class Case:
+    """One feature class with one set of parameters."""
+
+    name: str
+    feature: type
+    size: str
+    properties: dict[str, object]
+
+
+def cases() -> Iterator[Case]:
+    """Return the parameter matrix, without checking which variants apply to a feature class."""
+    for feature in (*RECTANGULAR_FEATURES, *CUSTOM_FEATURES):
+        sizes = SIZES if feature in RECTANGULAR_FEATURES else LAYOUTS
+        smallest = next(iter(sizes))
+        for size in sizes:
+            yield Case(f"{feature.__name__}-{size}", feature, size, {})
+        for variant, properties in VARIANTS.items():
+            yield Case(f"{feature.__name__}-{smallest}-{variant}", feature, smallest, properties)
+
+
+def _applies(obj: fc.DocumentObject, properties: dict[str, object]) -> bool:
+    return all(
+        hasattr(obj, name) and "Hidden" not in obj.getEditorMode(name) for name in properties
+    )
+
+
+def metrics(shape: Part.Shape) -> dict[str, Any]:
+    """Return the geometric metrics of a shape, as stored in the golden file."""
+    center = fc.Vector()
+    for solid in shape.Solids:
+        center += solid.CenterOfMass * (solid.Volume / shape.Volume)
+    box = shape.BoundBox
+    return {
+        "volume": shape.Volume,
+        "area": shape.Area,
+        "bound_box": [box.XMin, box.YMin, box.ZMin, box.XMax, box.YMax, box.ZMax],
+        "center_of_mass": [center.x, center.y, center.z],
+        "faces": len(shape.Faces),
+        "edges": len(shape.Edges),
+        "solids": len(shape.Solids),
+        "valid": shape.isValid(),
+    }
+
+
+def _create(doc: fc.Document, case: Case) -> fc.DocumentObject:
+    obj = doc.addObject("Part::FeaturePython", "Object")
+    if case.feature in CUSTOM_FEATURES:
+        case.feature(obj, LAYOUTS[case.size])
+    else:
+        case.feature(obj)
+        obj.xGridUnits, obj.yGridUnits = SIZES[case.size]
+    return obj
+
+
+def generate_all(pattern: str = "*") -> dict[str, tuple[dict[str, Any], float]]:
+    """Generate every case with a name matching the pattern, with the complexity guard off.
+
+    Returns:
+        The metrics and generation time by case name, without the variants that don't apply to
+        their feature class.
+
+    """
+    params = preferences.parameters()
+    guard = params.GetString("ComplexityGuard", preferences.DEFAULT_COMPLEXITY_GUARD)
+    params.SetString("ComplexityGuard", "Off")
+    results = {}
+    try:
+        for case in cases():
+            if not fnmatch.fnmatchcase(case.name, pattern):
+                continue
+            doc = fc.newDocument("GridfinityGoldenMetrics")
+            try:
+                obj = _create(doc, case)
+                if not _applies(obj, case.properties):
+                    continue
+                for name, value in case.properties.items():
+                    setattr(obj, name, value)
+
+                start = time.perf_counter()
+                doc.recompute()
+                results[case.name] = metrics(obj.Shape), time.perf_counter() - start
+            finally:
+                fc.closeDocument(doc.Name)
+    finally:
+        params.SetString("ComplexityGuard", guard)
+    return results
+
+
+def _close(expected: float, actual: float, *, relative: bool) -> bool:
+    if relative:
+        return math.isclose(
+            expected,
+            actual,
+            rel_tol=RELATIVE_TOLERANCE,
+            abs_tol=ABSOLUTE_TOLERANCE,
+        )
+    return abs(expected - actual) <= ABSOLUTE_TOLERANCE
+
+
+def compare(expected: dict[str, Any], actual: dict[str, Any]) -> list[str]:
+    """Return a description of every metric that differs more than the tolerance."""
+    differences = []
+    for name, value in expected.items():
+        new = actual[name]
+        if isinstance(value, list):
+            same = all(_close(a, b, relative=False) for a, b in zip(value, new))
+        elif isinstance(value, float):
+            same = _close(value, new, relative=True)
+        else:
+            same = value == new
+        if not same:
+            differences.append(f"{name}: expected {value}, got {new}")
+    return differences
+
+
+def load() -> dict[str, dict[str, Any]]:
+    """Return the recorded golden metrics and generation times by case name."""
+    return json.loads(GOLDEN_PATH.read_text())
+
+
+def main() -> None:
+    """Compare with or update the golden metrics and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="record new golden metrics")
+    parser.add_argument("--match", default="*", help="only generate cases matching this pattern")
+    args = parser.parse_args()
+
+    results = generate_all(args.match)
+    golden = load() if GOLDEN_PATH.exists() else {}
+
+    if args.update:
+        for name, (shape_metrics, seconds) in results.items():
+            golden[name] = {"metrics": shape_metrics, "seconds": seconds}
+        GOLDEN_PATH.parent.mkdir(exist_ok=True)
+        GOLDEN_PATH.write_text(json.dumps(golden, indent=2, sort_keys=True) + "\n")
+        sys.stdout.write(f"Recorded {len(results)} cases in {GOLDEN_PATH}\n")
+        return
+
+    failed = 0
+    for name, (shape_metrics, seconds) in results.items():
+        if name not in golden:
+            failed += 1
+            sys.stdout.write(f"{name}: no golden metrics, record them with --update\n")
+            continue
+        differences = compare(golden[name]["metrics"], shape_metrics)
+        failed += bool(differences)
+        status = "FAIL" if differences else "ok"
+        was = golden[name]["seconds"]
+        sys.stdout.write(f"{name:50} {status:4} {seconds:6.2f} s (was {was:6.2f} s)\n")
+        for difference in differences:
+            sys.stdout.write(f"    {difference}\n")
+
+    total = sum(seconds for _, seconds in results.values())
+    recorded = sum(golden[name]["seconds"] for name in results if name in golden)
+    sys.stdout.write(
+        f"{len(results)} cases, {failed} failed, {total:.1f} s (was {recorded:.1f} s)\n",
+    )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+from types import SimpleNamespace
+from typing import cast
+from unittest import mock
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from freecad.gridfinity_workbench import booleans, preferences
+
+
+def _object(**properties: object) -> fc.DocumentObject:
+    return cast("fc.DocumentObject", SimpleNamespace(**properties))
+
+
+class BooleansTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(preferences, "boolean_fuzzy_value", return_value=0.001)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_object_fuzzy_value(self) -> None:
+        self.assertEqual(booleans.object_fuzzy_value(_object()), 0.001)
+        self.assertEqual(booleans.object_fuzzy_value(_object(BooleanFuzzyValue=-1)), 0.001)
+        self.assertEqual(booleans.object_fuzzy_value(_object(BooleanFuzzyValue=0)), 0)
+
+    def test_object_options(self) -> None:
+        self.assertEqual(booleans.fuzzy_value(), 0.001)
+        with booleans.object_options(_object(BooleanFuzzyValue=0.01)):
+            self.assertEqual(booleans.fuzzy_value(), 0.01)
+            with booleans.object_options(_object(BooleanFuzzyValue=0)):
+                self.assertEqual(booleans.fuzzy_value(), 0)
+            self.assertEqual(booleans.fuzzy_value(), 0.01)
+        self.assertEqual(booleans.fuzzy_value(), 0.001)
+
+    def test_fuzzy_value_applied(self) -> None:
+        shape = mock.MagicMock(spec=Part.Shape)
+        tool = mock.MagicMock(spec=Part.Shape)
+
+        booleans.cut(shape, tool)
+        with booleans.object_options(_object(BooleanFuzzyValue=0)):
+            booleans.fuse(shape, tool)
+
+        shape.cut.assert_called_once_with(tool, 0.001)
+        shape.fuse.assert_called_once_with(tool)
+
+    def test_touching_boxes(self) -> None:
+        boxes = [Part.makeBox(1, 1, 1), Part.makeBox(1, 1, 1, fc.Vector(1, 0, 0))]
+        with booleans.object_options(_object(BooleanFuzzyValue=1e-5)):
+            shape = booleans.fuse(*boxes).removeSplitter()
+        self.assertAlmostEqual(shape.Volume, 2)
+        self.assertEqual(len(shape.Solids), 1)
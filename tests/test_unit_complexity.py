@@ -0,0 +1,79 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+from types import SimpleNamespace
+from typing import cast
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import complexity
+
+
+class MagnetBaseplate:
+    pass
+
+
+class CustomBlankBin:
+    layout = [[True, False], [True, True]]  # noqa: RUF012
+
+
+class BinFamily:
+    bin_type = "EcoBin"
+
+
+def _object(**properties: object) -> fc.DocumentObject:
+    return cast("fc.DocumentObject", SimpleNamespace(**properties))
+
+
+def _baseplate(size: float) -> fc.DocumentObject:
+    return _object(
+        Proxy=MagnetBaseplate(),
+        xGridUnits=size,
+        yGridUnits=size,
+        MagnetHoles=True,
+    )
+
+
+class EstimateTest(unittest.TestCase):
+    def test_grid_cells(self) -> None:
+        self.assertEqual(complexity.grid_cells(_baseplate(3)), 9)
+        self.assertEqual(complexity.grid_cells(_object(Proxy=CustomBlankBin())), 3)
+
+    def test_cost_model(self) -> None:
+        self.assertEqual(
+            complexity.cost_model(_baseplate(1)),
+            complexity.COST_MODELS["MagnetBaseplate"],
+        )
+        self.assertEqual(
+            complexity.cost_model(_object(Proxy=CustomBlankBin())),
+            complexity.COST_MODELS["FullBin"],
+        )
+        self.assertEqual(
+            complexity.cost_model(_object(Proxy=BinFamily())),
+            complexity.COST_MODELS["EcoBin"],
+        )
+
+    def test_estimate(self) -> None:
+        small = complexity.estimate(_baseplate(1))
+        large = complexity.estimate(_baseplate(40))
+
+        self.assertEqual(large.cells, 1600)
+        self.assertEqual(large.boolean_inputs, 1600 * 5 + 1)
+        self.assertLess(small.seconds, 1)
+        self.assertGreater(large.seconds, 60)
+        self.assertGreater(large.memory, small.memory)
+
+    def test_estimate_variants(self) -> None:
+        single = complexity.estimate(_baseplate(2))
+        family = _baseplate(2)
+        family.xGridUnitsList = [1, 2, 3]
+        family.yGridUnitsList = [2]
+        family.HeightUnitsList = [3, 6]
+
+        estimate = complexity.estimate(family)
+
+        self.assertEqual(estimate.variants, 6)
+        self.assertEqual(estimate.cells, 6 * single.cells)
+        self.assertAlmostEqual(estimate.seconds, 6 * single.seconds)
+        self.assertAlmostEqual(estimate.memory, 6 * single.memory)
@@ -0,0 +1,80 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import drawer_planner
+from freecad.gridfinity_workbench.drawer_planner import BinPlacement
+
+
+class ParseBinSizesTest(unittest.TestCase):
+    def test_parse(self) -> None:
+        self.assertEqual(
+            drawer_planner.parse_bin_sizes("2x1*2, 1 x 3,"),
+            [(2, 1), (2, 1), (1, 3)],
+        )
+
+    def test_parse_invalid(self) -> None:
+        self.assertRaises(ValueError, drawer_planner.parse_bin_sizes, "2by1")
+        self.assertRaises(ValueError, drawer_planner.parse_bin_sizes, "0x1")
+
+
+class PlanDrawerTest(unittest.TestCase):
+    def test_grid_units(self) -> None:
+        plan = drawer_planner.plan_drawer(200, 100, [], fill=False)
+        self.assertEqual((plan.x_units, plan.y_units), (4, 2))
+        self.assertEqual(plan.bins, [])
+
+    def test_drawer_too_small(self) -> None:
+        self.assertRaises(ValueError, drawer_planner.plan_drawer, 41, 100, [])
+
+    def test_largest_first(self) -> None:
+        plan = drawer_planner.plan_drawer(126, 84, [(1, 1), (2, 2)], fill=False)
+        self.assertEqual(plan.bins, [BinPlacement(0, 0, 2, 2), BinPlacement(2, 0, 1, 1)])
+
+    def test_rotated(self) -> None:
+        plan = drawer_planner.plan_drawer(42, 126, [(3, 1)], fill=False)
+        self.assertEqual(plan.bins, [BinPlacement(0, 0, 1, 3)])
+
+    def test_unplaced(self) -> None:
+        plan = drawer_planner.plan_drawer(84, 84, [(2, 2), (1, 1)], fill=False)
+        self.assertEqual(plan.unplaced, [(1, 1)])
+
+    def test_fill(self) -> None:
+        plan = drawer_planner.plan_drawer(126, 84, [(2, 2)])
+        self.assertEqual(len(plan.bins), 3)
+        self.assertEqual(sum(b.x_units * b.y_units for b in plan.bins), 6)
+
+    def test_grid_size(self) -> None:
+        plan = drawer_planner.plan_drawer(100, 100, [], x_grid_size=50, y_grid_size=25)
+        self.assertEqual((plan.x_units, plan.y_units), (2, 4))
+        self.assertEqual(len(plan.bins), 8)
+
+
+class CreateDrawerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.doc = fc.newDocument("GridfinityDrawer")
+        self.plan = drawer_planner.plan_drawer(84, 42, [(1, 1)], fill=False)
+
+    def tearDown(self) -> None:
+        fc.closeDocument(self.doc.Name)
+
+    def test_bins_seated_in_baseplate(self) -> None:
+        baseplate, bin_obj = drawer_planner.create_drawer(self.plan)
+
+        pocket_floor = baseplate.TotalHeight.Value - baseplate.BaseProfileHeight.Value
+        self.assertAlmostEqual(bin_obj.Shape.BoundBox.ZMin, pocket_floor)
+
+    def test_bins_without_baseplate(self) -> None:
+        (bin_obj,) = drawer_planner.create_drawer(self.plan, baseplate_feature=None)
+
+        self.assertAlmostEqual(bin_obj.Shape.BoundBox.ZMin, 0)
+
+    def test_abort_on_error(self) -> None:
+        self.doc.UndoMode = 1
+        with self.assertRaises(AttributeError):
+            drawer_planner.create_drawer(self.plan, bin_feature="NoSuchBin")
+
+        self.assertEqual(self.doc.Objects, [])
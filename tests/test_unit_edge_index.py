@@ -0,0 +1,38 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from freecad.gridfinity_workbench import edge_index
+
+
+class EdgeIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # A 1 x 2 x 3 box next to a cylinder, with a rounding error on the position of the box.
+        box = Part.makeBox(1, 2, 3, fc.Vector(1e-9, 0, -3))
+        cylinder = Part.makeCylinder(0.5, 1, fc.Vector(5, 5, -1))
+        self.index = edge_index.EdgeIndex(Part.makeCompound([box, cylinder]))
+
+    def test_horizontal(self) -> None:
+        self.assertEqual(len(self.index.horizontal()), 10)
+        self.assertEqual(len(self.index.horizontal(z=0)), 5)
+        self.assertEqual(len(self.index.horizontal(z=-3)), 4)
+
+        [edge] = self.index.horizontal(z=0, x=0)
+        self.assertAlmostEqual(edge.Length, 2)
+        [edge] = self.index.horizontal(z=-3, y=2)
+        self.assertAlmostEqual(edge.Length, 1)
+
+    def test_vertical(self) -> None:
+        self.assertEqual(len(self.index.vertical()), 5)
+        self.assertEqual(len(self.index.vertical(length=3)), 4)
+        self.assertEqual(len(self.index.vertical(x=1)), 2)
+        self.assertEqual(len(self.index.vertical(x=0, y=0)), 1)
+
+    def test_below(self) -> None:
+        self.assertEqual(len(self.index.below(0)), 5)
+        self.assertEqual(len(self.index.below(-3)), 0)
+        self.assertEqual(len(self.index.below(1)), len(self.index.edges))
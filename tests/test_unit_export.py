@@ -0,0 +1,60 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import Part
+
+from freecad.gridfinity_workbench import booleans, export
+
+
+def _mock_object(label: str, *, has_shape: bool) -> mock.MagicMock:
+    obj = mock.MagicMock()
+    obj.Label = label
+    obj.BooleanFuzzyValue = 0.01
+    obj.Shape = mock.MagicMock(spec=Part.Shape)
+    obj.Shape.isNull.return_value = not has_shape
+    obj.Proxy.generate_gridfinity_shape.return_value = mock.MagicMock(spec=Part.Shape)
+    return obj
+
+
+class ExportTest(unittest.TestCase):
+    def test_export_step(self) -> None:
+        obj1 = _mock_object("Bin", has_shape=True)
+        obj2 = _mock_object("Bin/2", has_shape=False)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            stats = export.export_objects([obj1, obj2], Path(tmp), "step", tolerances=(0.1, 20))
+
+            self.assertEqual(stats.files, [Path(tmp) / "Bin.step", Path(tmp) / "Bin_2.step"])
+
+        obj1.Shape.exportStep.assert_called_once()
+        obj1.Proxy.generate_gridfinity_shape.assert_not_called()
+        obj2.Proxy.generate_gridfinity_shape.return_value.exportStep.assert_called_once()
+
+    def test_generate_with_object_options(self) -> None:
+        obj = _mock_object("Bin", has_shape=False)
+        fuzzy_values: list[float] = []
+        shape = obj.Proxy.generate_gridfinity_shape.return_value
+
+        def generate(_: object) -> mock.MagicMock:
+            fuzzy_values.append(booleans.fuzzy_value())
+            return shape
+
+        obj.Proxy.generate_gridfinity_shape.side_effect = generate
+
+        with tempfile.TemporaryDirectory() as tmp:
+            export.export_objects([obj], Path(tmp), "step", tolerances=(0.1, 20))
+
+        self.assertEqual(fuzzy_values, [0.01])
+
+    def test_export_unknown_format(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertRaises(ValueError, export.export_objects, [], Path(tmp), "obj")
+
+    def test_parts_per_minute(self) -> None:
+        stats = export.ExportStats(files=[Path("a"), Path("b")], seconds=30, peak_memory=None)
+        self.assertAlmostEqual(stats.parts_per_minute, 4)
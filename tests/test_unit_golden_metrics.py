@@ -0,0 +1,40 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import os
+import unittest
+
+import Part
+
+from tests import golden_metrics
+
+
+class GoldenMetricsTest(unittest.TestCase):
+    def test_compare(self) -> None:
+        expected = golden_metrics.metrics(Part.makeBox(1, 2, 3))
+        for coordinate, value in zip(expected["center_of_mass"], [0.5, 1, 1.5]):
+            self.assertAlmostEqual(coordinate, value)
+        self.assertEqual(golden_metrics.compare(expected, expected), [])
+
+        actual = golden_metrics.metrics(Part.makeBox(1, 2, 3.001))
+
+        differences = golden_metrics.compare(expected, actual)
+        self.assertEqual(
+            [difference.split(":")[0] for difference in differences],
+            ["volume", "area", "bound_box", "center_of_mass"],
+        )
+
+    @unittest.skipUnless(
+        golden_metrics.GOLDEN_PATH.exists() or os.environ.get("GRIDFINITY_REQUIRE_GOLDEN_METRICS"),
+        "no golden metrics recorded",
+    )
+    def test_golden_metrics(self) -> None:
+        self.assertTrue(
+            golden_metrics.GOLDEN_PATH.exists(),
+            f"no golden metrics in {golden_metrics.GOLDEN_PATH}, record them with --update",
+        )
+        golden = golden_metrics.load()
+        for name, (metrics, _) in golden_metrics.generate_all().items():
+            with self.subTest(name):
+                self.assertIn(name, golden, "record golden metrics with --update")
+                self.assertEqual(golden_metrics.compare(golden[name]["metrics"], metrics), [])
@@ -0,0 +1,73 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+from typing import cast
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from freecad.gridfinity_workbench import height_family
+
+
+class HeightFamilyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # A 10 mm cube from z = -10 to 0, with a horizontal hole through it at z = -6.
+        box = Part.makeBox(10, 10, 10, fc.Vector(0, 0, -10))
+        hole = Part.makeCylinder(1, 10, fc.Vector(0, 5, -6), fc.Vector(1, 0, 0))
+        self.shape = box.cut(hole)
+
+    def test_prismatic_bands(self) -> None:
+        bands = height_family.prismatic_bands(self.shape)
+        self.assertEqual(len(bands), 2)
+        for (start, end), expected in zip(bands, [(-10, -7), (-5, 0)]):
+            self.assertAlmostEqual(start, expected[0])
+            self.assertAlmostEqual(end, expected[1])
+
+    def test_stretched(self) -> None:
+        split = height_family.split(self.shape, -2)
+        shape = split.stretched(5)
+
+        self.assertTrue(shape.isValid())
+        self.assertAlmostEqual(shape.Volume, self.shape.Volume + 500)
+        self.assertAlmostEqual(shape.BoundBox.ZMin, -15)
+        self.assertAlmostEqual(shape.BoundBox.ZMax, 0)
+        # The hole moved down with the bottom of the shape.
+        self.assertFalse(shape.isInside(fc.Vector(5, 5, -11), 1e-6, False))  # noqa: FBT003
+        self.assertTrue(shape.isInside(fc.Vector(5, 5, -6), 1e-6, False))  # noqa: FBT003
+
+
+class _ExpressionObject:
+    """Object with expressions evaluated on its own attributes."""
+
+    def __init__(self, expressions: list[tuple[str, str]]) -> None:
+        self.ExpressionEngine = expressions
+        self.assigned: list[str] = []
+
+    def evalExpression(self, expression: str) -> float:  # noqa: N802
+        return eval(expression, {}, vars(self))  # noqa: S307
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name not in ("ExpressionEngine", "assigned"):
+            self.assigned.append(name)
+        super().__setattr__(name, value)
+
+
+class EvaluateExpressionsTest(unittest.TestCase):
+    def test_dependency_order(self) -> None:
+        obj = _ExpressionObject(
+            [
+                ("UsableHeight", "TotalHeight - HeightUnitValue"),
+                (".Placement.Base.z", "TotalHeight"),
+                ("TotalHeight", "HeightUnits * HeightUnitValue"),
+            ],
+        )
+        obj.HeightUnits = 3
+        obj.HeightUnitValue = 7
+        obj.assigned.clear()
+
+        height_family.evaluate_expressions(cast("fc.DocumentObject", obj))
+
+        self.assertEqual(obj.assigned, ["TotalHeight", "UsableHeight"])
+        self.assertEqual(obj.TotalHeight, 21)
+        self.assertEqual(obj.UsableHeight, 14)
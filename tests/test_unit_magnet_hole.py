@@ -0,0 +1,42 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import math
+import unittest
+from types import SimpleNamespace
+from typing import cast
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import magnet_hole
+
+unitmm = fc.Units.Quantity("1 mm")
+
+
+class ProfileTest(unittest.TestCase):
+    def test_hex(self) -> None:
+        face = magnet_hole.profile("Hex", 3)
+        self.assertAlmostEqual(face.Area, 2 * math.sqrt(3) * 3**2)
+        self.assertEqual(len(face.Edges), 6)
+
+    def test_round(self) -> None:
+        self.assertAlmostEqual(magnet_hole.profile("Round", 3).Area, math.pi * 3**2)
+
+    def test_memoized(self) -> None:
+        self.assertTrue(magnet_hole.profile("Hex", 2.5).isSame(magnet_hole.profile("Hex", 2.5)))
+
+    def test_unknown_shape(self) -> None:
+        self.assertRaises(ValueError, magnet_hole.profile, "Square", 3)
+
+    def test_from_obj_without_document(self) -> None:
+        obj = SimpleNamespace(
+            MagnetHoles=True,
+            MagnetHolesShape="Hex",
+            MagnetHoleDiameter=6 * unitmm,
+            MagnetHoleDepth=2 * unitmm,
+            CrushRibsCount=12,
+            CrushRibsWaviness=0.7,
+            Baseplate=False,
+        )
+        shape = magnet_hole.from_obj(cast("fc.DocumentObject", obj))
+        self.assertAlmostEqual(shape.Volume, 2 * math.sqrt(3) * 3**2 * 2)
@@ -0,0 +1,46 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import memo
+
+unitmm = fc.Units.Quantity("1 mm")
+
+
+class MemoTest(unittest.TestCase):
+    def setUp(self) -> None:
+        memo.reset_statistics()
+        self.build = mock.Mock(side_effect=lambda *_: object())
+        self.build.__qualname__ = "build"
+        self.memoized = memo.memoized(self.build)
+
+    def test_outside_scope(self) -> None:
+        self.memoized(1)
+        self.memoized(1)
+        self.assertEqual(self.build.call_count, 2)
+
+    def test_equal_arguments(self) -> None:
+        obj = SimpleNamespace()
+        with memo.scope() as scope:
+            first = self.memoized(obj, [[True, False]], 2 * unitmm)
+            second = self.memoized(obj, [[True, False]], 2.0)
+            self.memoized(SimpleNamespace(), [[True, False]], 2.0)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.build.call_count, 2)
+        self.assertEqual((scope.builds, scope.saved), (2, 1))
+        self.assertEqual(memo.statistics()["build"], memo.MemoStatistics(builds=2, saved=1))
+
+    def test_scopes_are_separate(self) -> None:
+        with memo.scope():
+            self.memoized(1)
+            with memo.scope():
+                self.memoized(1)
+        with memo.scope():
+            self.memoized(1)
+        self.assertEqual(self.build.call_count, 3)
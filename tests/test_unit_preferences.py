@@ -0,0 +1,51 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import math
+import unittest
+
+from freecad.gridfinity_workbench import preferences
+
+PRESET = preferences.TessellationPreset(
+    relative_deviation=1e-3,
+    feature_fraction=0.5,
+    min_deviation=0.01,
+    max_deviation=0.5,
+    angular_deflection=20,
+    max_angular_deflection=40,
+    reference_size=100,
+)
+
+
+class TessellationTolerancesTest(unittest.TestCase):
+    def test_small_part(self) -> None:
+        deviation, angular = preferences.tessellation_tolerances(50, None, PRESET)
+        self.assertAlmostEqual(deviation, 0.05)
+        self.assertAlmostEqual(angular, 20)
+
+    def test_large_part_is_coarser(self) -> None:
+        small = preferences.tessellation_tolerances(50, None, PRESET)
+        large = preferences.tessellation_tolerances(1000, None, PRESET)
+        self.assertGreater(large[0], small[0])
+        self.assertAlmostEqual(large[1], 40)
+
+    def test_limited_by_feature_radius(self) -> None:
+        deviation, _ = preferences.tessellation_tolerances(80, 0.1, PRESET)
+        self.assertAlmostEqual(deviation, 0.05)
+        # the limit grows with the part size
+        deviation, _ = preferences.tessellation_tolerances(400, 0.1, PRESET)
+        self.assertAlmostEqual(deviation, 0.2)
+
+    def test_large_part_not_finer_than_default(self) -> None:
+        # 30x30 baseplate, the FreeCAD default deviation is 0.5 % of the mean bounding box edge
+        size = (1260, 1260, 7)
+        default = sum(size) / 3 * 0.005
+        preset = preferences.TESSELLATION_PRESETS["Normal"]
+
+        deviation, _ = preferences.tessellation_tolerances(math.hypot(*size), 0.8, preset)
+
+        self.assertGreaterEqual(deviation, default)
+
+    def test_clamped(self) -> None:
+        self.assertAlmostEqual(preferences.tessellation_tolerances(1, None, PRESET)[0], 0.01)
+        self.assertAlmostEqual(preferences.tessellation_tolerances(1e5, None, PRESET)[0], 0.5)
@@ -0,0 +1,46 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+from unittest import mock
+
+from freecad.gridfinity_workbench import property_schema
+from freecad.gridfinity_workbench.property_schema import PropertySpec
+
+SPECS = (
+    PropertySpec("App::PropertyLength", "Width", "Gridfinity", "Width", default=42),
+    PropertySpec("App::PropertyLength", "Height", "Gridfinity", "Height", expression="Width / 2"),
+    PropertySpec("App::PropertyBool", "Flag", "Gridfinity", "Flag", default=False, hidden=True),
+)
+
+
+class AddPropertiesTest(unittest.TestCase):
+    def test_adds_defaults_overrides_and_expressions(self) -> None:
+        obj = mock.MagicMock()
+        obj.PropertiesList = []
+        obj.addProperty.return_value = obj
+
+        property_schema.add_properties(obj, SPECS, Flag=True)
+
+        self.assertEqual(obj.addProperty.call_count, 3)
+        obj.addProperty.assert_called_with(
+            "App::PropertyBool",
+            "Flag",
+            "Gridfinity",
+            "Flag",
+            read_only=False,
+            hidden=True,
+        )
+        self.assertEqual(obj.Width, 42)
+        self.assertTrue(obj.Flag)
+        obj.setExpression.assert_called_once_with("Height", "Width / 2")
+
+    def test_skips_existing_properties(self) -> None:
+        obj = mock.MagicMock()
+        obj.PropertiesList = ["Width", "Height"]
+        obj.addProperty.return_value = obj
+
+        property_schema.add_properties(obj, SPECS)
+
+        obj.addProperty.assert_called_once()
+        obj.setExpression.assert_not_called()
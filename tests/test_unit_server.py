@@ -0,0 +1,70 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import http.client
+import json
+import threading
+import unittest
+from unittest import mock
+
+from freecad.gridfinity_workbench import server
+
+
+class ServerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.service = server.GenerationService(1)
+        cls.service.start()
+        cls.http_server = server.HTTPServer(("127.0.0.1", 0), cls.service)
+        threading.Thread(target=cls.http_server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.http_server.shutdown()
+        cls.http_server.server_close()
+        cls.service.shutdown()
+
+    def _request(self, method: str, path: str, body: object = None) -> tuple[int, bytes]:
+        connection = http.client.HTTPConnection(*self.http_server.server_address)
+        try:
+            connection.request(method, path, None if body is None else json.dumps(body))
+            response = connection.getresponse()
+            return response.status, response.read()
+        finally:
+            connection.close()
+
+    def test_coalesce_identical_specs(self) -> None:
+        spec = {"type": "BinBase", "properties": {"xGridUnits": 3}}
+        first = self.service.submit(spec)
+        second = self.service.submit({"properties": {"xGridUnits": 3}, "type": "BinBase"})
+
+        self.assertIs(first, second)
+        self.assertEqual(first.result()[:14], b"Gridfinity Bin")
+        self.assertGreaterEqual(self.service.metrics()["coalesced"], 1)
+
+    def test_generate(self) -> None:
+        status, data = self._request("POST", "/generate", {"type": "BinBase", "format": "STEP"})
+        self.assertEqual(status, 200)
+        self.assertTrue(data.startswith(b"ISO-10303-21"))
+
+        status, data = self._request("POST", "/generate", {"type": "Teapot"})
+        self.assertEqual(status, 422)
+        self.assertIn("Teapot", json.loads(data)["error"])
+
+    def test_generation_failure(self) -> None:
+        with mock.patch.object(self.service, "generate", side_effect=RuntimeError("OCC failed")):
+            status, data = self._request("POST", "/generate", {"type": "BinBase"})
+
+        self.assertEqual(status, 500)
+        self.assertEqual(json.loads(data)["error"], "RuntimeError: OCC failed")
+
+    def test_metrics(self) -> None:
+        self._request("POST", "/generate", {"type": "BinBase"})
+
+        status, data = self._request("GET", "/metrics")
+        metrics = json.loads(data)
+        self.assertEqual(status, 200)
+        self.assertEqual(metrics["workers"], 1)
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertGreaterEqual(metrics["latency"]["count"], 1)
+        self.assertGreater(metrics["latency"]["max"], 0)
@@ -0,0 +1,110 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# NumPy is provided by FreeCAD, but is not a dependency of the type check environment.
+# mypy: disable-error-code="import-not-found"
+import FreeCAD as fc  # noqa: N813
+import numpy as np
+import Part
+
+from freecad.gridfinity_workbench import features, preferences, shape_cache
+
+
+class ShapeCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch.object(shape_cache, "cache_dir", return_value=Path(tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_store_and_load(self) -> None:
+        box = Part.makeBox(1, 2, 3)
+        shape_cache.store("box", box)
+
+        shape = shape_cache.load("box")
+
+        self.assertIsNotNone(shape)
+        self.assertAlmostEqual(shape.Volume, 6)
+        self.assertEqual(len(shape.Faces), 6)
+        self.assertIsNone(shape_cache.load("missing"))
+
+    def test_metadata(self) -> None:
+        shape_cache.store("box", Part.makeBox(1, 2, 3))
+
+        record = shape_cache.load_metadata("box")
+
+        if record is None:
+            self.fail("no metadata stored for the shape")
+        np.testing.assert_allclose(record["bound_box"], [0, 0, 0, 1, 2, 3])
+        self.assertAlmostEqual(float(record["volume"]), 6)
+        self.assertEqual(int(record["faces"]), 6)
+        self.assertEqual(int(record["solids"]), 1)
+        self.assertIsNone(shape_cache.load_metadata("missing"))
+
+    def test_clear(self) -> None:
+        shape_cache.store("box", Part.makeBox(1, 2, 3))
+        shape_cache.clear()
+        self.assertIsNone(shape_cache.load("box"))
+        self.assertIsNone(shape_cache.load_metadata("box"))
+
+
+class MemoryTierTest(unittest.TestCase):
+    def setUp(self) -> None:
+        shape_cache.clear_memory()
+        shape_cache.reset_statistics()
+        self.addCleanup(shape_cache.clear_memory)
+
+    def test_hit_and_miss(self) -> None:
+        build = mock.Mock(side_effect=lambda: Part.makeBox(1, 1, 1))
+
+        first = shape_cache.cached("test", "box", build)
+        second = shape_cache.cached("test", "box", build)
+
+        build.assert_called_once()
+        self.assertTrue(first.isSame(second))
+        stats = shape_cache.statistics()["test"]
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+        self.assertEqual(stats.bytes, shape_cache.estimated_bytes(first))
+
+    def test_trim_evicts_least_recently_used(self) -> None:
+        for key in ("a", "b", "c"):
+            shape_cache.cached("test", key, lambda: Part.makeBox(1, 1, 1))
+        shape_cache.cached("test", "a", mock.Mock())
+        size = shape_cache.statistics()["test"].bytes // 3
+
+        shape_cache.trim(2 * size)
+
+        build = mock.Mock(side_effect=lambda: Part.makeBox(1, 1, 1))
+        shape_cache.cached("test", "a", build)
+        build.assert_not_called()
+        shape_cache.cached("test", "b", build)
+        build.assert_called_once()
+        self.assertEqual(shape_cache.statistics()["test"].evictions, 1)
+
+    def test_fingerprint_stacking_lip_method(self) -> None:
+        doc = fc.newDocument()
+        self.addCleanup(fc.closeDocument, doc.Name)
+        obj = doc.addObject("Part::FeaturePython", "Bin")
+        features.BinBlank(obj)
+
+        with mock.patch.object(preferences, "stacking_lip_method", return_value="Sweep"):
+            sweep = shape_cache.fingerprint(obj)
+        with mock.patch.object(preferences, "stacking_lip_method", return_value="Offset sections"):
+            offset = shape_cache.fingerprint(obj)
+
+        self.assertNotEqual(sweep, offset)
+
+    def test_clear_memory(self) -> None:
+        shape_cache.cached("one", "box", lambda: Part.makeBox(1, 1, 1))
+        shape_cache.cached("two", "box", lambda: Part.makeBox(1, 1, 1))
+
+        shape_cache.clear_memory("one")
+
+        self.assertEqual(shape_cache.statistics()["one"].entries, 0)
+        self.assertEqual(shape_cache.statistics()["two"].entries, 1)
@@ -0,0 +1,41 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from freecad.gridfinity_workbench import stacking_lip, utils
+
+
+def _profile(points: list[tuple[float, float]]) -> Part.Wire:
+    """Make a profile on the left side of the outline from distances to the outline and heights."""
+    vectors = [fc.Vector(-20 + distance, 0, z) for distance, z in points]
+    return Part.Wire(Part.Shape(utils.loop(vectors)).Edges)
+
+
+class StackingLipTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # A 40 x 30 outline with 4 mm corner radius, centered on the origin.
+        self.outline = utils.create_rounded_rectangle(40, 30, 0, 4)
+
+    def test_offset_sections_match_sweep(self) -> None:
+        profile = _profile([(0, 0), (0, 3), (1, 3), (2, 2), (2, 0), (3, -1), (0, -1)])
+
+        swept = stacking_lip.sweep(self.outline, profile)
+        lofted = stacking_lip.offset_sections(self.outline, profile)
+
+        self.assertTrue(lofted.isValid())
+        self.assertAlmostEqual(lofted.Volume, swept.Volume, delta=swept.Volume * 1e-6)
+        self.assertTrue(lofted.BoundBox.isInside(swept.BoundBox.Center))
+
+    def test_unsupported_profile(self) -> None:
+        # A notch from below splits the profile into two parts up to a height of 2.
+        profile = _profile([(0, 0), (0, 3), (3, 3), (3, 0), (2, 0), (2, 2), (1, 2), (1, 0)])
+        with self.assertRaises(ValueError):
+            stacking_lip.offset_sections(self.outline, profile)
+
+        away = _profile([(1, 0), (1, 3), (2, 3), (2, 0)])
+        with self.assertRaises(ValueError):
+            stacking_lip.offset_sections(self.outline, away)
@@ -0,0 +1,45 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import tempfile
+import unittest
+from pathlib import Path
+
+# NumPy is provided by FreeCAD, but is not a dependency of the type check environment.
+# mypy: disable-error-code="import-not-found"
+import FreeCAD as fc  # noqa: N813
+import numpy as np
+import Part
+
+from freecad.gridfinity_workbench import stl
+
+
+class StlTest(unittest.TestCase):
+    def test_facets_from_shape(self) -> None:
+        facets = stl.facets_from_shape(Part.makeBox(1, 2, 3), 0.1, 20)
+
+        self.assertEqual(len(facets), 12)
+        np.testing.assert_allclose(np.linalg.norm(facets["normal"], axis=1), 1, rtol=1e-6)
+        np.testing.assert_allclose(facets["vertices"].max(axis=(0, 1)), [1, 2, 3])
+
+    def test_transformed(self) -> None:
+        facets = stl.facets_from_shape(Part.makeBox(1, 2, 3), 0.1, 20)
+        placement = fc.Placement(fc.Vector(10, 0, 0), fc.Rotation(fc.Vector(0, 0, 1), 90))
+
+        moved = stl.transformed(facets, placement)
+
+        np.testing.assert_allclose(moved["vertices"].min(axis=(0, 1)), [8, 0, 0], atol=1e-5)
+        np.testing.assert_allclose(moved["vertices"].max(axis=(0, 1)), [10, 1, 3], atol=1e-5)
+
+    def test_write_binary_stl(self) -> None:
+        facets = stl.facets_from_shape(Part.makeBox(1, 2, 3), 0.1, 20)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "box.stl"
+            stl.write_binary_stl(path, facets, "box")
+            data = path.read_bytes()
+
+        self.assertEqual(len(data), 84 + 50 * len(facets))
+        self.assertEqual(int.from_bytes(data[80:84], "little"), len(facets))
+        np.testing.assert_array_equal(np.frombuffer(data[84:], dtype=stl.FACET_DTYPE), facets)
+        self.assertEqual(stl.binary_stl(facets, "box"), data)
@@ -0,0 +1,113 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+from types import SimpleNamespace
+from typing import cast
+
+import FreeCAD as fc  # noqa: N813
+
+from freecad.gridfinity_workbench import validation
+
+unitmm = fc.Units.Quantity("1 mm")
+
+
+def _storage_bin(**overrides: object) -> fc.DocumentObject:
+    values = {
+        "xGridUnits": 2.0,
+        "yGridUnits": 1.0,
+        "xTotalWidth": 83.5 * unitmm,
+        "yTotalWidth": 41.5 * unitmm,
+        "BinOuterRadius": 3.75 * unitmm,
+        "WallThickness": 1.2 * unitmm,
+        "xDividers": 1,
+        "yDividers": 0,
+        "DividerThickness": 1.2 * unitmm,
+        "xDividerHeight": 0 * unitmm,
+        "yDividerHeight": 0 * unitmm,
+        "InsideFilletRadius": 1.85 * unitmm,
+        "HeightUnitValue": 7 * unitmm,
+        "LabelShelfStackingOffset": 0.4 * unitmm,
+        "UsableHeight": 35 * unitmm,
+        "Scoop": True,
+        "ScoopRadius": 21 * unitmm,
+        "MagnetHoles": True,
+        "ScrewHoles": True,
+        "MagnetHoleDiameter": 6.5 * unitmm,
+        "ScrewHoleDiameter": 3 * unitmm,
+    }
+    values.update(overrides)
+    return cast("fc.DocumentObject", SimpleNamespace(**values))
+
+
+def _props(errors: list[validation.ParameterError]) -> list[str]:
+    return [error.prop for error in errors]
+
+
+class ValidationTest(unittest.TestCase):
+    def test_valid_bin(self) -> None:
+        obj = _storage_bin()
+        self.assertEqual(validation.grid_units(obj), [])
+        self.assertEqual(validation.outer_radius(obj), [])
+        self.assertEqual(validation.wall_thickness(obj), [])
+        self.assertEqual(validation.compartments(obj), [])
+        self.assertEqual(validation.divider_heights(obj), [])
+        self.assertEqual(validation.scoop(obj), [])
+        self.assertEqual(validation.bin_bottom_holes(obj), [])
+
+    def test_grid_units(self) -> None:
+        obj = _storage_bin(xGridUnits=0.5)
+        self.assertEqual(_props(validation.grid_units(obj)), ["xGridUnits"])
+
+    def test_outer_radius(self) -> None:
+        self.assertEqual(
+            _props(validation.outer_radius(_storage_bin(BinOuterRadius=0 * unitmm))),
+            ["BinOuterRadius"],
+        )
+        self.assertEqual(
+            _props(validation.outer_radius(_storage_bin(BinOuterRadius=21 * unitmm))),
+            ["BinOuterRadius"],
+        )
+
+    def test_wall_thickness(self) -> None:
+        obj = _storage_bin(WallThickness=4 * unitmm)
+        self.assertEqual(_props(validation.wall_thickness(obj)), ["WallThickness"])
+        self.assertEqual(
+            validation.wall_thickness(
+                obj,
+                min_inside_radius=validation.MIN_STORAGE_BIN_INSIDE_RADIUS,
+            ),
+            [],
+        )
+
+    def test_compartments(self) -> None:
+        obj = _storage_bin(yDividers=40)
+        self.assertEqual(_props(validation.compartments(obj)), ["yDividers"])
+
+    def test_scoop(self) -> None:
+        obj = _storage_bin(xDividers=30)
+        self.assertEqual(_props(validation.scoop(obj)), ["ScoopRadius"])
+        self.assertEqual(validation.scoop(_storage_bin(xDividers=30, Scoop=False)), [])
+
+    def test_scoop_with_low_dividers(self) -> None:
+        # dividers lower than the minimum are raised to it before the scoop is made
+        obj = _storage_bin(xDividerHeight=5 * unitmm)
+        self.assertEqual(validation.scoop(obj), [])
+        self.assertEqual(validation.scoop(obj, eco=True), [])
+
+    def test_divider_heights(self) -> None:
+        obj = _storage_bin(xDividerHeight=-1 * unitmm)
+        self.assertEqual(_props(validation.divider_heights(obj)), ["xDividerHeight"])
+        self.assertEqual(validation.divider_heights(_storage_bin(yDividerHeight=5 * unitmm)), [])
+
+    def test_hole_diameters(self) -> None:
+        obj = _storage_bin(MagnetHoleDiameter=3 * unitmm)
+        self.assertEqual(_props(validation.bin_bottom_holes(obj)), ["MagnetHoleDiameter"])
+        self.assertEqual(validation.bin_bottom_holes(_storage_bin(ScrewHoles=False)), [])
+
+    def test_raise_on_errors(self) -> None:
+        errors = validation.grid_units(_storage_bin(xGridUnits=0, yGridUnits=0))
+        with self.assertRaises(validation.InvalidParametersError) as context:
+            validation.raise_on_errors(errors)
+        self.assertEqual(context.exception.errors, errors)
+        validation.raise_on_errors([])
@@ -0,0 +1,84 @@
+# This import needs to be first as it set some library paths to use the Freecad python API
+import freecad  # noqa: I001,F401
+
+import unittest
+from typing import Any
+from unittest import mock
+
+import FreeCAD as fc  # noqa: N813
+import Part
+
+from freecad.gridfinity_workbench import features, preferences, worker
+
+
+class WorkerTest(unittest.TestCase):
+    def test_spec_key(self) -> None:
+        spec: dict[str, Any] = {"type": "BinBase", "properties": {"xGridUnits": 2, "yGridUnits": 1}}
+        reordered = {"properties": {"yGridUnits": 1, "xGridUnits": 2}, "type": "BinBase"}
+
+        self.assertEqual(worker.spec_key(spec), worker.spec_key(reordered))
+        spec["properties"]["xGridUnits"] = 3
+        self.assertNotEqual(worker.spec_key(spec), worker.spec_key(reordered))
+
+    def test_spec_options(self) -> None:
+        doc = fc.newDocument()
+        self.addCleanup(fc.closeDocument, doc.Name)
+        obj = doc.addObject("Part::FeaturePython", "Bin")
+        features.BinBlank(obj)
+        obj.BooleanFuzzyValue = -1
+
+        with mock.patch.object(preferences, "boolean_fuzzy_value", return_value=0.01):
+            spec = worker.spec_of(obj)
+        obj.BooleanFuzzyValue = 0.02
+        override = worker.spec_of(obj)
+
+        self.assertEqual(spec["properties"]["BooleanFuzzyValue"], 0.01)
+        self.assertEqual(spec["stacking_lip_method"], preferences.stacking_lip_method())
+        self.assertNotEqual(worker.spec_key(spec), worker.spec_key(override))
+
+    def test_generate_with_spec_options(self) -> None:
+        method = preferences.stacking_lip_method()
+        spec = {
+            "type": "BinBlank",
+            "properties": {"BooleanFuzzyValue": 0.01},
+            "stacking_lip_method": "Offset sections",
+        }
+
+        with worker.generated_object(spec) as obj:
+            self.assertAlmostEqual(obj.BooleanFuzzyValue, 0.01)
+            self.assertEqual(preferences.stacking_lip_method(), "Offset sections")
+
+        self.assertEqual(preferences.stacking_lip_method(), method)
+
+    def test_build_brep(self) -> None:
+        spec = {"type": "BinBase", "properties": {"MagnetHoles": False}, "format": "BREP"}
+        with worker.generated_object(spec) as obj:
+            volume = obj.Shape.Volume
+
+        shape = Part.Shape()
+        shape.importBrepFromString(worker.build(spec).decode())
+        self.assertAlmostEqual(shape.Volume, volume)
+
+    def test_build_stl(self) -> None:
+        data = worker.build({"type": "CustomBinBase", "layout": [[True, True], [True, False]]})
+
+        facets = int.from_bytes(data[80:84], "little")
+        self.assertGreater(facets, 0)
+        self.assertEqual(len(data), 84 + 50 * facets)
+
+    def test_invalid_specs(self) -> None:
+        specs: list[dict[str, Any]] = [
+            {"type": "Teapot"},
+            {"type": "CustomBinBase"},
+            {"type": "CustomBinBase", "layout": [[1, "x"]]},
+            {"type": "CustomBinBase", "layout": [True]},
+            {"type": "BinBase", "properties": []},
+            {"type": "BinBase", "properties": {"Spout": 1}},
+            {"type": "BinBase", "properties": {"Label": "bin"}},
+            {"type": "BinBase", "properties": {"xGridUnits": 0}},
+            {"type": "BinBase", "format": "OBJ"},
+            {"type": "BinBase", "stacking_lip_method": "Extrude"},
+        ]
+        for spec in specs:
+            with self.assertRaises(worker.SpecError, msg=spec):
+                worker.build(spec)